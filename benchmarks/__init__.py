@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks of the bot hot paths. Run a module as a script, e.g.:
+
+    python -m benchmarks.api
+"""
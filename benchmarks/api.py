@@ -0,0 +1,64 @@
+"""
+Per-request overhead of Api: a new UserAgent object and a new session on every
+call (before) against the long-lived pooled session with precomputed User-Agent
+strings (after). Requests are sent to a local keep-alive HTTP server, so only
+the client-side overhead is measured.
+"""
+import threading
+import timeit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from fake_useragent import UserAgent
+
+from dosimeter.api import Api
+
+NUMBER = 200
+BODY = b"<rad>0.11</rad>"
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def get_markup_before(uri: str) -> requests.Response:
+    agent = UserAgent(
+        browsers=["chrome", "edge", "internet explorer", "firefox", "safari", "opera"]
+    )
+    with requests.session() as session:
+        return session.get(
+            uri, verify=False, headers={"User-Agent": agent.random}, timeout=(3, 7)
+        )
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    uri = "http://127.0.0.1:%d/radiation.xml" % server.server_port
+    api = Api()
+
+    try:
+        for name, func in (
+            ("before", lambda: get_markup_before(uri)),
+            ("after", lambda: api._request(uri)),
+        ):
+            func()  # warm up
+            seconds = timeit.timeit(func, number=NUMBER)
+            print("%-6s %8.3f ms/request" % (name, seconds / NUMBER * 1_000))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+User actions in the file repository: the whole JSON file read three times and
+rewritten on every action (before) against the in-memory index with the append
+to the journal, compaction included (after), and the startup replaying the
+snapshot plus the journal.
+"""
+import json
+import pathlib
+import random
+import tempfile
+import timeit
+from types import SimpleNamespace
+
+from dosimeter.constants import Action
+from dosimeter.storage import FileRepository
+from dosimeter.utils import JSONFileManager
+
+SIZES = (10_000, 100_000, 1_000_000)
+NUMBER = 10_000
+GENERATOR = random.Random(0)
+
+
+def create_snapshot(path: pathlib.Path, size: int) -> None:
+    users = [
+        {
+            "user_id": user_id,
+            "first_name": "gAAAAABk" + "x" * 92,
+            "last_name": None,
+            "user_name": "gAAAAABk" + "x" * 92,
+            "create_at": "2023-05-21 12:00:00",
+            Action.START.value: ["2023-05-21 12:00:00"],
+        }
+        for user_id in range(size)
+    ]
+    with open(path, "w") as file:
+        json.dump({"users": users}, file)
+
+
+def put_before(repo: JSONFileManager, user_id: int, action: Action) -> None:
+    data = repo.read()
+    assert user_id in {user["user_id"] for user in data["users"]}
+    data = repo.read()
+    for user in data["users"]:
+        if user["user_id"] == user_id:
+            user.setdefault(action.value, []).append("2023-05-21 12:00:00")
+            repo.write(data)
+
+
+def main() -> None:
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as temp:
+            path = pathlib.Path(temp) / "dataBase.json"
+            create_snapshot(path, size)
+            users = [
+                SimpleNamespace(id=GENERATOR.randrange(size)) for _ in range(NUMBER)
+            ]
+            print("%d users" % size)
+
+            number = max(1, 100_000 // size)
+            repo = JSONFileManager(path)
+            seconds = timeit.timeit(
+                lambda: put_before(repo, users[0].id, Action.HELP), number=number
+            )
+            print("  before   %10.3f ms/put" % (seconds / number * 1e3))
+
+            seconds = timeit.timeit(lambda: FileRepository(path), number=1)
+            print("  startup  %10.3f ms" % (seconds * 1e3))
+
+            file_repo = FileRepository(path)
+            seconds = timeit.timeit(
+                lambda: [file_repo.put(user, Action.HELP) for user in users], number=1
+            )
+            print("  after    %10.3f ms/put" % (seconds / NUMBER * 1e3))
+            file_repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Nearest point lookups through the precomputed grid across resolutions: build time,
+memory, share of the border cells that need the exact search, and the latency of
+the grid lookup and of the whole Navigator.get_near_point against the spatial
+index search without the grid.
+"""
+import timeit
+
+import numpy as np
+
+from dosimeter.navigator import Navigator, NearestGrid
+
+RESOLUTIONS = (0.1, 0.05, 0.02, 0.01, 0.005)
+NUMBER = 1_000
+LOCATIONS = np.random.default_rng(0).uniform((51.2, 23.1), (56.2, 32.8), (NUMBER, 2))
+
+
+def measure(func: object) -> float:
+    seconds = timeit.timeit(
+        lambda: [func(lat, lon) for lat, lon in LOCATIONS], number=1  # type: ignore
+    )
+    return seconds / NUMBER * 1_000
+
+
+def main() -> None:
+    for geodesic in (True, False):
+        navigator = Navigator(geodesic=geodesic, resolution=0)
+        print(
+            "no grid, geodesic=%s: %.3f ms/lookup"
+            % (
+                geodesic,
+                measure(lambda lat, lon: navigator.get_near_point(0, lat, lon)),
+            )
+        )
+
+    for resolution in RESOLUTIONS:
+        navigator = Navigator(resolution=0)
+        seconds = timeit.timeit(
+            lambda: NearestGrid(navigator.coordinates, resolution), number=1
+        )
+        grid = NearestGrid(navigator.coordinates, resolution)
+        navigator.grid = grid
+        border = (grid.cells < 0).mean() * 100
+        print(
+            "%.3f deg: %dx%d cells, %d KiB, built in %.0f ms, %.1f%% border cells"
+            % (resolution, *grid.shape, grid.nbytes >> 10, seconds * 1_000, border)
+        )
+        print("  grid lookup       %8.4f ms" % measure(grid.lookup))
+        for geodesic in (True, False):
+            navigator.geodesic = geodesic
+            print(
+                "  geodesic=%-5s    %8.4f ms"
+                % (
+                    geodesic,
+                    measure(lambda la, lo: navigator.get_near_point(0, la, lo)),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
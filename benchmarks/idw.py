@@ -0,0 +1,54 @@
+"""
+Dose rate estimate at the user's location: the exact IDW computation from all
+the stations on every request (before) against the field interpolated once per
+snapshot and the bilinear lookup (after), with the error of the lookup.
+"""
+import timeit
+
+import numpy as np
+
+from dosimeter.constants import Point
+from dosimeter.navigator import DoseField
+
+RESOLUTIONS = (0.1, 0.05, 0.02)
+NUMBER = 1_000
+GENERATOR = np.random.default_rng(0)
+LOCATIONS = GENERATOR.uniform((51.2, 23.1), (56.2, 32.8), (NUMBER, 2))
+COORDINATES = [point.coordinates for point in Point]
+VALUES = GENERATOR.uniform(0.05, 0.5, len(COORDINATES))
+
+
+def main() -> None:
+    for resolution in RESOLUTIONS:
+        seconds = timeit.timeit(
+            lambda: DoseField(COORDINATES, VALUES, resolution), number=1  # noqa: B023
+        )
+        field = DoseField(COORDINATES, VALUES, resolution)
+        print(
+            "%.2f deg: %dx%d nodes, %d KiB, built in %.0f ms"
+            % (resolution, *field.nodes.shape, field.nodes.nbytes >> 10, seconds * 1e3)
+        )
+
+        for name, func in (
+            ("before", field.estimate_exact),
+            ("after", field.estimate),
+        ):
+            seconds = timeit.timeit(
+                lambda: [func(lat, lon) for lat, lon in LOCATIONS], number=1  # noqa
+            )
+            print("  %-6s %8.4f ms/estimate" % (name, seconds / NUMBER * 1_000))
+
+        estimates = [
+            (field.estimate(lat, lon), field.estimate_exact(lat, lon))
+            for lat, lon in LOCATIONS
+        ]
+        errors = np.array(
+            [abs(lookup - exact) for lookup, exact in estimates if lookup is not None]
+        )
+        print(
+            "  lookup error: mean %.4f, max %.4f uSv/h" % (errors.mean(), errors.max())
+        )
+
+
+if __name__ == "__main__":
+    main()
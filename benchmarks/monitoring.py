@@ -0,0 +1,39 @@
+"""
+Extraction of the "По состоянию" status line from the monitoring page: a full
+BeautifulSoup tree searched with a predicate (before) against the chunked lxml
+pull parser that stops at the first matching element (after).
+"""
+import timeit
+
+from bs4 import BeautifulSoup, Tag
+
+from dosimeter.config import config
+from dosimeter.parser import Parser
+
+SOURCE = config.app.tests_dir / "fixtures" / "rad.html"
+NUMBER = 50
+
+
+def extract_before(markup: str) -> str:
+    soup = BeautifulSoup(markup, features="lxml")
+
+    def has_substring(span: Tag) -> bool:
+        return span.text.startswith("По состоянию")
+
+    return soup.find_all(has_substring)[0].text.replace("\xa0", " ").replace("  ", " ")
+
+
+def main() -> None:
+    markup = SOURCE.read_text()
+    assert extract_before(markup) == Parser._extract_status(markup)
+
+    for name, func in (
+        ("before", lambda: extract_before(markup)),
+        ("after", lambda: Parser._extract_status(markup)),
+    ):
+        seconds = timeit.timeit(func, number=NUMBER)
+        print("%-6s %8.3f ms/page" % (name, seconds / NUMBER * 1_000))
+
+
+if __name__ == "__main__":
+    main()
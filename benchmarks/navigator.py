@@ -0,0 +1,66 @@
+"""
+Nearest monitoring point search: the geodesic solver called for every point
+(before) against the vectorized haversine search with the geodesic refinement of
+the candidates and the haversine-only mode (after). The accuracy of the haversine
+distance is compared with geopy for every point from random locations in Belarus.
+"""
+import timeit
+
+import numpy as np
+from geopy import distance
+
+from dosimeter.constants import Point
+from dosimeter.navigator import Navigator, NearPoint
+
+NUMBER = 200
+LOCATIONS = np.random.default_rng(0).uniform((51.2, 23.1), (56.2, 32.8), (NUMBER, 2))
+
+
+def get_near_point_before(latitude: float, longitude: float) -> NearPoint:
+    return NearPoint(
+        *min(
+            (
+                round(distance.distance((latitude, longitude), point.coordinates).m, 3),
+                point.label,
+            )
+            for point in Point
+        )
+    )
+
+
+def main() -> None:
+    exact, haversine = Navigator(), Navigator(geodesic=False)
+
+    for name, func in (
+        ("before", get_near_point_before),
+        ("geodesic", lambda lat, lon: exact.get_near_point(0, lat, lon)),
+        ("haversine", lambda lat, lon: haversine.get_near_point(0, lat, lon)),
+    ):
+        seconds = timeit.timeit(
+            lambda: [func(lat, lon) for lat, lon in LOCATIONS], number=1  # noqa: B023
+        )
+        print("%-9s %8.3f ms/lookup" % (name, seconds / NUMBER * 1_000))
+
+    errors, same_point, same_result = [], 0, 0
+    for latitude, longitude in LOCATIONS:
+        geodesic = np.array(
+            [distance.distance((latitude, longitude), c).m for c in exact.coordinates]
+        )
+        errors.append(np.abs(exact.get_distances(latitude, longitude) / geodesic - 1))
+        expected = get_near_point_before(latitude, longitude)
+        same_point += haversine.get_near_point(0, latitude, longitude).title == (
+            expected.title
+        )
+        same_result += exact.get_near_point(0, latitude, longitude) == expected
+
+    errors = np.concatenate(errors)
+    print(
+        "haversine vs geodesic over %d distances: mean %.3f%%, max %.3f%%"
+        % (errors.size, errors.mean() * 100, errors.max() * 100)
+    )
+    print("haversine nearest point matches geopy: %d/%d" % (same_point, NUMBER))
+    print("geodesic mode result matches geopy:    %d/%d" % (same_result, NUMBER))
+
+
+if __name__ == "__main__":
+    main()
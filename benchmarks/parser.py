@@ -0,0 +1,55 @@
+"""
+Parsing of radiation.xml: BeautifulSoup with two find_all passes zipped by position
+(before) against the single streaming lxml.etree.iterparse pass (after). The real
+feed from the test fixtures is measured as is and enlarged by repeating its items.
+"""
+import re
+import timeit
+
+from bs4 import BeautifulSoup
+
+from dosimeter.config import config
+from dosimeter.parser import Parser
+
+SOURCE = config.app.tests_dir / "fixtures" / "rad.xml"
+FACTORS = (1, 10, 100)
+NUMBER = 20
+
+
+def parse_before(markup: str) -> list[tuple[str, float]]:
+    soup = BeautifulSoup(markup, features="lxml-xml")
+    points = [
+        point.text
+        for point in soup.find_all("title")
+        if point.text != "Радиационный контроль и мониторинг"
+    ]
+    values = [float(value.text) for value in soup.find_all("rad")]
+    return list(zip(points, values))
+
+
+def enlarge(markup: str, factor: int) -> str:
+    items = "".join(re.findall(r"<item>.*?</item>", markup, flags=re.DOTALL))
+    return markup.replace("</channel>", items * (factor - 1) + "</channel>", 1)
+
+
+def main() -> None:
+    feed = SOURCE.read_text()
+
+    for factor in FACTORS:
+        markup = enlarge(feed, factor)
+        assert parse_before(markup) == Parser._parse_feed(markup)[0]
+        print(
+            "x%-4d %d items, %d KiB"
+            % (factor, markup.count("<item>"), len(markup) >> 10)
+        )
+
+        for name, func in (
+            ("before", lambda: parse_before(markup)),
+            ("after", lambda: Parser._parse_feed(markup)),
+        ):
+            seconds = timeit.timeit(func, number=NUMBER)
+            print("  %-6s %10.3f ms/parse" % (name, seconds / NUMBER * 1_000))
+
+
+if __name__ == "__main__":
+    main()
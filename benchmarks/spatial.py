@@ -0,0 +1,61 @@
+"""
+Queries over growing station catalogs: a vectorized brute-force haversine pass over
+all the stations (before) against the unit-sphere k-d tree (after), for the three
+nearest stations and for all the stations within 50 km.
+"""
+import timeit
+
+import numpy as np
+
+from dosimeter.navigator import SpatialIndex
+from dosimeter.navigator.spatial import EARTH_RADIUS
+
+SIZES = (47, 1_000, 10_000, 100_000)
+NUMBER = 200
+RADIUS = 50_000
+GENERATOR = np.random.default_rng(0)
+LOCATIONS = GENERATOR.uniform((51.2, 23.1), (56.2, 32.8), (NUMBER, 2))
+
+
+def haversine(radians: np.ndarray, latitude: float, longitude: float) -> np.ndarray:
+    latitude, longitude = np.radians(latitude), np.radians(longitude)
+    a = (
+        np.sin((radians[:, 0] - latitude) / 2) ** 2
+        + np.cos(latitude)
+        * np.cos(radians[:, 0])
+        * np.sin((radians[:, 1] - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+
+def main() -> None:
+    for size in SIZES:
+        coordinates = GENERATOR.uniform((45.0, 15.0), (60.0, 40.0), (size, 2))
+        labels = [str(i) for i in range(size)]
+        radians = np.radians(coordinates)
+
+        seconds = timeit.timeit(lambda: SpatialIndex(labels, coordinates), number=1)
+        index = SpatialIndex(labels, coordinates)
+        print("%d stations, index built in %.1f ms" % (size, seconds * 1_000))
+
+        for name, func in (
+            (
+                "3-nn before",
+                lambda lat, lon: np.argsort(haversine(radians, lat, lon))[:3],
+            ),
+            ("3-nn after", lambda lat, lon: index.nearest(lat, lon, k=3)),
+            (
+                "50 km before",
+                lambda lat, lon: np.flatnonzero(haversine(radians, lat, lon) <= RADIUS),
+            ),
+            ("50 km after", lambda lat, lon: index.within(lat, lon, RADIUS)),
+        ):
+            seconds = timeit.timeit(
+                lambda: [func(lat, lon) for lat, lon in LOCATIONS],  # noqa: B023
+                number=1,
+            )
+            print("  %-12s %8.3f ms/query" % (name, seconds / NUMBER * 1_000))
+
+
+if __name__ == "__main__":
+    main()
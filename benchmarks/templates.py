@@ -0,0 +1,64 @@
+"""
+Message templates: the startup of the engine compiling all the templates (cold)
+against loading their bytecode from the cache directory (warm), and the render
+throughput of the START, TABLE and LOCATION templates looked up in the Jinja2
+environment on every render (before) against the templates compiled at startup
+(after).
+"""
+import pathlib
+import tempfile
+import timeit
+from types import SimpleNamespace
+
+from dosimeter.constants import Button, Point
+from dosimeter.template_engine import Template, TemplateEngine
+
+NUMBER = 10_000
+CONTEXTS = {
+    Template.START: {
+        "user": SimpleNamespace(first_name="Иван"),
+        "button": Button,
+    },
+    Template.TABLE: {
+        "date": "21 мая 2023 г.",
+        "values_by_region": [
+            (point.label.ljust(20, "."), "0.11") for point in list(Point)[:10]
+        ],
+        "mean_value": 0.11,
+    },
+    Template.LOCATION: {
+        "distance": "12 345 м",
+        "point": Point.MINSK.label,
+        "date": "21 мая 2023 г.",
+        "value": 0.11,
+        "estimate": 0.12,
+    },
+}
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for name in ("cold", "warm"):
+            seconds = timeit.timeit(
+                lambda: TemplateEngine(cache_dir=pathlib.Path(cache_dir)), number=1
+            )
+            print("startup %-4s %8.2f ms" % (name, seconds * 1e3))
+
+        engine = TemplateEngine(cache_dir=pathlib.Path(cache_dir))
+        for template, context in CONTEXTS.items():
+            print(template.name)
+            for name, func in (
+                ("before", lambda: engine.env.get_template(template.name)),  # noqa
+                ("after", lambda: engine.compiled[template.name]),  # noqa
+            ):
+                seconds = timeit.timeit(
+                    lambda: func().render(**context), number=NUMBER  # noqa
+                )
+                print(
+                    "  %-6s %8.2f us/render, %8.0f renders/s"
+                    % (name, seconds / NUMBER * 1e6, NUMBER / seconds)
+                )
+
+
+if __name__ == "__main__":
+    main()
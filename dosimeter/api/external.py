@@ -1,20 +1,40 @@
+import hashlib
+import random
+from dataclasses import dataclass
 from http import HTTPStatus
 from urllib.parse import urlparse
 
 import requests
 import urllib3
 from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
 
 from dosimeter.api.interface import BaseApi
 from dosimeter.config.logging import get_logger
 from dosimeter.constants import URL
-from dosimeter.utils import timed_lru_cache
+from dosimeter.utils import SingleFlight, ttl_cache
 
 urllib3.disable_warnings()
 
 logger = get_logger(__name__)
 
 EXPIRATION_TIME_TO_SEC = 3_600  # 1 hour
+NEGATIVE_EXPIRATION_TIME_TO_SEC = 60  # 1 minute
+POOL_SIZE = 4
+USER_AGENTS_COUNT = 50
+
+
+@dataclass(frozen=True)
+class Resource:
+    """
+    Class representing the last received markup of the web resource together
+    with its validators for conditional requests.
+    """
+
+    text: str
+    digest: str
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 class Api(BaseApi):
@@ -28,61 +48,120 @@ class Api(BaseApi):
 
     def __init__(self, url: str | None = None) -> None:
         """
-        Instantiate a Api object.
+        Instantiate a Api object. The concurrent requests are collapsed per
+        instance, as the response depends on the validators it keeps.
         """
         self.url = url
+        self._resources: dict[str, Resource] = {}
+        self._flight = SingleFlight()
+        self.user_agents = self._load_user_agents()
+        self.session = requests.Session()
+        self.session.verify = False
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
-    @timed_lru_cache(EXPIRATION_TIME_TO_SEC)
+    @ttl_cache(EXPIRATION_TIME_TO_SEC, NEGATIVE_EXPIRATION_TIME_TO_SEC)
     def get_xml(self, uri: str | None = None) -> str | None:
         """
         A Method for getting XML markup of the web resource.
         """
-        if not uri:
-            response = self._get_markup(self._xml.geturl())
-            return response.text if response else None
-        response = self._get_markup(uri)
-        return response.text if response else None
+        return self._get_text(uri or self._xml.geturl())
 
-    @timed_lru_cache(EXPIRATION_TIME_TO_SEC)
+    @ttl_cache(EXPIRATION_TIME_TO_SEC, NEGATIVE_EXPIRATION_TIME_TO_SEC)
     def get_html(self, uri: str | None = None) -> str | None:
         """
         A Method for getting HTML markup of the web resource.
         """
-        if not uri:
-            response = self._get_markup(self._html.geturl())
-            return response.text if response else None
+        return self._get_text(uri or self._html.geturl())
+
+    def invalidate(self) -> None:
+        """
+        A Method that drops the cached XML & HTML markup of the web resource, so
+        the next call sends the conditional request instead of waiting for
+        the cache expiration.
+        """
+        self.get_xml.invalidate(self)  # type: ignore[attr-defined]
+        self.get_html.invalidate(self)  # type: ignore[attr-defined]
+
+    def _get_text(self, uri: str) -> str | None:
+        """
+        A Method for getting markup of the web resource. If the resource has not been
+        modified (304 reply or the same content hash), the previously received
+        string object is returned, so callers can skip re-parsing it.
+        """
         response = self._get_markup(uri)
-        return response.text if response else None
+        if not response:
+            return None
+
+        resource = self._resources.get(uri)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            logger.debug("Resource %s not modified" % uri)
+            return resource.text if resource else None
+
+        digest = hashlib.sha1(response.content).hexdigest()
+        text = (
+            resource.text if resource and resource.digest == digest else response.text
+        )
+        self._resources[uri] = Resource(
+            text=text,
+            digest=digest,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return text
 
     def _get_markup(self, uri: str) -> requests.Response | None:
         """
         A Method for getting response on GET request to the web resource.
+        Concurrent callers requesting the same URL wait for a single request
+        in flight and share its response.
         """
-        agent = UserAgent(
-            browsers=[
-                "chrome",
-                "edge",
-                "internet explorer",
-                "firefox",
-                "safari",
-                "opera",
-            ]
-        )
+        return self._flight.do(uri, lambda: self._request(uri))
+
+    def _request(self, uri: str) -> requests.Response | None:
+        """
+        A Method that sends GET request to the web resource.
+        """
+        headers = {"User-Agent": random.choice(self.user_agents)}
+        if resource := self._resources.get(uri):
+            if resource.etag:
+                headers["If-None-Match"] = resource.etag
+            if resource.last_modified:
+                headers["If-Modified-Since"] = resource.last_modified
+
         try:
-            with requests.session() as session:
-                response = session.get(
-                    uri,
-                    verify=False,
-                    headers={"User-Agent": agent.random},
-                    timeout=(3, 7),
-                )
+            response = self.session.get(uri, headers=headers, timeout=(3, 7))
         except requests.exceptions.RequestException as ex:
             logger.exception(
                 "Unable to connect to the URL: %s. Raised exception: %s" % (uri, ex)
             )
             response = None
 
-        if response and response.status_code not in (HTTPStatus.OK, HTTPStatus.CREATED):
+        if response and response.status_code not in (
+            HTTPStatus.OK,
+            HTTPStatus.CREATED,
+            HTTPStatus.NOT_MODIFIED,
+        ):
             return None
 
         return response
+
+    @staticmethod
+    def _load_user_agents(count: int = USER_AGENTS_COUNT) -> tuple[str, ...]:
+        """
+        A Method that loads the pool of User-Agent strings rotated between requests.
+        """
+        agent = UserAgent(
+            browsers=[
+                "chrome",
+                "edge",
+                "internet explorer",
+                "firefox",
+                "safari",
+                "opera",
+            ]
+        )
+        return tuple({agent.random for _ in range(count)})
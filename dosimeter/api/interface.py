@@ -22,6 +22,13 @@ class BaseApi(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def invalidate(self) -> None:
+        """
+        A Method that drops the cached markup of the web resource.
+        """
+        pass
+
     @abc.abstractmethod
     def _get_markup(self, uri: str) -> requests.Response | None:
         """
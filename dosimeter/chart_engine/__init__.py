@@ -1,3 +1,18 @@
-from dosimeter.chart_engine.chart import ChartEngine
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dosimeter.chart_engine.chart import ChartEngine
 
 __all__ = ("ChartEngine",)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    The ChartEngine class is imported on first access, so the worker processes
+    importing the renderer don't import the settings and the rest of the bot.
+    """
+    if name == "ChartEngine":
+        from dosimeter.chart_engine.chart import ChartEngine
+
+        return ChartEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,58 +1,203 @@
+import multiprocessing
 import os
 import pathlib
+import threading
+from concurrent import futures
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import ClassVar
 
-import matplotlib
-import matplotlib.pyplot as plt
+from dosimeter.chart_engine.renderer import draw_bar_chart
+from dosimeter.config.logging import get_logger
+from dosimeter.constants import Region
+from dosimeter.parser.parser import RadiationSnapshot, RegionInfoDTO
+from dosimeter.utils import TTLCache
 
-from dosimeter.config import config
-from dosimeter.parser.parser import RegionInfoDTO
+logger = get_logger(__name__)
 
-matplotlib.use("agg")
+STYLE = "default"
+# Six regions rendered for the current and the previous snapshot in two styles.
+CHART_CACHE_SIZE = 24
+CHART_CACHE_TTL_SEC = 86_400
+CHART_WORKERS = 2
+CHART_QUEUE_SIZE = 8
+CHART_TIMEOUT_SEC = 10
 
 
 class ChartEngine(object):
     """
-    A class designed to _create png files with a chart.
+    A class designed to render png images with a chart.
     """
 
     file_name = "bar-chart.png"
+    _pool: ClassVar[ProcessPoolExecutor | None] = None
+    _pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    _slots: ClassVar[threading.BoundedSemaphore] = threading.BoundedSemaphore(
+        CHART_QUEUE_SIZE
+    )
 
-    def __init__(self, dir_path: pathlib.Path = config.app.chart_dir) -> None:
+    def __init__(
+        self,
+        dir_path: pathlib.Path | None = None,
+        cache_size: int = CHART_CACHE_SIZE,
+    ) -> None:
         """
-        Instantiate a ChartEngine instance.
+        Instantiate a ChartEngine instance. The charts are rendered in memory, and
+        if the directory is given, they are also written there for debugging.
         """
         self.dir_path = dir_path
-        if pathlib.Path(self.dir_path).exists():
+        self.cache: TTLCache[bytes] = TTLCache(
+            CHART_CACHE_TTL_SEC, maxsize=cache_size, stale_while_revalidate=False
+        )
+        self._file_ids: dict[tuple[Region, str, str], str] = {}
+        self._file_ids_lock = threading.Lock()
+        if self.dir_path is None or pathlib.Path(self.dir_path).exists():
             return
         self.dir_path.mkdir(exist_ok=True)
 
-    def create(self, data: RegionInfoDTO) -> None:
+    def render(self, data: RegionInfoDTO, style: str = STYLE) -> bytes:
         """
-        A method for rendering a chart and writing it to a file.
+        A method for getting the png image with a chart. The images are cached by
+        region, snapshot version and style, the data without a version is rendered
+        every time.
         """
-        title = data.region
-        names = data.info.keys()
-        values = data.info.values()
+        if data.version is None:
+            return self.create(data, style)
+        return self.cache.get(  # type: ignore[return-value]
+            (data.region, data.version, style), lambda: self.create(data, style)
+        )
 
-        plt.style.use("default")
-        plt.bar(names, values)
-        plt.xlabel("Пункты наблюдения", fontdict={"size": 14})
-        plt.ylabel("Мощность дозы (мкз/ч)", fontdict={"size": 14})
-        plt.title(title, fontdict={"size": 20})
-        plt.xticks(rotation=90)
+    def get_file_id(self, data: RegionInfoDTO, style: str = STYLE) -> str | None:
+        """
+        A method for getting the Telegram file_id of the chart that has already been
+        uploaded for the region and the snapshot version.
+        """
+        if data.version is None:
+            return None
+        with self._file_ids_lock:
+            return self._file_ids.get((data.region, data.version, style))
+
+    def set_file_id(
+        self, data: RegionInfoDTO, file_id: str | None, style: str = STYLE
+    ) -> None:
+        """
+        A method for remembering the Telegram file_id of the uploaded chart. If
+        the file_id is None, the remembered one is forgotten.
+        """
+        if data.version is None:
+            return
+        with self._file_ids_lock:
+            if file_id:
+                self._file_ids[(data.region, data.version, style)] = file_id
+            else:
+                self._file_ids.pop((data.region, data.version, style), None)
+
+    def prerender(self, snapshot: RadiationSnapshot, style: str = STYLE) -> None:
+        """
+        A method for rendering the charts of all the regions of the snapshot
+        into the cache in advance. The file_ids of the charts of the previous
+        snapshots are forgotten.
+        """
+        with self._file_ids_lock:
+            self._file_ids = {
+                key: file_id
+                for key, file_id in self._file_ids.items()
+                if key[1] == snapshot.version
+            }
+
+        for region in Region:
+            try:
+                self.render(snapshot.get_region_info(region), style)
+            except Exception as ex:
+                logger.exception(
+                    "Unable to pre-render the chart of %s. Raised exception: %s"
+                    % (region, ex)
+                )
+
+        info = self.cache.info()
+        logger.debug(
+            "Chart cache: %d charts, hit rate %.2f, %d evictions"
+            % (info.size, info.hit_rate, info.evictions)
+        )
+
+    def create(self, data: RegionInfoDTO, style: str = STYLE) -> bytes:
+        """
+        A method for rendering a chart into the png image. The chart is drawn in
+        the process pool, at most CHART_QUEUE_SIZE charts are queued or drawn at
+        once, and the caller waits no longer than CHART_TIMEOUT_SEC seconds.
+        If a worker has died, the pool is restarted and the chart is drawn again.
+        """
+        pool = self._get_pool()
+        try:
+            image = self._draw(pool, data, style)
+        except BrokenProcessPool as ex:
+            logger.warning(
+                "The process pool of the charts is broken and restarted. "
+                "Raised exception: %s" % ex
+            )
+            self._reset_pool(pool)
+            image = self._draw(self._get_pool(), data, style)
+
+        if self.dir_path is not None:
+            (self.dir_path / self.file_name).write_bytes(image)
+        return image
+
+    def _draw(
+        self, pool: ProcessPoolExecutor, data: RegionInfoDTO, style: str
+    ) -> bytes:
+        """
+        Private method that draws the chart in the pool within the queue limit.
+        """
+        if not self._slots.acquire(timeout=CHART_TIMEOUT_SEC):
+            raise TimeoutError("The queue of the charts to render is full.")
 
-        for keys, vals in data.info.items():
-            container = plt.bar(keys, vals)
-            plt.bar_label(container, label_type="edge", padding=3.0)
+        try:
+            future = pool.submit(
+                draw_bar_chart, str(data.region), dict(data.info), style
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
 
-        plt.ylim(0, 1.0)
-        plt.grid(True, axis="y")
-        plt.savefig(self.dir_path / self.file_name, bbox_inches="tight")
-        plt.close()
+        try:
+            return future.result(timeout=CHART_TIMEOUT_SEC)
+        except futures.TimeoutError:
+            future.cancel()
+            raise
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        """
+        Private method that lazily starts the process pool shared by all
+        the instances. The workers are spawned rather than forked, as the bot
+        process runs many threads.
+        """
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ProcessPoolExecutor(
+                    max_workers=CHART_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return cls._pool
+
+    @classmethod
+    def _reset_pool(cls, pool: ProcessPoolExecutor) -> None:
+        """
+        Private method that shuts the broken pool down, so the next chart starts
+        a new one. The pool already replaced by another thread is kept.
+        """
+        with cls._pool_lock:
+            if cls._pool is pool:
+                cls._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
 
     def delete(self) -> None:
         """
         Method for deleting a png file with a chart.
         """
-        if pathlib.Path(self.dir_path / self.file_name).exists():
+        if (
+            self.dir_path is not None
+            and pathlib.Path(self.dir_path / self.file_name).exists()
+        ):
             os.remove(self.dir_path / self.file_name)
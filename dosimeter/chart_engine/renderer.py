@@ -0,0 +1,31 @@
+from io import BytesIO
+
+from matplotlib import style as mpl_style
+from matplotlib.figure import Figure
+
+
+def draw_bar_chart(title: str, info: dict[str, float], style: str) -> bytes:
+    """
+    The function draws the bar chart of the doses at the monitoring points into
+    the png image. It uses its own Figure and Axes objects instead of the pyplot
+    global state, and runs in the worker processes of the ChartEngine.
+    """
+    with mpl_style.context(style):
+        figure = Figure()
+        axes = figure.subplots()
+        container = axes.bar(
+            list(info.keys()),
+            list(info.values()),
+            color=[f"C{index + 1}" for index in range(len(info))],
+        )
+        axes.bar_label(container, label_type="edge", padding=3.0)
+        axes.set_xlabel("Пункты наблюдения", fontdict={"size": 14})
+        axes.set_ylabel("Мощность дозы (мкз/ч)", fontdict={"size": 14})
+        axes.set_title(title, fontdict={"size": 20})
+        axes.tick_params(axis="x", labelrotation=90)
+        axes.set_ylim(0, 1.0)
+        axes.grid(True, axis="y")
+
+        with BytesIO() as buffer:
+            figure.savefig(buffer, format="png", bbox_inches="tight")
+            return buffer.getvalue()
@@ -5,9 +5,10 @@ from urllib.parse import ParseResult, urlparse
 
 import pytz
 import sentry_sdk
-from mtranslate import translate
 from pydantic import BaseModel, BaseSettings, Field
 
+from dosimeter.config.localization import format_date
+
 BASE_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parent.parent.parent
 ENV_FILE = ".env"
 UTF = "utf-8"
@@ -52,6 +53,8 @@ class CloudDataBaseSettings(BaseSettings):
     password: str = Field(..., env="MONGO_PASSWORD")
     name: str = Field(..., env="MONGO_NAME")
     timeout: int = Field(default=5_000)
+    bulk_size: int = Field(default=0)
+    bulk_interval: int = Field(default=500)
 
     class Config:
         env_file = ENV_FILE
@@ -70,6 +73,8 @@ class CloudDataBaseSettings(BaseSettings):
 class FileDataBaseSettings(BaseSettings):
     stem: str = Field(default="dataBase")
     suffix: str = Field(default=".json")
+    journal_suffix: str = Field(default=".ndjson")
+    compact_every: int = Field(default=10_000)
     encoding: str = Field(default=UTF)
 
     @property
@@ -81,6 +86,26 @@ class FileDataBaseSettings(BaseSettings):
         return BASE_DIR / "dosimeter" / "storage" / self.name
 
 
+# SQLite Database (Repository)
+class SQLiteDataBaseSettings(BaseSettings):
+    stem: str = Field(default="dataBase")
+    suffix: str = Field(default=".sqlite3")
+    timeout: float = Field(default=5.0)
+
+    class Config:
+        env_file = ENV_FILE
+        env_prefix = "SQLITE_"
+        env_file_encoding = UTF
+
+    @property
+    def name(self) -> str:
+        return self.stem + self.suffix
+
+    @property
+    def path(self) -> pathlib.Path:
+        return BASE_DIR / "dosimeter" / "storage" / self.name
+
+
 # Measurement Protocol API (Google Analytics 4)
 class AnalyticsSettings(BaseSettings):
     measurement_id: str = Field(..., env="GOOGLE_MEASUREMENT_ID")
@@ -108,6 +133,8 @@ class AppSettings(BaseSettings):
     admin_tgm_id: int = Field(..., env="ADMIN_TGM_ID")
     locale: str = Field(default="ru")
     timezone: str = Field(default="Europe/Minsk")
+    refresh_interval: int = Field(default=600)
+    grid_resolution: float = Field(default=0.02)
     debug: bool = Field(default=True)
 
     class Config:
@@ -122,18 +149,27 @@ class AppSettings(BaseSettings):
     def templates_dir(self) -> pathlib.Path:
         return self.dir / "templates"
 
+    @property
+    def templates_cache_dir(self) -> pathlib.Path:
+        return self.dir / "template_engine" / "cache"
+
     @property
     def chart_dir(self) -> pathlib.Path:
         return self.dir / "chart_engine" / "charts"
 
+    @property
+    def grid_cache_dir(self) -> pathlib.Path:
+        return self.dir / "navigator" / "grids"
+
     @property
     def tests_dir(self) -> pathlib.Path:
         return BASE_DIR / "tests"
 
     @property
     def today(self) -> str:
-        date = datetime.now(pytz.timezone(self.timezone)).strftime("%d-%b-%Y")
-        return translate(date, self.locale)
+        return format_date(
+            datetime.now(pytz.timezone(self.timezone)).date(), self.locale
+        )
 
     @property
     def date_format(self) -> str:
@@ -153,6 +189,7 @@ class Settings(BaseModel):
     enc: EncryptionSettings = Field(default_factory=EncryptionSettings)
     db: CloudDataBaseSettings = Field(default_factory=CloudDataBaseSettings)
     repo: FileDataBaseSettings = Field(default_factory=FileDataBaseSettings)
+    sqlite: SQLiteDataBaseSettings = Field(default_factory=SQLiteDataBaseSettings)
     analytics: AnalyticsSettings = Field(default_factory=AnalyticsSettings)
     heroku: HerokuCloudSettings = Field(default_factory=HerokuCloudSettings)
 
@@ -0,0 +1,96 @@
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class DateLocale(NamedTuple):
+    """
+    Month names in the genitive case and the date pattern of the locale.
+    """
+
+    months: tuple[str, ...]
+    pattern: str
+
+
+LOCALES: dict[str, DateLocale] = {
+    "ru": DateLocale(
+        months=(
+            "января",
+            "февраля",
+            "марта",
+            "апреля",
+            "мая",
+            "июня",
+            "июля",
+            "августа",
+            "сентября",
+            "октября",
+            "ноября",
+            "декабря",
+        ),
+        pattern="{day} {month} {year} г.",
+    ),
+    "be": DateLocale(
+        months=(
+            "студзеня",
+            "лютага",
+            "сакавіка",
+            "красавіка",
+            "мая",
+            "чэрвеня",
+            "ліпеня",
+            "жніўня",
+            "верасня",
+            "кастрычніка",
+            "лістапада",
+            "снежня",
+        ),
+        pattern="{day} {month} {year} г.",
+    ),
+    "uk": DateLocale(
+        months=(
+            "січня",
+            "лютого",
+            "березня",
+            "квітня",
+            "травня",
+            "червня",
+            "липня",
+            "серпня",
+            "вересня",
+            "жовтня",
+            "листопада",
+            "грудня",
+        ),
+        pattern="{day} {month} {year} р.",
+    ),
+    "en": DateLocale(
+        months=(
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ),
+        pattern="{month} {day}, {year}",
+    ),
+}
+DEFAULT_LOCALE = "en"
+
+
+@lru_cache(maxsize=32)
+def format_date(value: date, locale: str) -> str:
+    """
+    The function formats the date with the bundled month names of the locale,
+    falling back to English for the unsupported ones. The results are cached,
+    so formatting the same calendar day again costs a dictionary lookup.
+    """
+    months, pattern = LOCALES.get(locale, LOCALES[DEFAULT_LOCALE])
+    return pattern.format(day=value.day, month=months[value.month - 1], year=value.year)
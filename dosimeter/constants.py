@@ -1,7 +1,8 @@
 import enum
 import uuid
 from dataclasses import dataclass
-from typing import TypeAlias, TypedDict
+from types import MappingProxyType
+from typing import Mapping, TypeAlias, TypedDict
 from urllib.parse import ParseResult, urlparse
 
 from emoji.core import emojize
@@ -10,7 +11,9 @@ from dosimeter.config import config
 
 __all__ = (
     "ADMIN_ID",
+    "LABELS_BY_REGION",
     "LIST_OF_ADMIN_IDS",
+    "POINTS_BY_LABEL",
     "TEMP_LIST_OF_ADMIN_IDS",
     "URL",
     "Action",
@@ -82,330 +85,330 @@ class PointSchema(TypedDict):
 class Point(enum.Enum):
     MOGILEV = PointSchema(
         label="Могилев",
-        latitude=30.375068475712993,
-        longitude=53.69298772769127,
+        latitude=53.69298772769127,
+        longitude=30.375068475712993,
         region=Region.MOGILEV,
     )
 
     MSTISLAVL = PointSchema(
         label="Мстиславль",
-        latitude=31.742790754635983,
-        longitude=54.025123497951235,
+        latitude=54.025123497951235,
+        longitude=31.742790754635983,
         region=Region.MOGILEV,
     )
 
     POLOTSK = PointSchema(
         label="Полоцк",
-        latitude=28.751296645976183,
-        longitude=55.47475184602021,
+        latitude=55.47475184602021,
+        longitude=28.751296645976183,
         region=Region.VITEBSK,
     )
 
     SHARKOVSHCHINA = PointSchema(
         label="Шарковщина",
-        latitude=27.456996363944278,
-        longitude=55.36281482842422,
+        latitude=55.36281482842422,
+        longitude=27.456996363944278,
         region=Region.VITEBSK,
     )
 
     MINSK = PointSchema(
         label="Минск",
-        latitude=27.63548838979854,
-        longitude=53.92751824354786,
+        latitude=53.92751824354786,
+        longitude=27.63548838979854,
         region=Region.MINSK,
     )
 
     LYNTUPY = PointSchema(
         label="Лынтупы",
-        latitude=26.306634538263953,
-        longitude=55.04878637860638,
+        latitude=55.04878637860638,
+        longitude=26.306634538263953,
         region=Region.VITEBSK,
     )
 
     VISOKOE = PointSchema(
         label="Высокое",
-        latitude=23.38374438625246,
-        longitude=52.366928433095,
+        latitude=52.366928433095,
+        longitude=23.38374438625246,
         region=Region.BREST,
     )
 
     PRUZHANY = PointSchema(
         label="Пружаны",
-        latitude=24.48545241420398,
-        longitude=52.567268449727045,
+        latitude=52.567268449727045,
+        longitude=24.48545241420398,
         region=Region.BREST,
     )
 
     SLUTSK = PointSchema(
         label="Слуцк",
-        latitude=27.552283199561725,
-        longitude=53.05284098247522,
+        latitude=53.05284098247522,
+        longitude=27.552283199561725,
         region=Region.MINSK,
     )
 
     BRAGIN = PointSchema(
         label="Брагин",
-        latitude=30.246689891878724,
-        longitude=51.7969974359342,
+        latitude=51.7969974359342,
+        longitude=30.246689891878724,
         region=Region.GOMEL,
     )
 
     ORSHA = PointSchema(
         label="Орша",
-        latitude=30.443815788156527,
-        longitude=54.503170699795774,
+        latitude=54.503170699795774,
+        longitude=30.443815788156527,
         region=Region.VITEBSK,
     )
 
     MOZYR = PointSchema(
         label="Мозырь",
-        latitude=29.1925370196736,
-        longitude=52.036635775856084,
+        latitude=52.036635775856084,
+        longitude=29.1925370196736,
         region=Region.GOMEL,
     )
 
     SLAVGOROD = PointSchema(
         label="Славгород",
-        latitude=31.003458658160586,
-        longitude=53.45088516337511,
+        latitude=53.45088516337511,
+        longitude=31.003458658160586,
         region=Region.MOGILEV,
     )
 
     VASILEVICHI = PointSchema(
         label="Василевичи",
-        latitude=29.838848231201965,
-        longitude=52.25207675198943,
+        latitude=52.25207675198943,
+        longitude=29.838848231201965,
         region=Region.GOMEL,
     )
 
     ZHLOBIN = PointSchema(
         label="Жлобин",
-        latitude=30.043705893277984,
-        longitude=52.89414619807851,
+        latitude=52.89414619807851,
+        longitude=30.043705893277984,
         region=Region.GOMEL,
     )
 
     GORKI = PointSchema(
         label="Горки",
-        latitude=30.94344246329931,
-        longitude=54.30393502455042,
+        latitude=54.30393502455042,
+        longitude=30.94344246329931,
         region=Region.MOGILEV,
     )
 
     VOLKOVYSK = PointSchema(
         label="Волковыск",
-        latitude=24.448995268762964,
-        longitude=53.16692103793095,
+        latitude=53.16692103793095,
+        longitude=24.448995268762964,
         region=Region.GRODNO,
     )
 
     OKTYABR = PointSchema(
         label="Октябрь",
-        latitude=28.883476209528087,
-        longitude=52.63342658653018,
+        latitude=52.63342658653018,
+        longitude=28.883476209528087,
         region=Region.GOMEL,
     )
 
     KOSTYUKOVICHI = PointSchema(
         label="Костюковичи",
-        latitude=32.070027796122154,
-        longitude=53.35847386774336,
+        latitude=53.35847386774336,
+        longitude=32.070027796122154,
         region=Region.MOGILEV,
     )
 
     BREST = PointSchema(
         label="Брест",
-        latitude=23.685652135212752,
-        longitude=52.116580901478635,
+        latitude=52.116580901478635,
+        longitude=23.685652135212752,
         region=Region.BREST,
     )
 
     BOBRUISK = PointSchema(
         label="Бобруйск",
-        latitude=29.127272432117724,
-        longitude=53.20853347538013,
+        latitude=53.20853347538013,
+        longitude=29.127272432117724,
         region=Region.MOGILEV,
     )
 
     IVATSEVICHI = PointSchema(
         label="Ивацевичи",
-        latitude=25.350471424000386,
-        longitude=52.716654759080775,
+        latitude=52.716654759080775,
+        longitude=25.350471424000386,
         region=Region.BREST,
     )
 
     VILEYKA = PointSchema(
         label="Вилейка",
-        latitude=26.89989831916185,
-        longitude=54.48321442087189,
+        latitude=54.48321442087189,
+        longitude=26.89989831916185,
         region=Region.MINSK,
     )
 
     BORISOV = PointSchema(
         label="Борисов",
-        latitude=28.49760585109516,
-        longitude=54.26563317790094,
+        latitude=54.26563317790094,
+        longitude=28.49760585109516,
         region=Region.MINSK,
     )
 
     ZHITKOVICHI = PointSchema(
         label="Житковичи",
-        latitude=27.870082634924596,
-        longitude=52.21411222651425,
+        latitude=52.21411222651425,
+        longitude=27.870082634924596,
         region=Region.GOMEL,
     )
 
     OSHMYANY = PointSchema(
         label="Ошмяны",
-        latitude=25.935350063150867,
-        longitude=54.43300284193779,
+        latitude=54.43300284193779,
+        longitude=25.935350063150867,
         region=Region.GRODNO,
     )
 
     BEREZINO = PointSchema(
         label="Березино",
-        latitude=28.99727106523084,
-        longitude=53.82838181057285,
+        latitude=53.82838181057285,
+        longitude=28.99727106523084,
         region=Region.MINSK,
     )
 
     PINSK = PointSchema(
         label="Пинск",
-        latitude=26.111811093605997,
-        longitude=52.12223760297976,
+        latitude=52.12223760297976,
+        longitude=26.111811093605997,
         region=Region.BREST,
     )
 
     VITEBSK = PointSchema(
         label="Витебск",
-        latitude=30.250042135934226,
-        longitude=55.25257562100984,
+        latitude=55.25257562100984,
+        longitude=30.250042135934226,
         region=Region.VITEBSK,
     )
 
     LIDA = PointSchema(
         label="Лида",
-        latitude=25.32336091231988,
-        longitude=53.90227318372977,
+        latitude=53.90227318372977,
+        longitude=25.32336091231988,
         region=Region.GRODNO,
     )
 
     BARANOVICHI = PointSchema(
         label="Барановичи",
-        longitude=53.13190185894763,
-        latitude=25.97158074066798,
+        latitude=53.13190185894763,
+        longitude=25.97158074066798,
         region=Region.BREST,
     )
 
     STOLBTSY = PointSchema(
         label="Столбцы",
-        latitude=26.732607935963017,
-        longitude=53.46677208676115,
+        latitude=53.46677208676115,
+        longitude=26.732607935963017,
         region=Region.MINSK,
     )
 
     POLESSKAYA_BOLOTNAYA = PointSchema(
         label="Полесская, болотная",
-        latitude=26.667029013394274,
-        longitude=52.29983981155924,
+        latitude=52.29983981155924,
+        longitude=26.667029013394274,
         region=Region.BREST,
     )
 
     DROGICHIN = PointSchema(
         label="Дрогичин",
-        latitude=25.0838433995118,
-        longitude=52.20004370649066,
+        latitude=52.20004370649066,
+        longitude=25.0838433995118,
         region=Region.BREST,
     )
 
     GOMEL = PointSchema(
         label="Гомель",
-        latitude=30.963081201303428,
-        longitude=52.402061468751455,
+        latitude=52.402061468751455,
+        longitude=30.963081201303428,
         region=Region.GOMEL,
     )
 
     NAROCH_OZERNAYA = PointSchema(
         label="Нарочь, озерная",
-        latitude=26.684290791688372,
-        longitude=54.899256667266,
+        latitude=54.899256667266,
+        longitude=26.684290791688372,
         region=Region.VITEBSK,
     )
 
     VOLOZHIN = PointSchema(
         label="Воложин",
-        latitude=26.51694607389268,
-        longitude=54.10018849587838,
+        latitude=54.10018849587838,
+        longitude=26.51694607389268,
         region=Region.MINSK,
     )
 
     VERHNEDVINSK = PointSchema(
         label="Верхнедвинск",
-        latitude=27.940101948630605,
-        longitude=55.8208765412649,
+        latitude=55.8208765412649,
+        longitude=27.940101948630605,
         region=Region.VITEBSK,
     )
 
     SENNO = PointSchema(
         label="Сенно",
-        latitude=29.687798174910593,
-        longitude=54.80456568197694,
+        latitude=54.80456568197694,
+        longitude=29.687798174910593,
         region=Region.VITEBSK,
     )
 
     GRODNO_AMSG = PointSchema(
         label="Гродно, АМСГ",
-        latitude=24.05807929514318,
-        longitude=53.60193676812893,
+        latitude=53.60193676812893,
+        longitude=24.05807929514318,
         region=Region.GRODNO,
     )
 
     MOKRANY = PointSchema(
         label="Мокраны",
-        latitude=24.262048260884608,
-        longitude=51.83469016263843,
+        latitude=51.83469016263843,
+        longitude=24.262048260884608,
         region=Region.BREST,
     )
 
     OLTUSH = PointSchema(
         label="Олтуш",
-        latitude=23.97093118533709,
-        longitude=51.69107406162166,
+        latitude=51.69107406162166,
+        longitude=23.97093118533709,
         region=Region.BREST,
     )
 
     VERCHNI_TEREBEZHOV = PointSchema(
         label="Верхний Теребежов",
-        latitude=26.725999562270026,
-        longitude=51.83600602350391,
+        latitude=51.83600602350391,
+        longitude=26.725999562270026,
         region=Region.BREST,
     )
 
     GLUSHKEVICHI = PointSchema(
         label="Глушкевичи",
-        latitude=27.825665051237728,
-        longitude=51.61087690551236,
+        latitude=51.61087690551236,
+        longitude=27.825665051237728,
         region=Region.GOMEL,
     )
 
     SLOVECHNO = PointSchema(
         label="Словечно",
-        latitude=29.068442241735667,
-        longitude=51.63093077915665,
+        latitude=51.63093077915665,
+        longitude=29.068442241735667,
         region=Region.GOMEL,
     )
 
     NOVAYA_IOLCHA = PointSchema(
         label="Новая Иолча",
-        latitude=30.531611339649682,
-        longitude=51.49095727903912,
+        latitude=51.49095727903912,
+        longitude=30.531611339649682,
         region=Region.GOMEL,
     )
 
     DOMZHERITSY = PointSchema(
         label="Домжерицы",
-        latitude=28.349495110191032,
-        longitude=54.73569818149728,
+        latitude=54.73569818149728,
+        longitude=28.349495110191032,
         region=Region.VITEBSK,
     )
 
@@ -420,6 +423,17 @@ class Point(enum.Enum):
         return self.latitude, self.longitude
 
 
+POINTS_BY_LABEL: Mapping[str, Point] = MappingProxyType(
+    {point.label: point for point in Point}
+)
+LABELS_BY_REGION: Mapping[Region, tuple[str, ...]] = MappingProxyType(
+    {
+        region: tuple(point.label for point in Point if point.region == region)
+        for region in Region
+    }
+)
+
+
 class Emoji(str, enum.Enum):
     HOUSE = emojize("🏡")
     ARROW = emojize("⤵")
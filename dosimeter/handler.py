@@ -1,5 +1,6 @@
 # type: ignore
-from telegram import ChatAction, ReplyKeyboardMarkup, ReplyKeyboardRemove, Update
+from telegram import ChatAction, ReplyKeyboardRemove, Update
+from telegram.error import BadRequest
 from telegram.ext import CallbackContext
 
 from dosimeter.admin import AdminManager, InternalAdminManager, manager
@@ -13,6 +14,7 @@ from dosimeter.navigator import Navigator
 from dosimeter.parser import Parser
 from dosimeter.storage import CloudMongoDataBase, Repository
 from dosimeter.template_engine import Template, TemplateEngine
+from dosimeter.template_engine.cache import MessageCache, RenderedMessage
 from dosimeter.utils import debug_handler, keyboards, restricted, send_action, utils
 
 __all__ = ("MessageHandler",)
@@ -29,24 +31,38 @@ class MessageHandler(object):
 
     def __init__(
         self,
-        parser: Parser = Parser(),
-        template: TemplateEngine = TemplateEngine(),
-        repo: Repository = CloudMongoDataBase(),
-        geolocation: Navigator = Navigator(),
-        measurement: Analytics = Analytics(),
-        control: AdminManager = InternalAdminManager(),
-        bar_chart: ChartEngine = ChartEngine(),
+        parser: Parser | None = None,
+        template: TemplateEngine | None = None,
+        repo: Repository | None = None,
+        geolocation: Navigator | None = None,
+        measurement: Analytics | None = None,
+        control: AdminManager | None = None,
+        bar_chart: ChartEngine | None = None,
     ) -> None:
         """
         Constructor method for initializing objects of class MessageHandler.
+        The missing dependencies are created here rather than as the default
+        arguments, so importing the module doesn't connect to the database.
         """
-        self.parser = parser
-        self.template = template
-        self.repo = repo
-        self.navigator = geolocation
-        self.analytics = measurement
-        self.manager = control
-        self.chart = bar_chart
+        self.parser = parser if parser is not None else Parser()
+        self.template = template if template is not None else TemplateEngine()
+        self.messages = MessageCache(self.template)
+        self.repo = repo if repo is not None else CloudMongoDataBase()
+        self.navigator = geolocation if geolocation is not None else Navigator()
+        self.analytics = measurement if measurement is not None else Analytics()
+        self.manager = control if control is not None else InternalAdminManager()
+        self.chart = bar_chart if bar_chart is not None else ChartEngine()
+
+    def refresh_callback(self, context: CallbackContext) -> None:
+        """
+        Job callback that refreshes the radiation snapshot, renders the charts
+        of all the regions and builds the dose field in advance, so the chart and
+        the location requests are cache hits.
+        """
+        snapshot = self.parser.refresh(context)
+        if snapshot:
+            self.chart.prerender(snapshot)
+            self.navigator.get_dose_field(snapshot.points, snapshot.version)
 
     @debug_handler(log_handler=logger)
     @send_action(ChatAction.TYPING)
@@ -76,10 +92,11 @@ class MessageHandler(object):
         Help command handler method.
         """
         user = update.effective_user
+        message = self.messages.get(Template.HELP, reply_markup=keyboards.main_keyboard)
         context.bot.send_message(
             chat_id=update.effective_message.chat_id,
-            text=self.template.render(Template.HELP),
-            reply_markup=keyboards.main_keyboard(),
+            text=message.text,
+            reply_markup=message.reply_markup,
         )
         self.repo.put(user, Action.HELP)
         logger.info(self.LOG_MSG % Action.HELP, user_id=self.manager.get_one(user.id))
@@ -92,10 +109,13 @@ class MessageHandler(object):
         Donate command handler method.
         """
         user = update.effective_user
+        message = self.messages.get(
+            Template.DONATE, reply_markup=keyboards.donate_keyboard
+        )
         context.bot.send_message(
             chat_id=update.effective_message.chat_id,
-            text=self.template.render(Template.DONATE),
-            reply_markup=keyboards.donate_keyboard(),
+            text=message.text,
+            reply_markup=message.reply_markup,
         )
         self.repo.put(user, Action.DONATE)
         logger.debug(
@@ -202,24 +222,33 @@ class MessageHandler(object):
             longitude=update.message.location.longitude,
         )
 
-        for point, value in self.parser.get_points_with_radiation_level().items():
-            if near_point.title == point:
-                context.bot.send_message(
-                    chat_id=update.effective_message.chat_id,
-                    text=self.template.render(
-                        Template.LOCATION,
-                        distance=f"{near_point.distance:,} м".replace(",", " "),
-                        point=near_point.title,
-                        date=config.app.today,
-                        value=value,
-                    ),
-                )
-                self.repo.put(user, Action.LOCATION)
-                logger.info(
-                    self.LOG_MSG % Action.LOCATION,
-                    user_id=self.manager.get_one(user.id),
-                )
-                break
+        snapshot = self.parser.get_snapshot()
+        value = snapshot.points.get(near_point.title)
+        if value is None:
+            return
+        estimate = self.navigator.estimate_dose(
+            update.message.location.latitude,
+            update.message.location.longitude,
+            snapshot.points,
+            snapshot.version,
+        )
+
+        context.bot.send_message(
+            chat_id=update.effective_message.chat_id,
+            text=self.template.render(
+                Template.LOCATION,
+                distance=f"{near_point.distance:,} м".replace(",", " "),
+                point=near_point.title,
+                date=config.app.today,
+                value=value,
+                estimate=estimate,
+            ),
+        )
+        self.repo.put(user, Action.LOCATION)
+        logger.info(
+            self.LOG_MSG % Action.LOCATION,
+            user_id=self.manager.get_one(user.id),
+        )
 
     def _manage_menu_callback(
         self, update: Update, context: CallbackContext, command: str
@@ -263,24 +292,24 @@ class MessageHandler(object):
             case _:
                 return self._main_menu_callback(update, context)
 
-        keyboard = keyboards.points_keyboard(button_list)
-        return self._pagination_callback(update, context, keyboard, action)
+        return self._pagination_callback(update, context, button_list, action)
 
     def _pagination_callback(
         self,
         update: Update,
         context: CallbackContext,
-        keyboard: ReplyKeyboardMarkup,
+        button_list: tuple[Button, ...],
         action: Action,
     ) -> None:
         """
         Method for pressing the "Next" or "Prev" keyboard button by the user.
         """
         user = update.effective_user
+        message = self._get_region_message(button_list)
         context.bot.send_message(
             chat_id=update.effective_message.chat_id,
-            text=self.template.render(Template.REGION),
-            reply_markup=keyboard,
+            text=message.text,
+            reply_markup=message.reply_markup,
         )
         logger.info(self.LOG_MSG % action.value, user_id=self.manager.get_one(user.id))
 
@@ -332,14 +361,20 @@ class MessageHandler(object):
         Method for pressing the "Radiation monitoring" button by the user.
         """
         user = update.effective_user
+        snapshot = self.parser.get_snapshot()
+        date = config.app.today
+        message = self.messages.get(
+            Template.RADIATION,
+            version=(snapshot.version, snapshot.status, date),
+            context=lambda: {
+                "date": date,
+                "response": snapshot.status,
+                "value": snapshot.mean,
+            },
+        )
         context.bot.send_message(
             chat_id=update.effective_message.chat_id,
-            text=self.template.render(
-                Template.RADIATION,
-                date=config.app.today,
-                response=self.parser.get_info_about_radiation_monitoring(),
-                value=self.parser.get_mean_radiation_level(),
-            ),
+            text=message.text,
         )
         self.repo.put(user, Action.MONITORING)
         logger.info(
@@ -355,10 +390,11 @@ class MessageHandler(object):
         Handler method for pressing the "Monitoring points" button by the user.
         """
         user = update.effective_user
+        message = self._get_region_message(button_list)
         context.bot.send_message(
             chat_id=update.effective_message.chat_id,
-            text=self.template.render(Template.REGION),
-            reply_markup=keyboards.points_keyboard(button_list),
+            text=message.text,
+            reply_markup=message.reply_markup,
         )
         self.repo.put(user, Action.POINTS)
         logger.info(self.LOG_MSG % Action.POINTS, user_id=self.manager.get_one(user.id))
@@ -374,19 +410,28 @@ class MessageHandler(object):
         Handler method for pressing the "* region" button by the user.
         """
         user = update.effective_user
-        data = self.parser.get_region_info(region)
-        values_by_region, mean_value = self.parser.draw_table(data)
-
+        data = self.parser.get_snapshot().get_region_info(region)
+        date = config.app.today
+
+        def get_context() -> dict:
+            values_by_region, mean_value = self.parser.draw_table(data)
+            return {
+                "date": date,
+                "values_by_region": values_by_region,
+                "mean_value": mean_value,
+            }
+
+        message = self.messages.get(
+            Template.TABLE,
+            version=(region, data.version, date),
+            context=get_context,
+            reply_markup=keyboards.chart_keyboard,
+        )
         context.user_data["region"] = data
         context.bot.send_message(
             chat_id=update.effective_message.chat_id,
-            text=self.template.render(
-                Template.TABLE,
-                date=config.app.today,
-                values_by_region=values_by_region,
-                mean_value=mean_value,
-            ),
-            reply_markup=keyboards.chart_keyboard(),
+            text=message.text,
+            reply_markup=message.reply_markup,
         )
 
         self.repo.put(user, action)
@@ -541,6 +586,17 @@ class MessageHandler(object):
         )
         logger.debug(log_msg, user_id=self.manager.get_one(user.id))
 
+    def _get_region_message(self, button_list: tuple[Button, ...]) -> RenderedMessage:
+        """
+        Method for getting the region selection message with the keyboard of
+        the buttons.
+        """
+        return self.messages.get(
+            Template.REGION,
+            version=button_list,
+            reply_markup=lambda: keyboards.points_keyboard(button_list),
+        )
+
     def _hide_keyboard_callback(self, update: Update, context: CallbackContext) -> None:
         """
         Hide main keyboard handler method.
@@ -562,12 +618,26 @@ class MessageHandler(object):
         """
         user = update.effective_user
         data = context.user_data["region"]
-        self.chart.create(data)
-        context.bot.send_photo(
-            chat_id=update.effective_message.chat_id,
-            photo=open(config.app.chart_dir / self.chart.file_name, "rb"),
-        )
-        self.chart.delete()
+        chat_id = update.effective_message.chat_id
+
+        if file_id := self.chart.get_file_id(data):
+            try:
+                context.bot.send_photo(chat_id=chat_id, photo=file_id)
+            except BadRequest as ex:
+                logger.warning(
+                    "Unable to send the chart by file_id: %s" % ex,
+                    user_id=self.manager.get_one(user.id),
+                )
+                self.chart.set_file_id(data, None)
+                file_id = None
+
+        if not file_id:
+            message = context.bot.send_photo(
+                chat_id=chat_id, photo=self.chart.render(data)
+            )
+            if message and message.photo:
+                self.chart.set_file_id(data, message.photo[-1].file_id)
+
         self.repo.put(user, Action.SHOW_CHART)
         logger.debug(
             self.LOG_MSG % Action.SHOW_CHART,
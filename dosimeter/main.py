@@ -1,4 +1,5 @@
 import sys
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
 import pytz
@@ -8,7 +9,9 @@ from telegram.utils.request import Request
 from dosimeter.config import config
 from dosimeter.config.logging import get_logger
 from dosimeter.constants import Command
-from dosimeter.handler import MessageHandler  # type: ignore[attr-defined]
+
+if TYPE_CHECKING:
+    from dosimeter.handler import MessageHandler  # type: ignore[attr-defined]
 
 logger = get_logger(__name__)
 
@@ -19,12 +22,13 @@ class DosimeterBot:
     the DosimeterBot object.
     """
 
-    def __init__(self, token: str, callback: MessageHandler = MessageHandler()) -> None:
+    def __init__(self, token: str, callback: "MessageHandler | None" = None) -> None:
         """
-        Instantiate a DosimeterBot object.
+        Instantiate a DosimeterBot object. The handler is imported and created here,
+        so the chart workers, which import this module as the main one on spawn,
+        don't connect to the database or build the navigator.
         """
         self.token = token
-        self.handler = callback
 
         # Initial bot application
         defaults = ext.Defaults(
@@ -34,6 +38,12 @@ class DosimeterBot:
         bot = ext.ExtBot(request=request, token=self.token, defaults=defaults)
         self.updater = ext.Updater(bot=bot, use_context=True)
 
+        if callback is None:
+            from dosimeter.handler import MessageHandler
+
+            callback = MessageHandler()
+        self.handler = callback
+
         dispatcher = self.updater.dispatcher  # type: ignore[has-type,unused-ignore]
 
         command_handlers = {
@@ -61,6 +71,14 @@ class DosimeterBot:
         )
         dispatcher.add_handler(button_handler)
 
+        # Background refresh of the radiation snapshot
+        self.updater.job_queue.run_repeating(  # type: ignore[has-type,unused-ignore]
+            callback=self.handler.refresh_callback,
+            interval=config.app.refresh_interval,
+            first=0,
+            name="refresh_radiation_snapshot",
+        )
+
     @property
     def is_checked(self) -> bool:
         """
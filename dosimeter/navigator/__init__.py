@@ -1,6 +1,12 @@
-from dosimeter.navigator.navigator import Navigator, NearPoint
+from dosimeter.navigator.grid import NearestGrid
+from dosimeter.navigator.idw import DoseField
+from dosimeter.navigator.navigator import Navigator
+from dosimeter.navigator.spatial import NearPoint, SpatialIndex
 
 __all__ = (
+    "DoseField",
     "Navigator",
     "NearPoint",
+    "NearestGrid",
+    "SpatialIndex",
 )
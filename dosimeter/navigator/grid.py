@@ -0,0 +1,154 @@
+import hashlib
+import pathlib
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from dosimeter.config.logging import get_logger
+from dosimeter.navigator.spatial import (
+    HAVERSINE_TOLERANCE,
+    Latitude,
+    Longitude,
+    haversine,
+)
+
+logger = get_logger(__name__)
+
+# South, west, north and east edges of the lattice, covering Belarus.
+BOUNDING_BOX: tuple[Latitude, Longitude, Latitude, Longitude] = (51.2, 23.1, 56.2, 32.8)
+
+# Bumped whenever the way the candidates are found changes, so the lattices
+# cached by the previous versions aren't loaded.
+GRID_FORMAT_VERSION = 1
+
+
+class NearestGrid(object):
+    """
+    A lattice over the bounding box in which every cell stores the nearest station.
+    The cells near the borders of the station's Voronoi cells store the list of
+    candidate stations instead, as any of them may be the nearest one for a location
+    within the cell.
+    """
+
+    def __init__(
+        self,
+        coordinates: Sequence[tuple[Latitude, Longitude]],
+        resolution: float,
+        bbox: tuple[Latitude, Longitude, Latitude, Longitude] = BOUNDING_BOX,
+        cache_dir: pathlib.Path | None = None,
+    ) -> None:
+        """
+        Instantiate a NearestGrid object. The lattice is loaded from the cache
+        directory if it has already been built for the same stations, resolution
+        and bounding box, otherwise it's built and saved there.
+        """
+        self.resolution = resolution
+        self.bbox = bbox
+        self.coordinates = np.asarray(coordinates, dtype=np.float64)
+        self.stations = np.arange(len(self.coordinates), dtype=np.int16)
+        self.shape = (
+            int(np.ceil((bbox[2] - bbox[0]) / resolution)),
+            int(np.ceil((bbox[3] - bbox[1]) / resolution)),
+        )
+        self.cells, self.offsets, self.candidates = self._load(cache_dir)
+
+    @property
+    def nbytes(self) -> int:
+        return self.cells.nbytes + self.offsets.nbytes + self.candidates.nbytes
+
+    def lookup(
+        self, latitude: Latitude, longitude: Longitude
+    ) -> npt.NDArray[np.int16] | None:
+        """
+        The method returns the indices of the candidate stations for the location:
+        the only nearest one for most of the cells or several ones near the borders.
+        None is returned for locations outside the bounding box.
+        """
+        row = int((latitude - self.bbox[0]) // self.resolution)
+        column = int((longitude - self.bbox[1]) // self.resolution)
+        if not (0 <= row < self.shape[0] and 0 <= column < self.shape[1]):
+            return None
+
+        cell = int(self.cells[row, column])
+        if cell >= 0:
+            return self.stations[cell : cell + 1]
+        return self.candidates[self.offsets[-cell - 1] : self.offsets[-cell]]
+
+    def _load(
+        self, cache_dir: pathlib.Path | None
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.int16]]:
+        """
+        Private method that reads the lattice from the cache or builds it.
+        """
+        if cache_dir is None:
+            return self._build()
+
+        key = hashlib.sha1(
+            self.coordinates.tobytes()
+            + np.array(
+                [self.resolution, *self.bbox, HAVERSINE_TOLERANCE, GRID_FORMAT_VERSION]
+            ).tobytes()
+        ).hexdigest()
+        path = cache_dir / f"nearest-grid-{key}.npz"
+
+        if path.exists():
+            with np.load(path) as arrays:
+                return arrays["cells"], arrays["offsets"], arrays["candidates"]
+
+        cells, offsets, candidates = self._build()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            np.savez_compressed(
+                path, cells=cells, offsets=offsets, candidates=candidates
+            )
+        except OSError as ex:
+            logger.warning(
+                "Unable to cache the nearest grid. Raised exception: %s" % ex
+            )
+        return cells, offsets, candidates
+
+    def _build(
+        self,
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int32], npt.NDArray[np.int16]]:
+        """
+        Private method that computes the distances from the center of every cell to
+        all the stations row by row. A station stays a candidate for the cell unless
+        it is farther from the center than the nearest one by more than the cell
+        diagonal plus the haversine tolerance, as within the cell the distances
+        change by no more than half of the diagonal.
+        """
+        south, west = self.bbox[0], self.bbox[1]
+        step = self.resolution / 2
+        latitudes = south + (np.arange(self.shape[0]) + 0.5) * self.resolution
+        longitudes = west + (np.arange(self.shape[1]) + 0.5) * self.resolution
+        to_latitudes, to_longitudes = self.coordinates.T
+        cells = np.empty(self.shape, dtype=np.int32)
+        offsets, candidates = [0], []
+
+        for row, latitude in enumerate(latitudes):
+            distances = haversine(
+                latitude, longitudes[:, None], to_latitudes, to_longitudes
+            )
+            corners = haversine(
+                latitude, west, latitude + np.array([-step, step]), west + step
+            )
+            diagonal = 2 * corners.max()
+            margin = (
+                distances
+                - distances.min(axis=1, keepdims=True)
+                - diagonal
+                - HAVERSINE_TOLERANCE * (distances + diagonal / 2)
+            )
+            stations = margin <= 0
+            cells[row] = distances.argmin(axis=1)
+            for column in np.flatnonzero(stations.sum(axis=1) > 1):
+                candidates.extend(np.flatnonzero(stations[column]).tolist())
+                offsets.append(len(candidates))
+                cells[row, column] = -(len(offsets) - 1)
+
+        return (
+            cells,
+            np.array(offsets, dtype=np.int32),
+            np.array(candidates, dtype=np.int16),
+        )
@@ -0,0 +1,114 @@
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from dosimeter.navigator.grid import BOUNDING_BOX
+from dosimeter.navigator.spatial import Latitude, Longitude, haversine
+
+IDW_NEIGHBOURS = 4
+IDW_POWER = 2
+# The dose isn't estimated farther than this from the nearest station, in meters.
+IDW_MAX_DISTANCE = 60_000
+
+
+def idw(
+    distances: npt.NDArray[np.float64],
+    values: npt.NDArray[np.float64],
+    k: int = IDW_NEIGHBOURS,
+    power: float = IDW_POWER,
+) -> npt.NDArray[np.float64]:
+    """
+    The function returns the inverse distance weighted estimates for every row of
+    the distance matrix (locations x stations) from the k nearest stations. The
+    distances are clipped at one meter, so a location at a station gets its value.
+    """
+    k = min(k, values.size)
+    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    weights = np.maximum(np.take_along_axis(distances, nearest, axis=1), 1.0) ** -power
+    return (weights * values[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+
+class DoseField(object):
+    """
+    The dose rate interpolated by IDW from the station readings at the nodes of
+    the lattice over the bounding box. It's built once per snapshot, so estimating
+    the dose at a location within the box is a bilinear lookup. The locations
+    outside the box or too far from the stations get no estimate.
+    """
+
+    def __init__(
+        self,
+        coordinates: Sequence[tuple[Latitude, Longitude]],
+        values: Sequence[float],
+        resolution: float,
+        bbox: tuple[Latitude, Longitude, Latitude, Longitude] = BOUNDING_BOX,
+        max_distance: float = IDW_MAX_DISTANCE,
+    ) -> None:
+        """
+        Instantiate a DoseField object.
+        """
+        assert len(coordinates) == len(values) > 0, "Each station must have a value."
+        self.coordinates = np.asarray(coordinates, dtype=np.float64)
+        self.values = np.asarray(values, dtype=np.float64)
+        self.resolution = resolution
+        self.bbox = bbox
+        self.max_distance = max_distance
+        self.shape = (
+            int(np.ceil((bbox[2] - bbox[0]) / resolution)),
+            int(np.ceil((bbox[3] - bbox[1]) / resolution)),
+        )
+        self.nodes, self.reach = self._build()
+
+    def estimate(self, latitude: Latitude, longitude: Longitude) -> float | None:
+        """
+        The method returns the dose rate at the location by bilinear interpolation
+        between the lattice nodes, or None outside the bounding box or farther than
+        the maximum distance from the nearest station.
+        """
+        row = (latitude - self.bbox[0]) / self.resolution
+        column = (longitude - self.bbox[1]) / self.resolution
+        if not (0 <= row <= self.shape[0] and 0 <= column <= self.shape[1]):
+            return None
+        if self._interpolate(self.reach, row, column) > self.max_distance:
+            return None
+        return self._interpolate(self.nodes, row, column)
+
+    def estimate_exact(self, latitude: Latitude, longitude: Longitude) -> float:
+        """
+        The method returns the IDW estimate of the dose rate at the location.
+        """
+        distances = haversine(latitude, longitude, *self.coordinates.T)
+        return float(idw(distances[None, :], self.values)[0])
+
+    def _interpolate(
+        self, lattice: npt.NDArray[np.float64], row: float, column: float
+    ) -> float:
+        """
+        Private method that bilinearly interpolates the lattice at the fractional
+        row and column.
+        """
+        i, j = min(int(row), self.shape[0] - 1), min(int(column), self.shape[1] - 1)
+        y, x = row - i, column - j
+        (a, b), (c, d) = lattice[i : i + 2, j : j + 2]
+        return float((a * (1 - x) + b * x) * (1 - y) + (c * (1 - x) + d * x) * y)
+
+    def _build(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Private method that computes the IDW estimates and the distances to
+        the nearest station at the lattice nodes row by row.
+        """
+        latitudes = self.bbox[0] + np.arange(self.shape[0] + 1) * self.resolution
+        longitudes = self.bbox[1] + np.arange(self.shape[1] + 1) * self.resolution
+        to_latitudes, to_longitudes = self.coordinates.T
+        nodes = np.empty((latitudes.size, longitudes.size), dtype=np.float64)
+        reach = np.empty_like(nodes)
+
+        for row, latitude in enumerate(latitudes):
+            distances = haversine(
+                latitude, longitudes[:, None], to_latitudes, to_longitudes
+            )
+            nodes[row] = idw(distances, self.values)
+            reach[row] = distances.min(axis=1)
+
+        return nodes, reach
@@ -1,21 +1,29 @@
-from typing import NamedTuple, TypeAlias
+import threading
+from typing import Mapping
 
+import numpy as np
+import numpy.typing as npt
 from geopy import distance
 
 from dosimeter.admin import manager
+from dosimeter.config import config
 from dosimeter.config.logging import CustomAdapter, get_logger
-from dosimeter.constants import Point
+from dosimeter.constants import POINTS_BY_LABEL, Coordinates
+from dosimeter.navigator.grid import NearestGrid
+from dosimeter.navigator.idw import DoseField
+from dosimeter.navigator.spatial import (
+    EARTH_RADIUS,
+    HAVERSINE_TOLERANCE,
+    Distance,
+    Latitude,
+    Longitude,
+    NearPoint,
+    SpatialIndex,
+)
 
 logger = CustomAdapter(get_logger(__name__), {"user_id": manager.get_one()})
 
-Latitude: TypeAlias = float
-Longitude: TypeAlias = float
-Distance: TypeAlias = float
-
-
-class NearPoint(NamedTuple):
-    distance: float
-    title: str
+DOSE_FIELD_RESOLUTION = 0.05
 
 
 class Navigator(object):
@@ -24,11 +32,37 @@ class Navigator(object):
     is implemented.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        geodesic: bool = True,
+        resolution: float = config.app.grid_resolution,
+    ) -> None:
         """
-        Constructor method for initializing objects of class Navigator.
+        Constructor method for initializing objects of class Navigator. If geodesic
+        is set, the distance shown to the user is refined with the exact geodesic
+        solver, otherwise the haversine distance is returned. If the resolution
+        (in degrees) is positive, the nearest points are precomputed on the grid.
         """
         self.distance = distance.distance
+        self.geodesic = geodesic
+        self.labels: tuple[str, ...] = tuple(POINTS_BY_LABEL)
+        self.coordinates: tuple[Coordinates, ...] = tuple(
+            point.coordinates for point in POINTS_BY_LABEL.values()
+        )
+        self.positions = {label: index for index, label in enumerate(self.labels)}
+        self.latitudes, self.longitudes = np.radians(self.coordinates).T
+        self.cos_latitudes = np.cos(self.latitudes)
+        self.index = SpatialIndex(self.labels, self.coordinates)
+        self.resolution = resolution
+        self._dose_field: tuple[str, DoseField] | None = None
+        self._dose_field_lock = threading.Lock()
+        self.grid = (
+            NearestGrid(
+                self.coordinates, resolution, cache_dir=config.app.grid_cache_dir
+            )
+            if resolution > 0
+            else None
+        )
 
     def get_near_point(
         self,
@@ -38,7 +72,8 @@ class Navigator(object):
     ) -> NearPoint:
         """
         The method calculates the minimum distance in meters relative to the user's
-        location to the nearest monitoring point.
+        location to the nearest monitoring point. Only the candidates that may be
+        the nearest within the haversine error are measured.
         """
         user_coordinates = (latitude, longitude)
 
@@ -47,12 +82,134 @@ class Navigator(object):
             user_id=manager.get_one(user_id),
         )
 
-        distance_list = [
-            (
-                round(self.distance(user_coordinates, point.coordinates).m, 3),
-                point.label,
+        candidates = self.get_candidates(latitude, longitude)
+
+        if self.geodesic:
+            distances = [
+                self.distance(user_coordinates, self.coordinates[index]).m
+                for index in candidates
+            ]
+        else:
+            distances = self.get_distances(latitude, longitude)[candidates].tolist()
+
+        return NearPoint(
+            *min(
+                (round(value, 3), self.labels[index])
+                for value, index in zip(distances, candidates)
+            )
+        )
+
+    def get_candidates(self, latitude: Latitude, longitude: Longitude) -> list[int]:
+        """
+        The method returns the indices of the monitoring points that may be
+        the nearest one to the location. Within the grid it's a single array lookup,
+        outside of it the candidates are found in the spatial index.
+        """
+        if (
+            self.grid
+            and (candidates := self.grid.lookup(latitude, longitude)) is not None
+        ):
+            return candidates.tolist()
+
+        nearest = self.index.nearest(latitude, longitude)[0]
+        return [
+            self.positions[title]
+            for _, title in self.index.within(
+                latitude, longitude, nearest.distance * (1 + HAVERSINE_TOLERANCE)
             )
-            for point in Point
         ]
 
-        return NearPoint(*min(distance_list))
+    def estimate_dose(
+        self,
+        latitude: Latitude,
+        longitude: Longitude,
+        points: Mapping[str, float],
+        version: str | None = None,
+    ) -> float | None:
+        """
+        The method estimates the dose rate at the location by inverse distance
+        weighting of the readings of the nearest monitoring points. The interpolated
+        field is built once per version of the readings (snapshot), so a request
+        is a bilinear lookup.
+        """
+        field = self.get_dose_field(points, version)
+        return field.estimate(latitude, longitude) if field else None
+
+    def get_dose_field(
+        self,
+        points: Mapping[str, float],
+        version: str | None = None,
+    ) -> DoseField | None:
+        """
+        The method returns the dose field interpolated from the readings. The field
+        of the latest version is kept, readings without a version aren't cached.
+        """
+        with self._dose_field_lock:
+            if version and self._dose_field and self._dose_field[0] == version:
+                return self._dose_field[1]
+
+            labels = [label for label in self.labels if label in points]
+            if not labels:
+                return None
+            field = DoseField(
+                [self.coordinates[self.positions[label]] for label in labels],
+                [points[label] for label in labels],
+                resolution=self.resolution or DOSE_FIELD_RESOLUTION,
+            )
+            if version:
+                self._dose_field = (version, field)
+            return field
+
+    def get_near_points(
+        self,
+        latitude: Latitude,
+        longitude: Longitude,
+        k: int = 3,
+    ) -> list[NearPoint]:
+        """
+        The method returns k monitoring points nearest to the location, closest first,
+        with the great-circle distances in meters.
+        """
+        return self.index.nearest(latitude, longitude, k)
+
+    def get_points_within(
+        self,
+        latitude: Latitude,
+        longitude: Longitude,
+        radius: Distance,
+    ) -> list[NearPoint]:
+        """
+        The method returns the monitoring points within the radius in meters from
+        the location, closest first.
+        """
+        return self.index.within(latitude, longitude, radius)
+
+    def get_points_in_bbox(
+        self,
+        south: Latitude,
+        west: Longitude,
+        north: Latitude,
+        east: Longitude,
+    ) -> list[str]:
+        """
+        The method returns the labels of the monitoring points inside the bounding box.
+        """
+        return self.index.within_bbox(south, west, north, east)
+
+    def get_distances(
+        self,
+        latitude: Latitude,
+        longitude: Longitude,
+    ) -> npt.NDArray[np.float64]:
+        """
+        The method returns the haversine distances in meters from the given location
+        to every monitoring point in the order of the labels.
+        """
+        latitude, longitude = np.radians(latitude), np.radians(longitude)
+        a = (
+            np.sin((self.latitudes - latitude) / 2) ** 2
+            + np.cos(latitude)
+            * self.cos_latitudes
+            * np.sin((self.longitudes - longitude) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
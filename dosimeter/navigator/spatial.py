@@ -0,0 +1,245 @@
+import heapq
+from dataclasses import dataclass
+from typing import NamedTuple, Sequence, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+Latitude: TypeAlias = float
+Longitude: TypeAlias = float
+Distance: TypeAlias = float
+
+EARTH_RADIUS: Distance = 6_371_008.8
+# The haversine distance on the mean sphere differs from the WGS-84 geodesic one by
+# less than 0.56%, so any point farther than the nearest one by more than twice that
+# can't be the nearest on the ellipsoid.
+HAVERSINE_TOLERANCE = 0.0112
+
+
+class NearPoint(NamedTuple):
+    distance: float
+    title: str
+
+
+def haversine(
+    latitude: float | npt.NDArray[np.float64],
+    longitude: float | npt.NDArray[np.float64],
+    to_latitude: float | npt.NDArray[np.float64],
+    to_longitude: float | npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    The function returns the haversine distances in meters between the locations
+    given in degrees, broadcasting the arrays.
+    """
+    latitude, longitude = np.radians(latitude), np.radians(longitude)
+    to_latitude, to_longitude = np.radians(to_latitude), np.radians(to_longitude)
+    a = (
+        np.sin((to_latitude - latitude) / 2) ** 2
+        + np.cos(latitude)
+        * np.cos(to_latitude)
+        * np.sin((to_longitude - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+
+@dataclass(frozen=True)
+class Node:
+    """
+    Class representing a node of the k-d tree. Leaves hold the indices of the
+    points, inner nodes split the space by the plane orthogonal to the axis.
+    """
+
+    indices: npt.NDArray[np.intp] | None = None
+    axis: int = 0
+    split: float = 0.0
+    left: "Node | None" = None
+    right: "Node | None" = None
+
+
+class SpatialIndex(object):
+    """
+    A k-d tree over the monitoring points placed on the unit sphere. The straight
+    line (chord) distance between the unit vectors grows monotonically with
+    the great-circle distance, so the nearest points in 3-D are the nearest ones
+    on the Earth's surface and a search radius in meters maps to a chord length.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        coordinates: Sequence[tuple[Latitude, Longitude]],
+        leaf_size: int = 8,
+    ) -> None:
+        """
+        Instantiate a SpatialIndex object.
+        """
+        assert len(labels) == len(coordinates), "Each point must have coordinates."
+        self.labels = tuple(labels)
+        self.leaf_size = leaf_size
+        self.vectors = self.to_vectors(np.asarray(coordinates, dtype=np.float64))
+        self.root = self._build(np.arange(len(self.labels), dtype=np.intp))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def nearest(
+        self, latitude: Latitude, longitude: Longitude, k: int = 1
+    ) -> list[NearPoint]:
+        """
+        The method returns k points nearest to the location, closest first.
+        """
+        target = self.to_vectors(np.array([[latitude, longitude]]))[0]
+        heap: list[tuple[float, int]] = []
+        if k > 0:
+            self._search_nearest(self.root, target, k, heap)
+        return [
+            self._near_point(-negated, index) for negated, index in sorted(heap)[::-1]
+        ]
+
+    def within(
+        self, latitude: Latitude, longitude: Longitude, radius: Distance
+    ) -> list[NearPoint]:
+        """
+        The method returns all the points within the radius in meters from
+        the location, closest first.
+        """
+        target = self.to_vectors(np.array([[latitude, longitude]]))[0]
+        chord = 2 * np.sin(min(radius / EARTH_RADIUS, np.pi) / 2)
+        found: list[tuple[float, int]] = []
+        self._search_within(self.root, target, chord**2, found)
+        return [self._near_point(distance, index) for distance, index in sorted(found)]
+
+    def within_bbox(
+        self,
+        south: Latitude,
+        west: Longitude,
+        north: Latitude,
+        east: Longitude,
+    ) -> list[str]:
+        """
+        The method returns the labels of the points inside the bounding box. The box
+        is covered by the spherical cap around its center reaching the farthest
+        corner, the points of the cap are then checked against the box itself.
+        """
+        center = ((south + north) / 2, (west + east) / 2)
+        corners = np.array([[south, west], [south, east], [north, west], [north, east]])
+        target = self.to_vectors(np.array([center]))[0]
+        chord = np.sqrt(((self.to_vectors(corners) - target) ** 2).sum(axis=1).max())
+
+        found: list[tuple[float, int]] = []
+        self._search_within(self.root, target, chord**2, found)
+        indices = np.array(sorted(index for _, index in found), dtype=np.intp)
+        if not indices.size:
+            return []
+
+        latitudes, longitudes = self.to_coordinates(self.vectors[indices]).T
+        inside = (
+            (south <= latitudes)
+            & (latitudes <= north)
+            & (west <= longitudes)
+            & (longitudes <= east)
+        )
+        return [self.labels[index] for index in indices[inside]]
+
+    @staticmethod
+    def to_vectors(coordinates: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        The method converts (latitude, longitude) pairs in degrees into unit vectors.
+        """
+        latitudes, longitudes = np.radians(coordinates).T
+        return np.column_stack(
+            (
+                np.cos(latitudes) * np.cos(longitudes),
+                np.cos(latitudes) * np.sin(longitudes),
+                np.sin(latitudes),
+            )
+        )
+
+    @staticmethod
+    def to_coordinates(vectors: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        The method converts unit vectors into (latitude, longitude) pairs in degrees.
+        """
+        x, y, z = vectors.T
+        return np.degrees(
+            np.column_stack((np.arcsin(np.clip(z, -1, 1)), np.arctan2(y, x)))
+        )
+
+    def _build(self, indices: npt.NDArray[np.intp]) -> Node:
+        """
+        Private method that recursively splits the points by the median along
+        the axis of the largest spread.
+        """
+        if len(indices) <= self.leaf_size:
+            return Node(indices=indices)
+
+        vectors = self.vectors[indices]
+        axis = int(np.argmax(np.ptp(vectors, axis=0)))
+        order = np.argsort(vectors[:, axis], kind="stable")
+        middle = len(indices) // 2
+        return Node(
+            axis=axis,
+            split=float(vectors[order[middle], axis]),
+            left=self._build(indices[order[:middle]]),
+            right=self._build(indices[order[middle:]]),
+        )
+
+    def _search_nearest(
+        self,
+        node: Node,
+        target: npt.NDArray[np.float64],
+        k: int,
+        heap: list[tuple[float, int]],
+    ) -> None:
+        """
+        Private method that keeps the k nearest points found so far in the max-heap
+        of negated squared chords and skips the subtrees that can't improve it.
+        """
+        if node.indices is not None:
+            chords = ((self.vectors[node.indices] - target) ** 2).sum(axis=1)
+            for chord, index in zip(chords.tolist(), node.indices.tolist()):
+                if len(heap) < k:
+                    heapq.heappush(heap, (-chord, index))
+                elif chord < -heap[0][0]:
+                    heapq.heapreplace(heap, (-chord, index))
+            return
+
+        offset = target[node.axis] - node.split
+        near, far = (node.left, node.right) if offset < 0 else (node.right, node.left)
+        self._search_nearest(near, target, k, heap)  # type: ignore[arg-type]
+        if len(heap) < k or offset**2 < -heap[0][0]:
+            self._search_nearest(far, target, k, heap)  # type: ignore[arg-type]
+
+    def _search_within(
+        self,
+        node: Node,
+        target: npt.NDArray[np.float64],
+        limit: float,
+        found: list[tuple[float, int]],
+    ) -> None:
+        """
+        Private method that collects the points whose squared chord to the target
+        doesn't exceed the limit.
+        """
+        if node.indices is not None:
+            chords = ((self.vectors[node.indices] - target) ** 2).sum(axis=1)
+            found.extend(
+                (chord, index)
+                for chord, index in zip(chords.tolist(), node.indices.tolist())
+                if chord <= limit
+            )
+            return
+
+        offset = target[node.axis] - node.split
+        if offset < 0 or offset**2 <= limit:
+            self._search_within(node.left, target, limit, found)  # type: ignore[arg-type]
+        if offset >= 0 or offset**2 <= limit:
+            self._search_within(node.right, target, limit, found)  # type: ignore[arg-type]
+
+    def _near_point(self, squared_chord: float, index: int) -> NearPoint:
+        """
+        Private method that converts the squared chord into the great-circle
+        distance in meters.
+        """
+        angle = 2 * np.arcsin(min(np.sqrt(squared_chord) / 2, 1.0))
+        return NearPoint(float(EARTH_RADIUS * angle), self.labels[index])
@@ -1,15 +1,20 @@
-from dosimeter.parser.parser import (
+from dosimeter.parser.parser import Parser
+from dosimeter.parser.snapshot import (
     NameOfRegion,
     ObservePoint,
-    Parser,
     PowerOfRadiation,
+    RadiationSnapshot,
     RegionInfoDTO,
 )
+from dosimeter.parser.stats import RadiationStats, Stats
 
 __all__ = (
     "NameOfRegion",
     "ObservePoint",
     "Parser",
     "PowerOfRadiation",
+    "RadiationSnapshot",
+    "RadiationStats",
     "RegionInfoDTO",
+    "Stats",
 )
@@ -1,28 +1,39 @@
-from dataclasses import dataclass
-from statistics import mean
-from typing import TypeAlias
+import hashlib
+import threading
+from dataclasses import replace
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from statistics import fmean
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from telegram.ext import CallbackContext
 
 from dosimeter.api import Api, BaseApi
+from dosimeter.config import UTF
 from dosimeter.config.logging import get_logger
-from dosimeter.constants import URL, Point, Region
+from dosimeter.constants import URL, Region
+from dosimeter.parser.snapshot import (
+    NameOfRegion,
+    ObservePoint,
+    PowerOfRadiation,
+    RadiationSnapshot,
+    RegionInfoDTO,
+)
+
+__all__ = (
+    "NameOfRegion",
+    "ObservePoint",
+    "Parser",
+    "PowerOfRadiation",
+    "RadiationSnapshot",
+    "RegionInfoDTO",
+)
 
 logger = get_logger(__name__)
 
-PowerOfRadiation: TypeAlias = float
-ObservePoint: TypeAlias = str
-NameOfRegion: TypeAlias = str
-
-
-@dataclass
-class RegionInfoDTO:
-    """
-    Class representing Data Transfer Object for region's information.
-    """
-
-    region: Region
-    info: dict[ObservePoint, PowerOfRadiation]
+STATUS_PREFIX = "По состоянию"
+STATUS_CHUNK_SIZE = 4_096
 
 
 class Parser(object):
@@ -36,6 +47,75 @@ class Parser(object):
         Instantiate a Parser object.
         """
         self.api = external_api
+        self._snapshot: RadiationSnapshot | None = None
+        self._markup: dict[str, str] = {}
+        self._refresh_lock = threading.Lock()
+
+    def get_snapshot(self) -> RadiationSnapshot:
+        """
+        The method returns the current snapshot of the radiation.xml document.
+        The snapshot is refreshed in the background, so the network is touched here
+        only on a cold start, when no snapshot has been built yet.
+        """
+        snapshot = self._snapshot or self.refresh()
+        assert snapshot, "Unable to get XML markup of the web resource."
+        return snapshot
+
+    def refresh(
+        self, context: CallbackContext | None = None
+    ) -> RadiationSnapshot | None:
+        """
+        Job callback that fetches and parses both sources of the web resource and
+        swaps in the new snapshot. If the refresh fails, the previous snapshot keeps
+        being served. The cached markup is dropped first, so every run of the job
+        reaches the web resource.
+        """
+        with self._refresh_lock:
+            current = self._snapshot
+            self.api.invalidate()
+            try:
+                markup = self.api.get_xml()
+                assert markup, "Unable to get XML markup of the web resource."
+                if current and markup is self._markup.get(URL.RADIATION):
+                    snapshot, version = current, current.version
+                else:
+                    version = hashlib.sha1(markup.encode(UTF)).hexdigest()
+                    snapshot = (
+                        current
+                        if current and current.version == version
+                        else self._build_snapshot(markup, version)
+                    )
+                self._markup[URL.RADIATION] = markup
+            except Exception as ex:
+                logger.exception(
+                    "Unable to refresh the radiation snapshot, the previous one is "
+                    "kept. Raised exception: %s" % ex
+                )
+                return current
+
+            try:
+                markup = self.api.get_html()
+                assert markup, "Unable to get HTML markup of the web resource."
+                status = (
+                    current.status
+                    if current and markup is self._markup.get(URL.MONITORING)
+                    else self._extract_status(markup)
+                )
+                self._markup[URL.MONITORING] = markup
+            except Exception as ex:
+                logger.exception(
+                    "Unable to refresh the radiation monitoring status, the previous "
+                    "one is kept. Raised exception: %s" % ex
+                )
+                status = current.status if current else None
+
+            if snapshot.status != status:
+                snapshot = replace(snapshot, status=status)
+
+            if snapshot is not current:
+                self._snapshot = snapshot
+                logger.info("Radiation snapshot refreshed, version %s" % version)
+            return snapshot
 
     def get_points_with_radiation_level(
         self,
@@ -45,82 +125,95 @@ class Parser(object):
         monitoring points, and the values of the keys are the power values
         of the equivalent radiation dose.
         """
-        soup = self._get_source(URL.RADIATION)
-        assert isinstance(soup, BeautifulSoup)
-        points = [
-            point.text
-            for point in soup.find_all("title")
-            if point.text != "Радиационный контроль и мониторинг"
-        ]
-        values = [float(value.text) for value in soup.find_all("rad")]
-        return dict(zip(points, values))
+        return dict(self.get_snapshot().points)
 
     def get_mean_radiation_level(self) -> PowerOfRadiation:
         """
         The method returns the arithmetic mean of the radiation dose rate.
         """
-        return mean(list(self.get_points_with_radiation_level().values()))
+        return self.get_snapshot().mean
 
     def get_info_about_radiation_monitoring(self) -> str | None:
         """
-        A method for parsing an object of the BeautifulSoup class, which is html markup
-        https://rad.org.by/monitoring/radiation web resource.
+        The method returns the status line of the radiation monitoring from
+        the https://rad.org.by/monitoring/radiation web resource.
         """
-        soup = self._get_source(URL.MONITORING)
-        assert isinstance(soup, BeautifulSoup)
-
-        def has_substring(span: Tag) -> bool:
-            return span.text.startswith("По состоянию")
-
-        return (
-            soup.find_all(has_substring)[0].text.replace("\xa0", " ").replace("  ", " ")
-        )
+        return self.get_snapshot().status
 
     @staticmethod
     def draw_table(
         data: RegionInfoDTO,
     ) -> tuple[list[tuple[ObservePoint, str]], PowerOfRadiation]:
         """
-        The method for parsing an object of the BeautifulSoup class, which is the XML
-        markup web resource. Return the list of tuples containing the name of the
-        monitoring point and the dose rate values, as well as the average dose rate
-        value in the region.
+        The method formats the readings of the region taken from the snapshot into
+        the rows of the table. Return the list of tuples containing the padded name
+        of the monitoring point and the aligned dose rate value, as well as the average
+        dose rate value in the region precomputed with the snapshot statistics.
         """
-        values_by_region, table = [], []
+        table = [
+            (point.ljust(20, "-"), "{:>6}".format(value))
+            for point, value in data.info.items()
+        ]
+        return table, data.stats.mean if data.stats else fmean(data.info.values())
 
-        for point, value in data.info.items():
-            values_by_region.append(value)
-            table.append((point.ljust(20, "-"), "{:>6}".format(value)))
+    def get_region_info(self, region: Region) -> RegionInfoDTO:
+        """
+        The method returns the Data Transfer Object with the monitoring points of
+        the region and the power values of the equivalent radiation dose.
+        """
+        return self.get_snapshot().get_region_info(region)
 
-        return table, mean(values_by_region)
+    @staticmethod
+    def _build_snapshot(markup: str, version: str | None = None) -> RadiationSnapshot:
+        """
+        Private method that parses XML markup of the web resource into
+        the RadiationSnapshot object.
+        """
+        records, timestamp = Parser._parse_feed(markup)
+        return RadiationSnapshot.create(records, timestamp=timestamp, version=version)
 
-    def get_region_info(self, region: Region) -> RegionInfoDTO:
+    @staticmethod
+    def _parse_feed(
+        markup: str,
+    ) -> tuple[list[tuple[ObservePoint, PowerOfRadiation]], datetime | None]:
         """
-        The method for parsing an object of the BeautifulSoup class, which is the XML
-        markup web resource. Return the list of tuples containing the name of the
-        monitoring point and the dose rate values, as well as the average dose rate
-        value in the region.
+        Private method that streams XML markup of the web resource in a single pass
+        and returns the (point, dose) records together with the build date of
+        the feed. Each title is paired with the dose of its own item, the items
+        without a dose are skipped.
         """
-        points, values = [], []
-        region_points = tuple(point for point in Point if point.region == region)
+        records, timestamp = [], None
+        source = BytesIO(markup.encode(UTF))
 
-        for point, value in self.get_points_with_radiation_level().items():
-            if point in [monitoring_point.label for monitoring_point in region_points]:
-                points.append(point)
-                values.append(value)
+        for _, element in etree.iterparse(source, tag=("item", "lastBuildDate")):
+            if element.tag == "lastBuildDate":
+                timestamp = parsedate_to_datetime(element.text.strip())
+                continue
 
-        return RegionInfoDTO(region=region, info=dict(zip(points, values)))
+            title, value = element.findtext("title"), element.findtext("rad")
+            if title and value:
+                records.append((title.strip(), float(value)))
 
-    def _get_source(self, url: str | None = None) -> BeautifulSoup | None:
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+        return records, timestamp
+
+    @staticmethod
+    def _extract_status(markup: str) -> str | None:
         """
-        Private method that calls API for getting HTML & XML markup of the web resource
-        and return object of the BeautifulSoup class.
+        Private method that finds the radiation monitoring status line in the HTML
+        markup of the web resource. The markup is fed to the pull parser in chunks
+        and parsing stops at the first element whose text starts with the status
+        prefix, so the rest of the page is never parsed.
         """
-        match url:
-            case str() as uri if not uri.endswith(".xml"):
-                markup = self.api.get_html(uri)
-                formatter = "lxml"
-            case _:
-                markup = self.api.get_xml(url)
-                formatter = "lxml-xml"
-        return BeautifulSoup(markup, features=formatter) if markup else None
+        parser = etree.HTMLPullParser(events=("end",))
+
+        for start in range(0, len(markup), STATUS_CHUNK_SIZE):
+            parser.feed(markup[start : start + STATUS_CHUNK_SIZE])
+            for _, element in parser.read_events():
+                if element.text and element.text.startswith(STATUS_PREFIX):
+                    text = "".join(element.itertext())
+                    return text.replace("\xa0", " ").replace("  ", " ")
+        return None
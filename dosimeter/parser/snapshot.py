@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Iterable, Mapping, TypeAlias
+
+from dosimeter.constants import LABELS_BY_REGION, Region
+from dosimeter.parser.stats import RadiationStats, Stats
+
+PowerOfRadiation: TypeAlias = float
+ObservePoint: TypeAlias = str
+NameOfRegion: TypeAlias = str
+
+
+@dataclass
+class RegionInfoDTO:
+    """
+    Class representing Data Transfer Object for region's information.
+    """
+
+    region: Region
+    info: dict[ObservePoint, PowerOfRadiation]
+    stats: Stats | None = None
+    version: str | None = None
+
+
+@dataclass(frozen=True)
+class RadiationSnapshot:
+    """
+    Immutable value object built once per upstream fetch of the radiation.xml
+    document and shared between all the handlers.
+    """
+
+    points: Mapping[ObservePoint, PowerOfRadiation]
+    regions: Mapping[Region, Mapping[ObservePoint, PowerOfRadiation]]
+    mean: PowerOfRadiation
+    stats: RadiationStats
+    timestamp: datetime | None = None
+    version: str | None = None
+    status: str | None = None
+
+    @classmethod
+    def create(
+        cls,
+        records: Iterable[tuple[ObservePoint, PowerOfRadiation]],
+        timestamp: datetime | None = None,
+        version: str | None = None,
+        status: str | None = None,
+    ) -> "RadiationSnapshot":
+        """
+        The method groups (point, dose) records by region in the order of the
+        LABELS_BY_REGION index and computes the statistics of every region and
+        of all the monitoring points.
+        """
+        points = dict(records)
+        regions = {
+            region: {label: points[label] for label in labels if label in points}
+            for region, labels in LABELS_BY_REGION.items()
+        }
+
+        stats = RadiationStats.compute(regions, total=points.values())
+
+        return cls(
+            points=MappingProxyType(points),
+            regions=MappingProxyType(
+                {region: MappingProxyType(info) for region, info in regions.items()}
+            ),
+            mean=stats.total.mean,
+            stats=stats,
+            timestamp=timestamp,
+            version=version,
+            status=status,
+        )
+
+    def get_region_info(self, region: Region) -> RegionInfoDTO:
+        """
+        The method returns the monitoring points of the region together with
+        the power values of the equivalent radiation dose.
+        """
+        return RegionInfoDTO(
+            region=region,
+            info=dict(self.regions[region]),
+            stats=self.stats.regions.get(region),
+            version=self.version,
+        )
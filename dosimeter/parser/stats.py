@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from itertools import chain
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+import numpy as np
+import numpy.typing as npt
+
+from dosimeter.constants import Region
+
+PERCENTILES: tuple[int, ...] = (10, 25, 75, 90)
+
+
+@dataclass(frozen=True)
+class Stats:
+    """
+    Class representing the descriptive statistics of the radiation dose rate
+    readings of a group of monitoring points.
+    """
+
+    count: int
+    mean: float
+    median: float
+    min: float
+    max: float
+    std: float
+    percentiles: Mapping[int, float]
+
+
+@dataclass(frozen=True)
+class RadiationStats:
+    """
+    Class representing the statistics of every region together with the national
+    total, computed once per snapshot.
+    """
+
+    regions: Mapping[Region, Stats]
+    total: Stats
+
+    @classmethod
+    def compute(
+        cls,
+        readings: Mapping[Region, Mapping[str, float]],
+        total: Iterable[float] | None = None,
+    ) -> "RadiationStats":
+        """
+        The method computes the statistics of all the regions in one vectorized pass
+        over the readings grouped by region. The national total is computed as one
+        more group holding all the readings (or the given ones). Regions without
+        readings are skipped, the standard deviation is the population one.
+        """
+        regions = [region for region, info in readings.items() if info]
+        groups = [list(readings[region].values()) for region in regions]
+        groups.append(
+            list(total) if total is not None else list(chain.from_iterable(groups))
+        )
+        assert groups[-1], "Unable to compute statistics without readings."
+
+        counts = np.fromiter((len(group) for group in groups), dtype=np.intp)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        values = np.fromiter(chain.from_iterable(groups), dtype=np.float64)
+        codes = np.repeat(np.arange(len(groups)), counts)
+        values = values[np.lexsort((values, codes))]
+
+        sums = np.add.reduceat(values, offsets)
+        means = sums / counts
+        deviations = values - np.repeat(means, counts)
+        stds = np.sqrt(np.add.reduceat(deviations**2, offsets) / counts)
+        minimums = values[offsets]
+        maximums = values[offsets + counts - 1]
+        quantiles = {
+            q: cls._quantile(values, offsets, counts, q / 100)
+            for q in (50, *PERCENTILES)
+        }
+
+        stats = [
+            Stats(
+                count=int(counts[i]),
+                mean=float(means[i]),
+                median=float(quantiles[50][i]),
+                min=float(minimums[i]),
+                max=float(maximums[i]),
+                std=float(stds[i]),
+                percentiles=MappingProxyType(
+                    {q: float(quantiles[q][i]) for q in PERCENTILES}
+                ),
+            )
+            for i in range(len(groups))
+        ]
+        return cls(
+            regions=MappingProxyType(dict(zip(regions, stats))),
+            total=stats[-1],
+        )
+
+    @staticmethod
+    def _quantile(
+        values: npt.NDArray[np.float64],
+        offsets: npt.NDArray[np.intp],
+        counts: npt.NDArray[np.intp],
+        q: float,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Private method that returns the q-th quantile of every sorted group using
+        linear interpolation between the closest ranks.
+        """
+        position = offsets + (counts - 1) * q
+        lower = np.floor(position).astype(np.intp)
+        upper = np.ceil(position).astype(np.intp)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
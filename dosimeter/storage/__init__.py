@@ -1,9 +1,11 @@
 from dosimeter.storage.file import FileRepository
 from dosimeter.storage.mongo import CloudMongoDataBase
 from dosimeter.storage.repository import Repository
+from dosimeter.storage.sqlite import SQLiteRepository
 
 __all__ = (
     "FileRepository",
     "CloudMongoDataBase",
     "Repository",
+    "SQLiteRepository",
 )
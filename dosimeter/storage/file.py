@@ -1,6 +1,10 @@
 import abc
+import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Any, TextIO
 
 from pydantic import ValidationError
 from telegram import User
@@ -20,6 +24,10 @@ logger = CustomAdapter(get_logger(__name__), {"user_id": manager.get_one()})
 class FileRepository(Repository, abc.ABC):
     """
     Class for representation JSON file repository.
+    The users are kept in the in-memory index loaded once from the JSON snapshot
+    file. Every change is appended to the NDJSON journal next to it, and the journal
+    is folded into the snapshot after a number of records (compaction). The records
+    are numbered, so the ones already folded into the snapshot are skipped on replay.
     """
 
     LOG_MSG = "Action '%s' added to the file repo."
@@ -31,20 +39,29 @@ class FileRepository(Repository, abc.ABC):
             asym_cypher if config.enc.isAsymmetric else sym_cypher
         ),
         control: AdminManager = InternalAdminManager(),
+        compact_every: int = config.repo.compact_every,
     ) -> None:
         """
         Instantiate a FileRepository instance.
         """
 
         self.repo = JSONFileManager(path_to_file)
+        self.journal = path_to_file.with_suffix(config.repo.journal_suffix)
         self.cypher = cypher
         self.manager = control
+        self.compact_every = compact_every
+        self._lock = threading.Lock()
 
-        if Path(self.repo.file).exists() and self.repo.read():
-            return
+        if not (Path(self.repo.file).exists() and self.repo.read()):
+            self.repo.write({"users": []})
+            logger.info("File repository initialized by path %s" % self.repo.file)
 
-        self.repo.write({"users": []})
-        logger.info("File repository initialized by path %s" % self.repo.file)
+        self._users: dict[int, dict[str, Any]] = {}
+        self._seq = self._pending = 0
+        torn = self._replay()
+        self._journal: TextIO = open(self.journal, "a", encoding=config.repo.encoding)
+        if torn:
+            self._journal.write("\n")
 
     def __str__(self) -> str:
         """
@@ -60,13 +77,13 @@ class FileRepository(Repository, abc.ABC):
         """
 
         if not self._has_user(user.id):
-            data = self.repo.read()
-            data["users"].append(self._create(user))
-            self.repo.write(data)
-            logger.info(
-                "Data about new user, placed in the collection",
-                user_id=self.manager.get_one(user.id),
-            )
+            document = self._create(user)
+            if document:
+                self._append({"user": document})
+                logger.info(
+                    "Data about new user, placed in the collection",
+                    user_id=self.manager.get_one(user.id),
+                )
 
         self._update(user.id, action)
         logger.info(self.LOG_MSG % action, user_id=self.manager.get_one(user.id))
@@ -75,12 +92,11 @@ class FileRepository(Repository, abc.ABC):
         """
         Method for getting the number of users from the file repo.
         """
-        data = self.repo.read()
         logger.debug(
-            "Users count in the database: %d" % len(data["users"]),
+            "Users count in the database: %d" % len(self._users),
             user_id=self.manager.get_one(user.id) if user else None,
         )
-        return len(data["users"])
+        return len(self._users)
 
     def get(self, user_id: int | str) -> DocumentType | str:  # type: ignore[return]
         """
@@ -96,13 +112,36 @@ class FileRepository(Repository, abc.ABC):
             case _:
                 raise ValueError("ID must be an integer, a positive number.")
 
+    def compact(self) -> None:
+        """
+        Method for folding the journal into the snapshot file. The snapshot is
+        replaced atomically and only then the journal is truncated.
+        """
+        with self._lock:
+            temp = self.repo.file.with_name(self.repo.file.name + ".tmp")
+            with open(temp, "w", encoding=config.repo.encoding) as file:
+                json.dump(
+                    {"users": list(self._users.values()), "seq": self._seq},
+                    file,
+                    separators=(",", ":"),
+                )
+            os.replace(temp, self.repo.file)
+            self._journal.truncate(0)
+            self._pending = 0
+        logger.info("Journal compacted into the file %s" % self.repo.file)
+
+    def close(self) -> None:
+        """
+        Method for closing the journal file.
+        """
+        with self._lock:
+            self._journal.close()
+
     def _has_user(self, user_id: int) -> bool:
         """
         Private method for checking if user information is available in the database.
         """
-        data = self.repo.read()
-        user_ids = {user["user_id"] for user in data["users"]}
-        return True if user_id in user_ids else False
+        return user_id in self._users
 
     def _create(self, user: User) -> DocumentType | None:
         """
@@ -133,25 +172,71 @@ class FileRepository(Repository, abc.ABC):
         """
         Private method for obtaining user object by id from the file repository.
         """
-        data = self.repo.read()
-        for user in data["users"]:
-            if user["user_id"] == idf:
-                logger.debug(f"Info about the user: {user}")
-                return user
+        if user := self._users.get(idf):
+            logger.debug(f"Info about the user: {user}")
+            return user
         return "User does not exist."
 
     def _update(self, idf: int, action: Action) -> None:
         """
         Private method for adding info about a user's action to the file storage.
         """
+        if idf in self._users:
+            self._append(
+                {"user_id": idf, "action": action.value, "ts": self._time_stamp()}
+            )
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        """
+        Private method for applying the journal record to the users index.
+        """
+        if "user" in record:
+            self._users[record["user"]["user_id"]] = record["user"]
+        elif user := self._users.get(record["user_id"]):
+            user.setdefault(record["action"], []).append(record["ts"])
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """
+        Private method for applying the record and writing it to the journal.
+        The journal is compacted once it has enough records.
+        """
+        with self._lock:
+            self._seq += 1
+            self._pending += 1
+            record["seq"] = self._seq
+            self._apply(record)
+            self._journal.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._journal.flush()
+            compact = self._pending >= self.compact_every
+
+        if compact:
+            self.compact()
+
+    def _replay(self) -> bool:
+        """
+        Private method for loading the snapshot and replaying the journal records
+        written after it. A torn record at the end of the journal is skipped, and
+        True is returned if the journal doesn't end with a line break.
+        """
         data = self.repo.read()
-        for item in data["users"]:
-            if idf == item["user_id"]:
-                if action in item.keys():
-                    item[action].append(self._time_stamp())
-                else:
-                    item[action] = [self._time_stamp()]
-                self.repo.write(data)
+        self._users = {user["user_id"]: user for user in data["users"] if user}
+        self._seq = data.get("seq", 0)
+        if not self.journal.exists():
+            return False
+
+        line = ""
+        with open(self.journal, "r", encoding=config.repo.encoding) as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipped a torn record of the journal %s" % line)
+                    continue
+                if record["seq"] > self._seq:
+                    self._seq = record["seq"]
+                    self._pending += 1
+                    self._apply(record)
+        return bool(line) and not line.endswith("\n")
 
     @staticmethod
     def _time_stamp() -> str:
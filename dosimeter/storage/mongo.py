@@ -1,11 +1,15 @@
 import abc
+import atexit
+import math
+import threading
 from datetime import datetime
-from typing import ParamSpec
+from typing import Any, ParamSpec
 
 from pydantic import ValidationError
-from pymongo import MongoClient
+from pymongo import ASCENDING, MongoClient, UpdateOne
+from pymongo.collection import Collection
 from pymongo.database import Database
-from pymongo.errors import ConfigurationError, ConnectionFailure
+from pymongo.errors import ConfigurationError, ConnectionFailure, PyMongoError
 from telegram import User
 
 from dosimeter.admin import AdminManager, InternalAdminManager, manager
@@ -15,11 +19,102 @@ from dosimeter.constants import Action
 from dosimeter.encryption import BaseCryptographer, asym_cypher, sym_cypher
 from dosimeter.storage.repository import DocumentType, Repository
 from dosimeter.storage.schema import MongoCollectionDataSchema
+from dosimeter.utils.cache import TTLCache
 
 P = ParamSpec("P")
 
 logger = CustomAdapter(get_logger(__name__), {"user_id": manager.get_one()})
 
+USER_ID_INDEX = "user_id_unique"
+# The number of the encrypted profiles of the recent users kept in memory.
+PROFILE_CACHE_SIZE = 4096
+# The profile fields of the user without the timestamps of the actions.
+PROFILE_PROJECTION = {
+    "_id": 0,
+    "user_id": 1,
+    "first_name": 1,
+    "last_name": 1,
+    "user_name": 1,
+}
+
+
+class WriteBuffer(object):
+    """
+    A buffer that groups the writes to the collection into a single bulk_write.
+    The buffer is flushed once it holds the number of operations or by the timer
+    after the interval in milliseconds, whichever comes first. The operations are
+    written in order, so the actions of each user keep their sequence, and one
+    batch at a time. The rest of the operations is flushed at exit.
+    """
+
+    def __init__(self, collection: Collection, size: int, interval: int) -> None:
+        """
+        Instantiate a WriteBuffer object.
+        """
+        self.collection = collection
+        self.size = size
+        self.interval = interval
+        self._operations: list[UpdateOne] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._timer = threading.Thread(target=self._run, daemon=True)
+        self._timer.start()
+        atexit.register(self.close)
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, operation: UpdateOne) -> None:
+        """
+        The method puts the operation into the buffer and flushes the buffer once
+        it's full.
+        """
+        with self._lock:
+            self._operations.append(operation)
+            full = len(self._operations) >= self.size
+
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        The method writes all the buffered operations with a single bulk_write.
+        The flushes by the timer and by the size are serialized, so the batches
+        are written in the order they're taken from the buffer.
+        """
+        with self._flush_lock:
+            with self._lock:
+                operations, self._operations = self._operations, []
+
+            if not operations:
+                return
+            try:
+                self.collection.bulk_write(operations, ordered=True)
+            except PyMongoError as ex:
+                logger.exception(
+                    "Unable to write %d buffered operations. Raised exception: %s"
+                    % (len(operations), ex)
+                )
+
+    def close(self) -> None:
+        """
+        The method stops the timer and flushes the rest of the operations.
+        The handler registered at exit is removed, so the closed buffers don't
+        pile up in it.
+        """
+        atexit.unregister(self.close)
+        self._closed.set()
+        self._timer.join()
+        self.flush()
+
+    def _run(self) -> None:
+        """
+        Private method that flushes the buffer every interval until it's closed.
+        """
+        while not self._closed.wait(self.interval / 1_000):
+            self.flush()
+
 
 class CloudMongoDataBase(Repository, abc.ABC):
     """
@@ -44,9 +139,13 @@ class CloudMongoDataBase(Repository, abc.ABC):
             asym_cypher if config.enc.isAsymmetric else sym_cypher
         ),
         control: AdminManager = InternalAdminManager(),
+        database: Database | None = None,
+        bulk_size: int = config.db.bulk_size,
+        bulk_interval: int = config.db.bulk_interval,
     ) -> None:
         """
         Constructor method for initializing objects of the CloudMongoDataBase class.
+        The writes are buffered and sent with bulk_write if the bulk size is set.
         """
 
         def _get_connection() -> Database:
@@ -67,9 +166,20 @@ class CloudMongoDataBase(Repository, abc.ABC):
             logger.info(f"Info about Server: {client.server_info()}")
             return client.users_db
 
-        self.mdb = _get_connection()
+        self.mdb = database if database is not None else _get_connection()
         self.cypher = cypher
         self.manager = control
+        self._create_indexes()
+        self._profiles: TTLCache[DocumentType] = TTLCache(
+            ttl=math.inf, maxsize=PROFILE_CACHE_SIZE, stale_while_revalidate=False
+        )
+        if getattr(self, "buffer", None) is not None:
+            self.buffer.close()
+        self.buffer = (
+            WriteBuffer(self.mdb.users, bulk_size, bulk_interval)
+            if bulk_size > 0
+            else None
+        )
 
     def __del__(self) -> None:
         """
@@ -81,13 +191,30 @@ class CloudMongoDataBase(Repository, abc.ABC):
     def put(self, user: User, action: Action) -> None:
         """
         Method for adding information to the database about the user's call
-        to the command.
+        to the command. The document of a new user is inserted by the same upsert
+        that pushes the action, so it's a single round-trip or a part of the bulk.
         """
-        if not self.mdb.users.find_one({"user_id": user.id}):
-            self.mdb.users.insert_one(self._create(user))
-        self._update(user.id, action)
+        query, update = self._update(user, action)
+        if self.buffer is not None:
+            self.buffer.add(UpdateOne(query, update, upsert=True))
+        else:
+            self.mdb.users.update_one(query, update, upsert=True)
         logger.info(self.LOG_MSG % action, user_id=self.manager.get_one(user.id))
 
+    def flush(self) -> None:
+        """
+        Method for writing the buffered actions to the database.
+        """
+        if self.buffer is not None:
+            self.buffer.flush()
+
+    def close(self) -> None:
+        """
+        Method for flushing the buffered actions and stopping the buffer timer.
+        """
+        if self.buffer is not None:
+            self.buffer.close()
+
     def get_count(self, user: User | None = None) -> int:
         """
         Method for getting the number of users from the database.
@@ -105,7 +232,7 @@ class CloudMongoDataBase(Repository, abc.ABC):
         """
         notification = "User does not exist."
         query = {"user_id": int(user_id)}
-        user = self.mdb.users.find_one(query)
+        user = self.mdb.users.find_one(query, PROFILE_PROJECTION)
         logger.debug(f"Info about the user: {user if user else notification}")
         return user if user else notification
 
@@ -132,10 +259,28 @@ class CloudMongoDataBase(Repository, abc.ABC):
             Last name:  {user_data.get("last_name")}
             User name:  {user_data.get("user_name")}
             """
-            for num, user_data in enumerate(self.mdb.users.find(), 1)
+            for num, user_data in enumerate(
+                self.mdb.users.find({}, PROFILE_PROJECTION), 1
+            )
         ]
         return "\n\n".join(response)
 
+    def _create_indexes(self) -> None:
+        """
+        Private method that creates the unique index on the user ID, so the lookups,
+        the upserts and the distinct user IDs don't scan the collection. Creating
+        the existing index is a no-op, so it's safe on every startup.
+        """
+        try:
+            self.mdb.users.create_index(
+                [("user_id", ASCENDING)], unique=True, name=USER_ID_INDEX
+            )
+        except PyMongoError as ex:
+            logger.exception(
+                "Unable to create the index '%s'. Raised exception: %s"
+                % (USER_ID_INDEX, ex)
+            )
+
     def _create(self, user: User) -> DocumentType | None:
         """
         Method for creating a document base stored in a data collection.
@@ -157,19 +302,27 @@ class CloudMongoDataBase(Repository, abc.ABC):
         logger.info("New collection created", user_id=self.manager.get_one(user.id))
         return collection.dict() if collection else None
 
-    def _update(self, user_id: int, field: str) -> None:
+    def _update(self, user: User, field: str) -> tuple[dict[str, Any], dict[str, Any]]:
         """
-        Private method for adding the current date of the corresponding field of the
-        data collection.
+        Private method that returns the filter and the update of the upsert adding
+        the current date of the corresponding field of the data collection.
+        The encrypted profile is set only if the document of the user is inserted.
+        It's sent with every upsert, so a failed write doesn't leave the document
+        without the profile, and it's built once for the recent users, the least
+        recently used profiles are evicted.
         """
-        self.mdb.users.update_one(
-            {"user_id": user_id},
-            {
-                "$push": {
-                    field: datetime.today().strftime("%Y-%m-%d %H:%M:%S"),
-                },
+        update: dict[str, Any] = {
+            "$push": {
+                field: datetime.today().strftime("%Y-%m-%d %H:%M:%S"),
             },
-        )
+        }
+        if document := self._profiles.get(user.id, lambda: self._create(user)):
+            update["$setOnInsert"] = {
+                key: value
+                for key, value in document.items()
+                if key not in ("user_id", field)
+            }
+        return {"user_id": user.id}, update
 
 
 if __name__ == "__main__":
@@ -57,3 +57,9 @@ class FileCollectionDataSchema(BaseCollectionDataSchema):
 
     # validators
     _check_date = validator("create_at", allow_reuse=True)(check_date)
+
+
+class SQLiteCollectionDataSchema(FileCollectionDataSchema):
+    """
+    Schema for the rows of the users table in SQLite DB.
+    """
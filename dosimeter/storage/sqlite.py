@@ -0,0 +1,225 @@
+import abc
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+from telegram import User
+
+from dosimeter.admin import AdminManager, InternalAdminManager, manager
+from dosimeter.config import config
+from dosimeter.config.logging import CustomAdapter, get_logger
+from dosimeter.constants import Action
+from dosimeter.encryption import BaseCryptographer, asym_cypher, sym_cypher
+from dosimeter.storage.repository import DocumentType, Repository
+from dosimeter.storage.schema import SQLiteCollectionDataSchema
+
+logger = CustomAdapter(get_logger(__name__), {"user_id": manager.get_one()})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id    INTEGER PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name  TEXT,
+    user_name  TEXT NOT NULL,
+    create_at  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    id      INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (user_id),
+    action  TEXT NOT NULL,
+    ts      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_user_id_action_ts ON events (user_id, action, ts);
+CREATE INDEX IF NOT EXISTS events_action_ts ON events (action, ts);
+"""
+
+# The statements are constant strings, so sqlite3 prepares each of them once
+# per connection and reuses it from the statement cache.
+HAS_USER = "SELECT 1 FROM users WHERE user_id = ?"
+INSERT_USER = (
+    "INSERT OR IGNORE INTO users "
+    "(user_id, first_name, last_name, user_name, create_at) "
+    "VALUES (:user_id, :first_name, :last_name, :user_name, :create_at)"
+)
+INSERT_EVENT = "INSERT INTO events (user_id, action, ts) VALUES (?, ?, ?)"
+SELECT_USER = (
+    "SELECT user_id, first_name, last_name, user_name, create_at "
+    "FROM users WHERE user_id = ?"
+)
+SELECT_EVENTS = "SELECT action, ts FROM events WHERE user_id = ? ORDER BY action, ts"
+COUNT_USERS = "SELECT COUNT(*) FROM users"
+COUNT_ACTIONS = "SELECT COUNT(*) FROM events WHERE action = ?"
+COUNT_USER_ACTIONS = "SELECT COUNT(*) FROM events WHERE user_id = ? AND action = ?"
+
+
+class SQLiteRepository(Repository, abc.ABC):
+    """
+    SQLite database repository. The users are kept in the table keyed by user_id
+    and their actions in the events table indexed on (user_id, action, ts), so
+    the counts and the lookups are indexed queries. The database is opened in
+    the WAL mode, so reading doesn't block writing.
+    """
+
+    LOG_MSG = "Action '%s' added to SQLite DB."
+
+    def __init__(
+        self,
+        path_to_file: Path = config.sqlite.path,
+        cypher: BaseCryptographer = (
+            asym_cypher if config.enc.isAsymmetric else sym_cypher
+        ),
+        control: AdminManager = InternalAdminManager(),
+    ) -> None:
+        """
+        Instantiate a SQLiteRepository instance.
+        """
+        self.path = path_to_file
+        self.cypher = cypher
+        self.manager = control
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            self.path,
+            timeout=config.sqlite.timeout,
+            check_same_thread=False,
+        )
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+        logger.info("SQLite repository initialized by path %s" % self.path)
+
+    def __str__(self) -> str:
+        """
+        Method returns a printable string representation
+        of an instantiated object of the SQLiteRepository class.
+        """
+        return "SQLite repository by path: %s" % self.path
+
+    def put(self, user: User, action: Action) -> None:
+        """
+        Method for adding information to the database about the user's call
+        to the command. The user and the action are written in one transaction.
+        """
+        with self._lock:
+            exists = self._has_user(user.id)
+        document = None if exists else self._create(user)
+
+        with self._lock, self.connection:
+            if document and self.connection.execute(INSERT_USER, document).rowcount:
+                logger.info(
+                    "Data about new user, placed in the collection",
+                    user_id=self.manager.get_one(user.id),
+                )
+            if exists or document:
+                self.connection.execute(
+                    INSERT_EVENT, (user.id, action.value, self._time_stamp())
+                )
+        logger.info(self.LOG_MSG % action, user_id=self.manager.get_one(user.id))
+
+    def get_count(self, user: User | None = None) -> int:
+        """
+        Method for getting the number of users from the database.
+        """
+        with self._lock:
+            (users_count,) = self.connection.execute(COUNT_USERS).fetchone()
+        logger.debug(
+            "Users count in the database: %d" % users_count,
+            user_id=self.manager.get_one(user.id) if user else None,
+        )
+        return users_count
+
+    def get_action_count(self, action: Action, user_id: int | None = None) -> int:
+        """
+        Method for getting the number of the action calls by all the users or by
+        the user with the id.
+        """
+        with self._lock:
+            if user_id is None:
+                cursor = self.connection.execute(COUNT_ACTIONS, (action.value,))
+            else:
+                cursor = self.connection.execute(
+                    COUNT_USER_ACTIONS, (user_id, action.value)
+                )
+            (actions_count,) = cursor.fetchone()
+        return actions_count
+
+    def get(self, user_id: int | str) -> DocumentType | str:  # type: ignore[return]
+        """
+        Public method for getting info about the user by id from the database.
+        """
+        match user_id:
+            case int() as idf if idf >= 0:
+                return self._obtain(idf)
+            case str() as idf if idf.strip().isdigit():
+                return self._obtain(int(idf))
+            case str() as idf if not idf.strip().isdigit():
+                raise ValueError("The string must consist of digits.")
+            case _:
+                raise ValueError("ID must be an integer, a positive number.")
+
+    def close(self) -> None:
+        """
+        Method for closing the connection to the database.
+        """
+        with self._lock:
+            self.connection.close()
+
+    def _has_user(self, user_id: int) -> bool:
+        """
+        Private method for checking if user information is available in the database.
+        """
+        return self.connection.execute(HAS_USER, (user_id,)).fetchone() is not None
+
+    def _create(self, user: User) -> DocumentType | None:
+        """
+        Private method for creating a row stored in the users table.
+        """
+        data = {
+            "user_id": user.id,
+            "first_name": self.cypher.encrypt(user.first_name),
+            "last_name": self.cypher.encrypt(user.last_name),
+            "user_name": self.cypher.encrypt(user.username),
+            "create_at": self._time_stamp(),
+        }
+        try:
+            collection = SQLiteCollectionDataSchema(**data)
+        except ValidationError as exc:
+            logger.exception(
+                "Validation error. Raised exception: %s" % exc,
+                user_id=self.manager.get_one(user.id) if user else None,
+            )
+            collection = None
+        logger.info(
+            "New collection created",
+            user_id=self.manager.get_one(user.id) if user else None,
+        )
+        return collection.dict() if collection else None
+
+    def _obtain(self, idf: int) -> DocumentType | str:
+        """
+        Private method for obtaining user object by id from the database together
+        with the timestamps of the actions.
+        """
+        with self._lock:
+            row = self.connection.execute(SELECT_USER, (idf,)).fetchone()
+            if not row:
+                return "User does not exist."
+            events = self.connection.execute(SELECT_EVENTS, (idf,)).fetchall()
+
+        user: dict[str, int | str | None | list[str]] = dict(row)
+        for action, ts in events:
+            user.setdefault(action, []).append(ts)  # type: ignore[union-attr]
+        logger.debug(f"Info about the user: {user}")
+        return user
+
+    @staticmethod
+    def _time_stamp() -> str:
+        """
+        Static method that returns a string object of the current date
+        and time in a specific format.
+        """
+        return datetime.now().strftime(config.app.date_format)
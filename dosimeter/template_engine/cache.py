@@ -0,0 +1,81 @@
+import math
+import pathlib
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from telegram import ReplyMarkup
+
+from dosimeter.config import config
+from dosimeter.template_engine.engine import TemplateEngine
+from dosimeter.utils.cache import CacheInfo, TTLCache
+
+MESSAGE_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class RenderedMessage:
+    """
+    Class representing the final text of the message and its keyboard serialized
+    to JSON, which the Bot API accepts as is.
+    """
+
+    text: str
+    reply_markup: str | None = None
+
+
+class MessageCache(object):
+    """
+    Cache of the messages that are the same for every user, in front of
+    the TemplateEngine. The messages are keyed by the template, the version of
+    the data they show (e.g. the radiation snapshot) and the locale, so a new
+    version is rendered once and then every reply is a dictionary lookup.
+    """
+
+    def __init__(
+        self,
+        engine: TemplateEngine,
+        locale: str = config.app.locale,
+        maxsize: int = MESSAGE_CACHE_SIZE,
+    ) -> None:
+        """
+        Instantiate a MessageCache object.
+        """
+        self.engine = engine
+        self.locale = locale
+        self.cache: TTLCache[RenderedMessage] = TTLCache(
+            ttl=math.inf, maxsize=maxsize, stale_while_revalidate=False
+        )
+
+    def get(
+        self,
+        file: pathlib.Path,
+        version: Hashable = None,
+        context: Callable[[], dict[str, Any]] | None = None,
+        reply_markup: Callable[[], ReplyMarkup] | None = None,
+    ) -> RenderedMessage:
+        """
+        The method returns the rendered message of the version. On a miss
+        the template is rendered with the context and the keyboard is built,
+        both factories are not called on a hit.
+        """
+
+        def render() -> RenderedMessage:
+            return RenderedMessage(
+                text=self.engine.render(file, **(context() if context else {})),
+                reply_markup=reply_markup().to_json() if reply_markup else None,
+            )
+
+        key = (file.name, version, self.locale)
+        return self.cache.get(key, render)  # type: ignore[return-value]
+
+    def clear(self) -> None:
+        """
+        The method removes all the rendered messages.
+        """
+        self.cache.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        The method returns the counters of the cache.
+        """
+        return self.cache.info()
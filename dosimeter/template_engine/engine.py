@@ -1,10 +1,19 @@
 import pathlib
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+import jinja2
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    select_autoescape,
+)
 
 from dosimeter.config import config
+from dosimeter.config.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 @dataclass(frozen=True)
@@ -32,11 +41,18 @@ class TemplateEngine(object):
     """
     Message template engine based on API to Jinja2.
     (see more https://jinja.palletsprojects.com/en/3.1.x/api/)
+    All the message templates are compiled once when the engine is created. The
+    bytecode is kept in the cache directory, so a restarted bot or a new worker
+    process loads it instead of compiling the templates again.
     """
 
     APP: str = config.app.name
 
-    def __init__(self, templates_dir_name: str = config.app.templates_dir.stem) -> None:
+    def __init__(
+        self,
+        templates_dir_name: str = config.app.templates_dir.stem,
+        cache_dir: pathlib.Path | None = config.app.templates_cache_dir,
+    ) -> None:
         """
         Constructor method for initializing objects of class TemplateEngine.
         """
@@ -44,11 +60,36 @@ class TemplateEngine(object):
         self.env = Environment(
             loader=PackageLoader(self.APP, self.templates),
             autoescape=select_autoescape(),
+            bytecode_cache=self._get_bytecode_cache(cache_dir),
         )
+        self.compiled: dict[str, jinja2.Template] = {
+            field.default.name: self.env.get_template(field.default.name)
+            for field in fields(Template)
+        }
 
     def render(self, file: pathlib.Path, **kwargs: Any) -> str:
         """
         This method will return the rendered template as a string.
         """
-        template = self.env.get_template(file.name)
+        template = self.compiled.get(file.name) or self.env.get_template(file.name)
         return template.render(**kwargs)
+
+    @staticmethod
+    def _get_bytecode_cache(
+        cache_dir: pathlib.Path | None,
+    ) -> FileSystemBytecodeCache | None:
+        """
+        Private method that creates the cache directory of the templates bytecode.
+        The templates are compiled without the cache if it's unavailable.
+        """
+        if cache_dir is None:
+            return None
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as ex:
+            logger.warning(
+                "Unable to cache the templates bytecode. Raised exception: %s" % ex
+            )
+            return None
+        return FileSystemBytecodeCache(str(cache_dir))
@@ -1,11 +1,14 @@
-from dosimeter.utils.cache import timed_lru_cache
+from dosimeter.utils.cache import TTLCache, ttl_cache
 from dosimeter.utils.decorators import debug_handler, restricted, send_action
 from dosimeter.utils.file_manager import JSONFileManager
+from dosimeter.utils.single_flight import SingleFlight
 
 __all__ = (
     "JSONFileManager",
+    "SingleFlight",
+    "TTLCache",
     "debug_handler",
     "restricted",
     "send_action",
-    "timed_lru_cache",
+    "ttl_cache",
 )
@@ -1,27 +1,198 @@
-from datetime import datetime, timedelta
-from functools import lru_cache, wraps
-from typing import Any, Callable
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Generic, Hashable, TypeVar
 
+from dosimeter.config.logging import get_logger
 
-def timed_lru_cache(seconds: int, maxsize: int = 128) -> Callable[..., Any]:
+logger = get_logger(__name__)
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheEntry(Generic[V]):
+    """
+    Class representing a cached value together with its expiration time.
+    """
+
+    value: V | None
+    expires_at: float
+    revalidating: bool = False
+
+
+@dataclass
+class CacheInfo:
+    """
+    Class representing the counters of the cache.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / requests if requests else 0.0
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe cache with per-key expiry. Positive and negative (None) results
+    have separate lifetimes. An expired positive value is returned immediately while
+    a single background refresh of this key runs (stale-while-revalidate).
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        negative_ttl: float = 0,
+        maxsize: int = 128,
+        stale_while_revalidate: bool = True,
+    ) -> None:
+        """
+        Instantiate a TTLCache object.
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self.stale_while_revalidate = stale_while_revalidate
+        self._entries: OrderedDict[Hashable, CacheEntry[V]] = OrderedDict()
+        self._info = CacheInfo()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, loader: Callable[[], V | None]) -> V | None:
+        """
+        The method returns the cached value by key. On a miss the value is obtained
+        from the loader, on expiry of a positive value the stale one is returned
+        and the loader is called in the background.
+        """
+        now, stale, revalidate = time.monotonic(), False, False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now < entry.expires_at:
+                self._entries.move_to_end(key)
+                self._info.hits += 1
+                return entry.value
+            if entry and entry.value is not None and self.stale_while_revalidate:
+                self._entries.move_to_end(key)
+                self._info.stale_hits += 1
+                stale, revalidate = True, not entry.revalidating
+                entry.revalidating = True
+                value = entry.value
+            else:
+                self._info.misses += 1
+
+        if revalidate:
+            threading.Thread(
+                target=self._revalidate, args=(key, loader), daemon=True
+            ).start()
+        if stale:
+            return value
+
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: V | None) -> None:
+        """
+        The method puts the value into the cache with a lifetime depending on
+        whether the value is negative (None) or not.
+        """
+        ttl = self.ttl if value is not None else self.negative_ttl
+        with self._lock:
+            self._entries[key] = CacheEntry(
+                value=value, expires_at=time.monotonic() + ttl
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._info.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        The method removes the value from the cache by key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        The method removes all values from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        The method returns a copy of the cache counters.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._info.hits,
+                stale_hits=self._info.stale_hits,
+                misses=self._info.misses,
+                evictions=self._info.evictions,
+                size=len(self._entries),
+            )
+
+    def _revalidate(self, key: Hashable, loader: Callable[[], V | None]) -> None:
+        """
+        Private method that refreshes the expired value in the background. If the
+        loader fails, the stale value is kept and retried after the negative TTL.
+        """
+        try:
+            value = loader()
+        except Exception as ex:
+            logger.exception(
+                "Unable to revalidate cached value. Raised exception: %s" % ex
+            )
+            value = None
+
+        if value is not None:
+            self.set(key, value)
+            return
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                entry.expires_at = time.monotonic() + self.negative_ttl
+                entry.revalidating = False
+
+
+def ttl_cache(
+    ttl: float,
+    negative_ttl: float = 0,
+    maxsize: int = 128,
+    stale_while_revalidate: bool = True,
+) -> Callable[..., Any]:
     """
-    The cache returns the result to the request only if the record caching
-    period has not expired yet.
+    The decorator caches the results of the function in the TTLCache object,
+    which is available through the 'cache' attribute of the decorated function.
+    The cached result of the arguments is dropped by the 'invalidate' attribute.
     """
 
     def wrapper_cache(func: Callable[..., Any]) -> Callable[..., Any]:
-        func = lru_cache(maxsize=maxsize)(func)
-        func.lifetime = timedelta(seconds=seconds)  # type: ignore[attr-defined]
-        func.expiration = datetime.utcnow() + func.lifetime  # type: ignore
+        cache: TTLCache = TTLCache(ttl, negative_ttl, maxsize, stale_while_revalidate)
 
         @wraps(func)
-        def wrapped_func(*args: Any, **kwargs: Any) -> Callable[..., Any]:
-            if datetime.utcnow() >= func.expiration:  # type: ignore[attr-defined]
-                func.cache_clear()
-                func.expiration = datetime.utcnow() + func.lifetime  # type: ignore
+        def wrapped_func(*args: Any, **kwargs: Any) -> Any:
+            key = (args, tuple(sorted(kwargs.items())))
+            return cache.get(key, lambda: func(*args, **kwargs))
 
-            return func(*args, **kwargs)
+        def invalidate(*args: Any, **kwargs: Any) -> None:
+            cache.invalidate((args, tuple(sorted(kwargs.items()))))
 
+        wrapped_func.cache = cache  # type: ignore[attr-defined]
+        wrapped_func.invalidate = invalidate  # type: ignore[attr-defined]
         return wrapped_func
 
     return wrapper_cache
@@ -0,0 +1,56 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class Call:
+    """
+    Class representing a call in flight and its outcome.
+    """
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+class SingleFlight(object):
+    """
+    A class that coalesces concurrent calls with the same key: the first caller
+    executes the function, the rest wait for it and receive the same result.
+    """
+
+    def __init__(self) -> None:
+        """
+        Instantiate a SingleFlight object.
+        """
+        self._calls: dict[Hashable, Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        The method executes the function once for all concurrent callers with
+        the same key and returns its result (or raises its exception) to each of them.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = Call()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
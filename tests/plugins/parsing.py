@@ -2,7 +2,6 @@ from pathlib import Path
 from typing import Callable, TypeAlias
 
 import pytest
-from bs4 import BeautifulSoup
 
 from dosimeter.constants import Point, Region
 from dosimeter.parser import NameOfRegion, ObservePoint, PowerOfRadiation, RegionInfoDTO
@@ -27,21 +26,6 @@ def assign_id(fixture_value: str) -> str:
     return identifiers[fixture_value]
 
 
-@pytest.fixture()
-def get_markup_from_file() -> Callable[[Path], BeautifulSoup]:
-    """
-    Returns the BeautifulSoup object, which is a parsed html or xml document as a whole.
-    """
-
-    def factory(file_name: Path) -> BeautifulSoup:
-        with open(file_name) as file:
-            formatter = "lxml-xml" if file_name.suffix == ".xml" else "lxml"
-            soup = BeautifulSoup(file, features=formatter)
-        return soup
-
-    return factory
-
-
 @pytest.fixture()
 def get_text_from_file() -> Callable[[Path], str]:
     """
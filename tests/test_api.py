@@ -1,3 +1,6 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from pathlib import Path
 from typing import Callable
@@ -167,3 +170,165 @@ class TestApi(object):
         assert httpretty.last_request().url == fake_url
         assert not httpretty.last_request().body
         assert not response
+
+    def test_concurrent_get_markup_sends_single_request(self, fake_url: str) -> None:
+        # Arrange
+        barrier = threading.Barrier(8)
+        response = mock.Mock(text="<rad>0.11</rad>")
+
+        def request(uri: str) -> mock.Mock:
+            time.sleep(0.2)
+            return response
+
+        def get_markup(api: Api) -> mock.Mock:
+            barrier.wait()
+            return api._get_markup(fake_url)
+
+        api = Api()
+
+        # Act
+        with mock.patch(
+            "dosimeter.api.external.Api._request", side_effect=request
+        ) as mocked:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(get_markup, [api] * 8))
+
+        # Assert
+        mocked.assert_called_once_with(fake_url)
+        assert all(result is response for result in results)
+
+    def test_concurrent_get_markup_shares_exception(self, fake_url: str) -> None:
+        # Arrange
+        barrier = threading.Barrier(4)
+
+        def request(uri: str) -> None:
+            time.sleep(0.2)
+            raise RuntimeError("upstream failure")
+
+        def get_markup(api: Api) -> str:
+            barrier.wait()
+            try:
+                api._get_markup(fake_url)
+            except RuntimeError as ex:
+                return str(ex)
+            return ""
+
+        api = Api()
+
+        # Act
+        with mock.patch(
+            "dosimeter.api.external.Api._request", side_effect=request
+        ) as mocked:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(get_markup, [api] * 4))
+
+        # Assert
+        mocked.assert_called_once()
+        assert results == ["upstream failure"] * 4
+
+    def test_concurrent_get_markup_per_instance(self, fake_url: str) -> None:
+        # Arrange
+        barrier = threading.Barrier(4)
+
+        def request(uri: str) -> mock.Mock:
+            time.sleep(0.2)
+            return mock.Mock(text="<rad>0.11</rad>")
+
+        def get_markup(api: Api) -> mock.Mock:
+            barrier.wait()
+            return api._get_markup(fake_url)
+
+        first, second = Api(), Api()
+
+        # Act
+        with mock.patch(
+            "dosimeter.api.external.Api._request", side_effect=request
+        ) as mocked:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(get_markup, [first, first, second, second]))
+
+        # Assert
+        assert mocked.call_count == 2
+        assert results[0] is results[1]
+        assert results[2] is results[3]
+        assert results[0] is not results[2]
+
+    @httpretty.activate
+    def test_get_text_sends_conditional_request(self) -> None:
+        # Arrange
+        httpretty.register_uri(
+            method=httpretty.GET,
+            uri=URL.RADIATION,
+            responses=[
+                httpretty.Response(
+                    body="<rad>0.11</rad>",
+                    status=HTTPStatus.OK,
+                    adding_headers={
+                        "ETag": '"v1"',
+                        "Last-Modified": "Wed, 01 Mar 2023 10:00:00 GMT",
+                    },
+                ),
+                httpretty.Response(body="", status=HTTPStatus.NOT_MODIFIED),
+            ],
+        )
+
+        # Act
+        api = Api()
+        first = api._get_text(URL.RADIATION)
+        second = api._get_text(URL.RADIATION)
+
+        # Assert
+        assert first == "<rad>0.11</rad>"
+        assert second is first
+        assert httpretty.last_request().headers["If-None-Match"] == '"v1"'
+        assert (
+            httpretty.last_request().headers["If-Modified-Since"]
+            == "Wed, 01 Mar 2023 10:00:00 GMT"
+        )
+
+    @httpretty.activate
+    def test_invalidate_sends_conditional_request(self) -> None:
+        # Arrange
+        httpretty.register_uri(
+            method=httpretty.GET,
+            uri=URL.RADIATION,
+            responses=[
+                httpretty.Response(
+                    body="<rad>0.11</rad>",
+                    status=HTTPStatus.OK,
+                    adding_headers={"ETag": '"v1"'},
+                ),
+                httpretty.Response(body="", status=HTTPStatus.NOT_MODIFIED),
+            ],
+        )
+        api = Api()
+
+        # Act
+        first = api.get_xml()
+        cached = api.get_xml()
+        api.invalidate()
+        second = api.get_xml()
+
+        # Assert
+        assert first is cached is second
+        assert len(httpretty.latest_requests()) == 2
+        assert httpretty.last_request().headers["If-None-Match"] == '"v1"'
+
+    @httpretty.activate
+    def test_get_text_returns_same_object_for_identical_content(self) -> None:
+        # Arrange
+        httpretty.register_uri(
+            method=httpretty.GET,
+            uri=URL.MONITORING,
+            body="<span>По состоянию на 10:00</span>",
+            status=HTTPStatus.OK,
+        )
+
+        # Act
+        api = Api()
+        first = api._get_text(URL.MONITORING)
+        second = api._get_text(URL.MONITORING)
+
+        # Assert
+        assert second is first
+        assert "If-None-Match" not in httpretty.last_request().headers
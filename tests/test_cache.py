@@ -0,0 +1,143 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from dosimeter.utils import TTLCache, ttl_cache
+
+
+@pytest.mark.cache()
+class TestTTLCache(object):
+    """
+    A class for testing logic encapsulated in the TTLCache class.
+    """
+
+    def test_hit_and_miss(self, fake_string: str) -> None:
+        # Arrange
+        cache: TTLCache[str] = TTLCache(ttl=60)
+        loader = mock.Mock(return_value=fake_string)
+
+        # Act
+        first = cache.get("key", loader)
+        second = cache.get("key", loader)
+
+        # Assert
+        assert first == second == fake_string
+        loader.assert_called_once()
+        assert cache.info().hits == 1
+        assert cache.info().misses == 1
+
+    def test_per_key_expiry(self) -> None:
+        # Arrange
+        cache: TTLCache[int] = TTLCache(ttl=60, stale_while_revalidate=False)
+        cache.get("first", lambda: 1)
+        cache.get("second", lambda: 2)
+
+        # Act
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 61):
+            cache.set("second", 3)
+        first = cache.get("first", lambda: 4)
+        second = cache.get("second", lambda: 5)
+
+        # Assert
+        assert first == 1
+        assert second == 3
+
+    def test_negative_ttl(self) -> None:
+        # Arrange
+        cache: TTLCache[str] = TTLCache(ttl=3_600, negative_ttl=0)
+        loader = mock.Mock(side_effect=[None, "value"])
+
+        # Act
+        first = cache.get("key", loader)
+        second = cache.get("key", loader)
+
+        # Assert
+        assert first is None
+        assert second == "value"
+        assert loader.call_count == 2
+
+    def test_stale_while_revalidate(self) -> None:
+        # Arrange
+        cache: TTLCache[str] = TTLCache(ttl=0)
+        cache.set("key", "stale")
+        started, release = threading.Event(), threading.Event()
+
+        def loader() -> str:
+            started.set()
+            release.wait(timeout=5)
+            return "fresh"
+
+        # Act
+        first = cache.get("key", loader)
+        started.wait(timeout=5)
+        second = cache.get("key", loader)
+        release.set()
+        for _ in range(100):
+            if cache.info().size and not cache._entries["key"].revalidating:
+                break
+            time.sleep(0.01)
+
+        # Assert
+        assert first == second == "stale"
+        assert cache._entries["key"].value == "fresh"
+        assert cache.info().stale_hits == 2
+
+    def test_failed_revalidation_keeps_stale_value(self) -> None:
+        # Arrange
+        cache: TTLCache[str] = TTLCache(ttl=0, negative_ttl=60)
+        cache.set("key", "stale")
+
+        # Act
+        with mock.patch("threading.Thread.start", autospec=True) as mocked:
+            mocked.side_effect = lambda thread: thread.run()
+            first = cache.get("key", lambda: None)
+        second = cache.get("key", lambda: "fresh")
+
+        # Assert
+        assert first == second == "stale"
+        assert cache.info().hits == 1
+
+    def test_eviction(self) -> None:
+        # Arrange
+        cache: TTLCache[int] = TTLCache(ttl=60, maxsize=2)
+
+        # Act
+        for key in range(5):
+            cache.get(key, lambda: key)
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.info().evictions == 3
+        assert set(cache._entries.keys()) == {3, 4}
+
+    def test_decorator(self, fake_integer_number: int) -> None:
+        # Arrange
+        func = mock.Mock(return_value=fake_integer_number)
+        cached = ttl_cache(60)(func)
+
+        # Act
+        results = [cached(1, key="value") for _ in range(3)]
+        cached(2)
+
+        # Assert
+        assert results == [fake_integer_number] * 3
+        assert func.call_count == 2
+        assert cached.cache.info().hits == 2
+
+    def test_decorator_invalidate(self, fake_integer_number: int) -> None:
+        # Arrange
+        func = mock.Mock(return_value=fake_integer_number)
+        cached = ttl_cache(60)(func)
+        cached(1, key="value")
+        cached(2)
+
+        # Act
+        cached.invalidate(1, key="value")
+        cached(1, key="value")
+        cached(2)
+
+        # Assert
+        assert func.call_count == 3
+        assert cached.cache.info().hits == 1
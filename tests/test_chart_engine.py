@@ -1,14 +1,25 @@
+import os
 import pathlib
 import random
+import subprocess
+import sys
+import threading
+from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from unittest import mock
 from unittest.mock import create_autospec
 
 import pytest
 from _pytest.fixtures import SubRequest
+from matplotlib.axes import Axes
 from plugins.parsing import assign_id
 
 from dosimeter.chart_engine import ChartEngine
+from dosimeter.chart_engine.chart import STYLE
+from dosimeter.chart_engine.renderer import draw_bar_chart
 from dosimeter.constants import Point, Region
-from dosimeter.parser import RegionInfoDTO
+from dosimeter.parser import RadiationSnapshot, RegionInfoDTO
 
 
 @pytest.fixture(params=list(Region), ids=assign_id)
@@ -68,10 +79,11 @@ class TestChartEngine(object):
         bar_chart = ChartEngine(dir_path=tmp_path / self.dir)
 
         # Act
-        bar_chart.create(region_info_dto)
+        image = bar_chart.create(region_info_dto)
         file = tmp_path / self.dir / ChartEngine.file_name
 
         # Assert
+        assert file.read_bytes() == image
         assert file.exists()
         assert file.is_file()
         assert file.suffix == ".png"
@@ -93,3 +105,215 @@ class TestChartEngine(object):
 
         # Assert
         assert not file.exists()
+
+    def test_create_in_memory(
+        self,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        region_info_dto: RegionInfoDTO,
+    ) -> None:
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        bar_chart = ChartEngine()
+
+        # Act
+        image = bar_chart.create(region_info_dto)
+        bar_chart.delete()
+
+        # Assert
+        assert isinstance(image, bytes)
+        assert image.startswith(b"\x89PNG\r\n\x1a\n")
+        assert not list(tmp_path.iterdir())
+
+    def test_render_is_cached_per_snapshot(
+        self,
+        region_info_dto: RegionInfoDTO,
+    ) -> None:
+        # Arrange
+        bar_chart = ChartEngine()
+        data = replace(region_info_dto, version="v1")
+
+        # Act
+        with mock.patch.object(
+            ChartEngine, "create", autospec=True, return_value=b"png"
+        ) as mocked:
+            first = bar_chart.render(data)
+            second = bar_chart.render(data)
+            bar_chart.render(replace(data, version="v2"))
+            bar_chart.render(replace(data, version=None))
+            bar_chart.render(replace(data, version=None))
+
+        # Assert
+        assert first is second
+        assert mocked.call_count == 4
+        assert bar_chart.cache.info().hits == 1
+        assert bar_chart.cache.info().hit_rate == pytest.approx(1 / 3)
+
+    def test_prerender_all_regions(self) -> None:
+        # Arrange
+        bar_chart = ChartEngine(cache_size=len(Region))
+        snapshot = RadiationSnapshot.create(
+            [(point.label, 0.1) for point in Point], version="v1"
+        )
+
+        # Act
+        with mock.patch.object(
+            ChartEngine, "create", autospec=True, return_value=b"png"
+        ) as mocked:
+            bar_chart.prerender(snapshot)
+            for region in Region:
+                bar_chart.render(snapshot.get_region_info(region))
+            bar_chart.prerender(replace(snapshot, version="v2"))
+
+        # Assert
+        assert mocked.call_count == 2 * len(Region)
+        assert bar_chart.cache.info().hits == len(Region)
+        assert bar_chart.cache.info().evictions == len(Region)
+        assert len(bar_chart.cache) == len(Region)
+
+    def test_draw_each_bar_once(self, region_info_dto: RegionInfoDTO) -> None:
+        # Act
+        with mock.patch(
+            "matplotlib.axes.Axes.bar", autospec=True, side_effect=Axes.bar
+        ) as mocked:
+            image = draw_bar_chart(region_info_dto.region, region_info_dto.info, STYLE)
+
+        # Assert
+        assert image.startswith(b"\x89PNG\r\n\x1a\n")
+        mocked.assert_called_once()
+        assert len(mocked.call_args.args[1]) == len(region_info_dto.info)
+
+    def test_create_with_full_queue(self, region_info_dto: RegionInfoDTO) -> None:
+        # Arrange
+        bar_chart = ChartEngine()
+
+        # Act
+        with mock.patch.object(
+            ChartEngine, "_slots", threading.BoundedSemaphore(1)
+        ) as slots, mock.patch("dosimeter.chart_engine.chart.CHART_TIMEOUT_SEC", 0.01):
+            slots.acquire()
+            with pytest.raises(TimeoutError) as exc_info:
+                bar_chart.create(region_info_dto)
+
+        # Assert
+        assert str(exc_info.value) == "The queue of the charts to render is full."
+
+    def test_file_id_is_invalidated_on_new_snapshot(self) -> None:
+        # Arrange
+        bar_chart = ChartEngine()
+        snapshot = RadiationSnapshot.create(
+            [(point.label, 0.1) for point in Point], version="v1"
+        )
+        data = snapshot.get_region_info(Region.GOMEL)
+
+        # Act
+        with mock.patch.object(ChartEngine, "render", autospec=True):
+            bar_chart.set_file_id(data, "file-id")
+            bar_chart.set_file_id(replace(data, version=None), "ignored")
+            first = bar_chart.get_file_id(data)
+            bar_chart.prerender(snapshot)
+            second = bar_chart.get_file_id(data)
+            bar_chart.prerender(replace(snapshot, version="v2"))
+            third = bar_chart.get_file_id(data)
+
+        # Assert
+        assert first == second == "file-id"
+        assert third is None
+        assert bar_chart.get_file_id(replace(data, version=None)) is None
+
+    def test_create_restarts_broken_pool(self) -> None:
+        # Arrange
+        bar_chart = ChartEngine()
+        data = RegionInfoDTO(region=Region.MINSK, info={"Минск": 0.1})
+        broken = ChartEngine._get_pool()
+        with pytest.raises(BrokenProcessPool):
+            broken.submit(os._exit, 1).result(timeout=30)
+
+        # Act
+        image = bar_chart.create(data)
+
+        # Assert
+        assert image.startswith(b"\x89PNG\r\n\x1a\n")
+        assert ChartEngine._get_pool() is not broken
+
+    def test_create_with_timeout(self) -> None:
+        # Arrange
+        bar_chart = ChartEngine()
+        data = RegionInfoDTO(region=Region.MINSK, info={"Минск": 0.1})
+        future: futures.Future[bytes] = futures.Future()
+        pool = mock.Mock(submit=mock.Mock(return_value=future))
+
+        # Act
+        with mock.patch.object(ChartEngine, "_get_pool", return_value=pool), mock.patch(
+            "dosimeter.chart_engine.chart.CHART_TIMEOUT_SEC", 0.01
+        ):
+            with pytest.raises(futures.TimeoutError):
+                bar_chart.create(data)
+
+        # Assert
+        assert future.cancelled()
+
+    def test_renderer_without_app_imports(self) -> None:
+        # Arrange
+        code = (
+            "import sys; import dosimeter.chart_engine.renderer; "
+            "print(sorted(m for m in sys.modules if m.startswith('dosimeter')))"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        assert result.stdout.strip() == str(
+            ["dosimeter", "dosimeter.chart_engine", "dosimeter.chart_engine.renderer"]
+        )
+
+    @pytest.mark.parametrize(
+        "module,handler",
+        [("dosimeter.main", False), ("dosimeter.handler", True)],
+        ids=["main", "handler"],
+    )
+    def test_create_from_main_script(
+        self, module: str, handler: bool, tmp_path: pathlib.Path
+    ) -> None:
+        # Arrange
+        script = tmp_path / "bot.py"
+        script.write_text(
+            f"""
+import sys
+
+import {module}  # noqa: F401
+
+from dosimeter.chart_engine import ChartEngine
+from dosimeter.constants import Region
+from dosimeter.parser import RegionInfoDTO
+
+
+def report():
+    mongo = sys.modules.get("dosimeter.storage.mongo")
+    return (
+        "dosimeter.handler" in sys.modules,
+        bool(mongo and mongo.CloudMongoDataBase._CloudMongoDataBase__instance),
+    )
+
+
+if __name__ == "__main__":
+    image = ChartEngine().create(RegionInfoDTO(region=Region.MINSK, info={{"Минск": 0.1}}))
+    print(image.startswith(b"\\x89PNG"), ChartEngine._get_pool().submit(report).result())
+"""
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            env={**os.environ, "PYTHONPATH": str(pathlib.Path(__file__).parents[1])},
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True,
+        )
+
+        # Assert
+        assert result.stdout.strip().splitlines()[-1] == f"True ({handler}, False)"
@@ -86,6 +86,7 @@ class TestFileRepository(object):
     ) -> None:
         # Act
         file_repo.put(tgm_user, action)
+        file_repo.compact()
 
         # Assert
         data = data_from_file_repo(file_repo.repo.file)
@@ -110,6 +111,7 @@ class TestFileRepository(object):
         # Act
         for user in list_tgm_users_factory(5):
             file_repo.put(user, Action.START)
+        file_repo.compact()
 
         # Assert
         data = data_from_file_repo(file_repo.repo.file)
@@ -127,6 +129,7 @@ class TestFileRepository(object):
         file_repo.put(tgm_user, Action.HELP)
         file_repo.put(tgm_user, Action.DONATE)
         file_repo.put(tgm_user, Action.HELP)
+        file_repo.compact()
 
         # Assert
         data = data_from_file_repo(file_repo.repo.file)
@@ -276,6 +279,88 @@ class TestFileRepository(object):
         # Assert
         assert not has_user
 
+    def test_replay_journal(
+        self,
+        file_repo: FileRepository,
+        list_tgm_users_factory: "ListTelegramUsers",
+    ) -> None:
+        # Arrange
+        list_tgm_users = list_tgm_users_factory(3)
+        for user in list_tgm_users:
+            file_repo.put(user, Action.START)
+        file_repo.put(list_tgm_users[0], Action.HELP)
+
+        # Act
+        db_replica = FileRepository(path_to_file=file_repo.repo.file)
+
+        # Assert
+        assert file_repo.journal.read_text().count("\n") == 7
+        assert db_replica.get_count() == 3
+        assert db_replica.get(list_tgm_users[0].id) == file_repo.get(
+            list_tgm_users[0].id
+        )
+        assert len(db_replica.get(list_tgm_users[0].id)[Action.HELP]) == 1
+
+    def test_compact_journal(
+        self,
+        file_repo: FileRepository,
+        tgm_user: User,
+        data_from_file_repo: "FileDataFactory",
+    ) -> None:
+        # Arrange
+        file_repo.put(tgm_user, Action.START)
+        journal = file_repo.journal.read_text()
+
+        # Act
+        file_repo.compact()
+        file_repo.journal.write_text(journal)
+        db_replica = FileRepository(path_to_file=file_repo.repo.file)
+
+        # Assert
+        assert data_from_file_repo(file_repo.repo.file)["seq"] == 2
+        assert len(db_replica.get(tgm_user.id)[Action.START]) == 1
+
+    def test_compact_every(
+        self,
+        tmp_path: Path,
+        list_tgm_users_factory: "ListTelegramUsers",
+        data_from_file_repo: "FileDataFactory",
+    ) -> None:
+        # Arrange
+        file_repo = FileRepository(
+            path_to_file=tmp_path / config.repo.name, compact_every=4
+        )
+
+        # Act
+        for user in list_tgm_users_factory(3):
+            file_repo.put(user, Action.START)
+
+        # Assert
+        assert len(data_from_file_repo(file_repo.repo.file)["users"]) == 2
+        assert file_repo.journal.read_text().count("\n") == 2
+        assert file_repo.get_count() == 3
+
+    def test_replay_torn_journal(
+        self,
+        file_repo: FileRepository,
+        list_tgm_users_factory: "ListTelegramUsers",
+    ) -> None:
+        # Arrange
+        user, other_user = list_tgm_users_factory(2)
+        file_repo.put(user, Action.START)
+        with open(file_repo.journal, "a") as file:
+            file.write('{"user_id":1,"act')
+
+        # Act
+        db_replica = FileRepository(path_to_file=file_repo.repo.file)
+        db_replica.put(other_user, Action.START)
+        result = FileRepository(path_to_file=file_repo.repo.file)
+
+        # Assert
+        assert db_replica.get_count() == 2
+        assert result.get_count() == 2
+        assert len(result.get(other_user.id)[Action.START]) == 1
+
     def test_create(
         self,
         file_repo: FileRepository,
@@ -0,0 +1,202 @@
+from unittest import mock
+
+import pytest
+from telegram.error import BadRequest
+
+from dosimeter.chart_engine import ChartEngine
+from dosimeter.constants import Action, Region
+from dosimeter.handler import MessageHandler
+from dosimeter.parser import RegionInfoDTO
+
+
+@pytest.fixture()
+def message_handler() -> MessageHandler:
+    return MessageHandler(
+        parser=mock.Mock(),
+        repo=mock.Mock(),
+        geolocation=mock.Mock(),
+        measurement=mock.Mock(),
+        control=mock.Mock(),
+        bar_chart=ChartEngine(),
+    )
+
+
+@pytest.fixture()
+def region_info() -> RegionInfoDTO:
+    return RegionInfoDTO(region=Region.MINSK, info={"Минск": 0.1}, version="v1")
+
+
+@pytest.mark.handler()
+class TestShowChart(object):
+    """
+    A class for testing the sending of the chart by the MessageHandler class.
+    """
+
+    @staticmethod
+    def get_context(region_info: RegionInfoDTO) -> mock.Mock:
+        context = mock.Mock(user_data={"region": region_info})
+        context.bot.send_photo.return_value.photo = [
+            mock.Mock(file_id="small"),
+            mock.Mock(file_id="uploaded"),
+        ]
+        return context
+
+    def test_upload_chart(
+        self,
+        message_handler: MessageHandler,
+        region_info: RegionInfoDTO,
+    ) -> None:
+        # Arrange
+        context = self.get_context(region_info)
+
+        # Act
+        with mock.patch.object(
+            message_handler.chart, "render", return_value=b"png"
+        ) as render:
+            message_handler._show_chart(mock.Mock(), context)
+
+        # Assert
+        render.assert_called_once_with(region_info)
+        context.bot.send_photo.assert_called_once_with(chat_id=mock.ANY, photo=b"png")
+        assert message_handler.chart.get_file_id(region_info) == "uploaded"
+        message_handler.repo.put.assert_called_once_with(mock.ANY, Action.SHOW_CHART)
+
+    def test_reuse_file_id(
+        self,
+        message_handler: MessageHandler,
+        region_info: RegionInfoDTO,
+    ) -> None:
+        # Arrange
+        context = self.get_context(region_info)
+        message_handler.chart.set_file_id(region_info, "cached")
+
+        # Act
+        with mock.patch.object(message_handler.chart, "render") as render:
+            message_handler._show_chart(mock.Mock(), context)
+
+        # Assert
+        render.assert_not_called()
+        context.bot.send_photo.assert_called_once_with(chat_id=mock.ANY, photo="cached")
+        assert message_handler.chart.get_file_id(region_info) == "cached"
+
+    def test_reupload_on_bad_request(
+        self,
+        message_handler: MessageHandler,
+        region_info: RegionInfoDTO,
+    ) -> None:
+        # Arrange
+        context = self.get_context(region_info)
+        message = context.bot.send_photo.return_value
+        context.bot.send_photo.side_effect = [
+            BadRequest("Wrong file identifier"),
+            message,
+        ]
+        message_handler.chart.set_file_id(region_info, "expired")
+
+        # Act
+        with mock.patch.object(
+            message_handler.chart, "render", return_value=b"png"
+        ) as render:
+            message_handler._show_chart(mock.Mock(), context)
+
+        # Assert
+        render.assert_called_once_with(region_info)
+        assert context.bot.send_photo.call_args_list == [
+            mock.call(chat_id=mock.ANY, photo="expired"),
+            mock.call(chat_id=mock.ANY, photo=b"png"),
+        ]
+        assert message_handler.chart.get_file_id(region_info) == "uploaded"
+
+    def test_forget_file_id_on_failed_reupload(
+        self,
+        message_handler: MessageHandler,
+        region_info: RegionInfoDTO,
+    ) -> None:
+        # Arrange
+        context = self.get_context(region_info)
+        context.bot.send_photo.side_effect = [
+            BadRequest("Wrong file identifier"),
+            None,
+        ]
+        message_handler.chart.set_file_id(region_info, "expired")
+
+        # Act
+        with mock.patch.object(message_handler.chart, "render", return_value=b"png"):
+            message_handler._show_chart(mock.Mock(), context)
+
+        # Assert
+        assert message_handler.chart.get_file_id(region_info) is None
+
+
+@pytest.mark.handler()
+class TestRadiationMonitoring(object):
+    """
+    A class for testing the cached reply to the radiation monitoring request.
+    """
+
+    def test_status_change_renders_new_reply(
+        self,
+        message_handler: MessageHandler,
+    ) -> None:
+        # Arrange
+        snapshot = mock.Mock(version="v1", status="По состоянию на 10:00", mean=0.1)
+        message_handler.parser.get_snapshot.return_value = snapshot
+        context = mock.Mock()
+
+        # Act
+        with mock.patch("dosimeter.analytics.decorators.analytics"):
+            message_handler._radiation_monitoring_callback(mock.Mock(), context)
+            message_handler._radiation_monitoring_callback(mock.Mock(), context)
+            snapshot.status = "По состоянию на 11:00"
+            message_handler._radiation_monitoring_callback(mock.Mock(), context)
+
+        # Assert
+        texts = [
+            kwargs["text"] for _, kwargs in context.bot.send_message.call_args_list
+        ]
+        assert "10:00" in texts[0]
+        assert texts[1] is texts[0]
+        assert "11:00" in texts[2]
+        assert message_handler.messages.info().misses == 2
+
+
+@pytest.mark.handler()
+class TestRefresh(object):
+    """
+    A class for testing the background refresh of the MessageHandler class.
+    """
+
+    def test_refresh_prepares_charts_and_dose_field(
+        self,
+        message_handler: MessageHandler,
+    ) -> None:
+        # Arrange
+        snapshot = mock.Mock(points={"Минск": 0.1}, version="v2")
+        message_handler.parser.refresh.return_value = snapshot
+        context = mock.Mock()
+
+        # Act
+        with mock.patch.object(message_handler.chart, "prerender") as prerender:
+            message_handler.refresh_callback(context)
+
+        # Assert
+        message_handler.parser.refresh.assert_called_once_with(context)
+        prerender.assert_called_once_with(snapshot)
+        message_handler.navigator.get_dose_field.assert_called_once_with(
+            {"Минск": 0.1}, "v2"
+        )
+
+    def test_refresh_without_snapshot(
+        self,
+        message_handler: MessageHandler,
+    ) -> None:
+        # Arrange
+        message_handler.parser.refresh.return_value = None
+
+        # Act
+        with mock.patch.object(message_handler.chart, "prerender") as prerender:
+            message_handler.refresh_callback(mock.Mock())
+
+        # Assert
+        prerender.assert_not_called()
+        message_handler.navigator.get_dose_field.assert_not_called()
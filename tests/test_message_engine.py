@@ -1,3 +1,5 @@
+import dataclasses
+import json
 import pathlib
 from unittest import mock
 
@@ -5,6 +7,8 @@ import jinja2
 import pytest
 
 from dosimeter.template_engine import Template, TemplateEngine
+from dosimeter.template_engine.cache import MessageCache
+from dosimeter.utils import keyboards
 
 
 @pytest.fixture(scope="session")
@@ -77,3 +81,109 @@ class TestMessageEngine(object):
         # Assert
         assert exc_info
         assert not str(exc_info.value)
+
+    def test_templates_compiled_at_startup(
+        self,
+        message_engine: TemplateEngine,
+    ) -> None:
+        # Act
+        with mock.patch.object(message_engine.env, "get_template") as mocked:
+            rendered_message = message_engine.render(self.template)
+
+        # Assert
+        assert set(message_engine.compiled) == {
+            field.default.name for field in dataclasses.fields(Template)
+        }
+        assert "1 Зиверт = 100 Рентген" in rendered_message
+        mocked.assert_not_called()
+
+    def test_templates_bytecode_cache(self, tmp_path: pathlib.Path) -> None:
+        # Arrange
+        engine = TemplateEngine(cache_dir=tmp_path)
+
+        # Act
+        with mock.patch(
+            "jinja2.environment.Environment.compile",
+        ) as mocked:
+            cached_engine = TemplateEngine(cache_dir=tmp_path)
+
+        # Assert
+        assert len(list(tmp_path.iterdir())) == len(engine.compiled)
+        assert cached_engine.render(self.template) == engine.render(self.template)
+        mocked.assert_not_called()
+
+    def test_templates_without_bytecode_cache(self) -> None:
+        # Act
+        engine = TemplateEngine(cache_dir=None)
+
+        # Assert
+        assert engine.env.bytecode_cache is None
+        assert "1 Зиверт = 100 Рентген" in engine.render(self.template)
+
+
+@pytest.mark.message_engine()
+class TestMessageCache(object):
+    """
+    A class for testing the cache of the rendered messages.
+    """
+
+    template: pathlib.Path = Template.TABLE
+
+    @staticmethod
+    def get_context(mean_value: float) -> dict:
+        return {
+            "date": "21 мая 2023 г.",
+            "values_by_region": [("Минск", 0.1)],
+            "mean_value": mean_value,
+        }
+
+    def test_message_cache_hit(self, message_engine: TemplateEngine) -> None:
+        # Arrange
+        cache = MessageCache(message_engine)
+        context = mock.Mock(return_value=self.get_context(0.1))
+        reply_markup = mock.Mock(wraps=keyboards.chart_keyboard)
+
+        # Act
+        first = cache.get(self.template, "v1", context, reply_markup)
+        second = cache.get(self.template, "v1", context, reply_markup)
+
+        # Assert
+        assert second is first
+        assert "<b>0.1</b>" in first.text
+        assert json.loads(first.reply_markup) == keyboards.chart_keyboard().to_dict()
+        context.assert_called_once()
+        reply_markup.assert_called_once()
+        assert cache.info().hits == 1
+
+    def test_message_cache_new_version(self, message_engine: TemplateEngine) -> None:
+        # Arrange
+        cache = MessageCache(message_engine)
+
+        # Act
+        first = cache.get(self.template, "v1", lambda: self.get_context(0.1))
+        second = cache.get(self.template, "v2", lambda: self.get_context(0.2))
+
+        # Assert
+        assert "<b>0.1</b>" in first.text
+        assert "<b>0.2</b>" in second.text
+        assert second.reply_markup is None
+        assert cache.info().misses == 2
+
+    def test_message_cache_locale(self, message_engine: TemplateEngine) -> None:
+        # Arrange
+        context = mock.Mock(return_value=self.get_context(0.1))
+
+        # Act
+        for locale in ("ru", "en"):
+            MessageCache(message_engine, locale=locale).get(
+                self.template, "v1", context
+            )
+        cache = MessageCache(message_engine, locale="ru")
+        cache.get(self.template, "v1", context)
+        cache.get(self.template, "v1", context)
+        cache.clear()
+        cache.get(self.template, "v1", context)
+
+        # Assert
+        assert context.call_count == 4
+        assert cache.info().size == 1
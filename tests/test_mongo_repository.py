@@ -0,0 +1,408 @@
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterator
+from unittest import mock
+
+import pytest
+from pymongo import ASCENDING, MongoClient, UpdateOne
+from pymongo.database import Database
+from pymongo.errors import OperationFailure, PyMongoError
+from telegram import User
+
+from dosimeter.constants import Action
+from dosimeter.storage import CloudMongoDataBase
+from dosimeter.storage.mongo import PROFILE_PROJECTION, USER_ID_INDEX
+
+if TYPE_CHECKING:
+    from plugins.storage import ListTelegramUsers
+
+
+@pytest.fixture()
+def database() -> mock.MagicMock:
+    return mock.MagicMock()
+
+
+@pytest.fixture()
+def mongo_repo(database: mock.MagicMock) -> Iterator[CloudMongoDataBase]:
+    repo = CloudMongoDataBase(database=database, bulk_size=0)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture()
+def buffered_repo(database: mock.MagicMock) -> Iterator[CloudMongoDataBase]:
+    repo = CloudMongoDataBase(database=database, bulk_size=3, bulk_interval=60_000)
+    yield repo
+    repo.close()
+
+
+@pytest.fixture()
+def local_database() -> Iterator[Database]:
+    """
+    Database on the local mongod stand-in, the tests are skipped without it.
+    """
+    client: MongoClient = MongoClient(
+        os.environ.get("MONGO_TEST_URI", "mongodb://localhost:27017"),
+        serverSelectionTimeoutMS=500,
+    )
+    try:
+        client.server_info()
+    except PyMongoError:
+        pytest.skip("Local mongod is not available.")
+    client.drop_database("dosimeter_test")
+    yield client.dosimeter_test
+    client.drop_database("dosimeter_test")
+    client.close()
+
+
+def get_stages(plan: Any) -> list[tuple[str, str | None]]:
+    """
+    Collects the stages of the query plan with the names of their indexes.
+    """
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in get_stages(item)]
+    if not isinstance(plan, dict):
+        return []
+    stages = [(plan["stage"], plan.get("indexName"))] if "stage" in plan else []
+    return stages + [stage for value in plan.values() for stage in get_stages(value)]
+
+
+@pytest.mark.mongo_repo()
+class TestCloudMongoDataBase(object):
+    """
+    A class for testing the writes of the CloudMongoDataBase class.
+    """
+
+    def test_put_new_user(
+        self,
+        mongo_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+        tgm_user: User,
+    ) -> None:
+        # Act
+        mongo_repo.put(tgm_user, Action.START)
+
+        # Assert
+        database.users.update_one.assert_called_once()
+        database.users.find_one.assert_not_called()
+        database.users.insert_one.assert_not_called()
+
+        (query, update), kwargs = database.users.update_one.call_args
+        assert query == {"user_id": tgm_user.id}
+        assert kwargs == {"upsert": True}
+        assert list(update["$push"]) == [Action.START]
+        assert update["$setOnInsert"]["first_name"] != tgm_user.first_name
+        assert Action.HELP in update["$setOnInsert"]
+        assert Action.START not in update["$setOnInsert"]
+        assert "user_id" not in update["$setOnInsert"]
+
+    def test_put_known_user(
+        self,
+        mongo_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+        tgm_user: User,
+    ) -> None:
+        # Arrange
+        mongo_repo.put(tgm_user, Action.START)
+        (_, first), _ = database.users.update_one.call_args
+
+        # Act
+        with mock.patch.object(mongo_repo, "_create") as mocked:
+            mongo_repo.put(tgm_user, Action.HELP)
+
+        # Assert
+        (_, update), _ = database.users.update_one.call_args
+        assert database.users.update_one.call_count == 2
+        assert (
+            update["$setOnInsert"]["first_name"] == first["$setOnInsert"]["first_name"]
+        )
+        assert Action.HELP not in update["$setOnInsert"]
+        mocked.assert_not_called()
+
+    def test_profiles_are_bounded(
+        self,
+        mongo_repo: CloudMongoDataBase,
+        list_tgm_users_factory: "ListTelegramUsers",
+    ) -> None:
+        # Arrange
+        users = list_tgm_users_factory(5)
+
+        # Act
+        with mock.patch("dosimeter.storage.mongo.PROFILE_CACHE_SIZE", 3):
+            repo = CloudMongoDataBase(database=mongo_repo.mdb, bulk_size=0)
+        for user in users:
+            repo.put(user, Action.START)
+        with mock.patch.object(repo, "_create", wraps=repo._create) as mocked:
+            repo.put(users[-1], Action.HELP)
+            repo.put(users[0], Action.HELP)
+
+        # Assert
+        assert len(repo._profiles) == 3
+        mocked.assert_called_once_with(users[0])
+
+    def test_buffer_flushed_by_size(
+        self,
+        buffered_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+        list_tgm_users_factory: "ListTelegramUsers",
+    ) -> None:
+        # Arrange
+        users = list_tgm_users_factory(4)
+
+        # Act
+        for user in users:
+            buffered_repo.put(user, Action.MONITORING)
+
+        # Assert
+        database.users.update_one.assert_not_called()
+        database.users.bulk_write.assert_called_once()
+        (operations,), kwargs = database.users.bulk_write.call_args
+        assert kwargs == {"ordered": True}
+        assert operations == [
+            UpdateOne(
+                {"user_id": user.id},
+                operations[index]._doc,
+                upsert=True,
+            )
+            for index, user in enumerate(users[:3])
+        ]
+        assert len(buffered_repo.buffer) == 1
+
+    def test_buffer_flushed_by_interval(
+        self,
+        database: mock.MagicMock,
+        tgm_user: User,
+    ) -> None:
+        # Arrange
+        repo = CloudMongoDataBase(database=database, bulk_size=100, bulk_interval=10)
+
+        # Act
+        repo.put(tgm_user, Action.LOCATION)
+        deadline = time.monotonic() + 5
+        while not database.users.bulk_write.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        repo.close()
+
+        # Assert
+        database.users.bulk_write.assert_called_once()
+        assert len(repo.buffer) == 0
+
+    def test_buffer_flushed_on_close(
+        self,
+        buffered_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+        tgm_user: User,
+    ) -> None:
+        # Arrange
+        buffered_repo.put(tgm_user, Action.START)
+        buffered_repo.put(tgm_user, Action.HELP)
+
+        # Act
+        buffered_repo.close()
+
+        # Assert
+        (operations,), _ = database.users.bulk_write.call_args
+        assert len(operations) == 2
+        assert len(buffered_repo.buffer) == 0
+
+    def test_buffer_write_error(
+        self,
+        buffered_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+        tgm_user: User,
+    ) -> None:
+        # Arrange
+        database.users.bulk_write.side_effect = PyMongoError("No primary")
+        buffered_repo.put(tgm_user, Action.START)
+
+        # Act
+        buffered_repo.flush()
+
+        # Assert
+        database.users.bulk_write.assert_called_once()
+        assert len(buffered_repo.buffer) == 0
+
+    def test_buffer_flushes_are_serialized(
+        self,
+        buffered_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+        tgm_user: User,
+    ) -> None:
+        # Arrange
+        written: list[str] = []
+        started = threading.Event()
+
+        def bulk_write(operations: list[UpdateOne], ordered: bool) -> None:
+            started.set()
+            time.sleep(0.05)
+            written.extend(key for op in operations for key in op._doc["$push"])
+
+        database.users.bulk_write.side_effect = bulk_write
+        buffered_repo.put(tgm_user, Action.START)
+        first = threading.Thread(target=buffered_repo.flush)
+
+        # Act
+        first.start()
+        started.wait(5)
+        buffered_repo.put(tgm_user, Action.HELP)
+        buffered_repo.flush()
+        first.join()
+
+        # Assert
+        assert written == [Action.START, Action.HELP]
+        (operations,), _ = database.users.bulk_write.call_args
+        assert "$setOnInsert" in operations[0]._doc
+
+    def test_buffer_registered_at_exit_once(self, database: mock.MagicMock) -> None:
+        # Arrange
+        handlers: list[Any] = []
+
+        # Act
+        with mock.patch("dosimeter.storage.mongo.atexit") as mocked:
+            mocked.register.side_effect = handlers.append
+            mocked.unregister.side_effect = lambda handler: (
+                handlers.remove(handler) if handler in handlers else None
+            )
+            first = CloudMongoDataBase(database=database, bulk_size=3)
+            second = CloudMongoDataBase(database=database, bulk_size=3)
+            registered = list(handlers)
+            second.close()
+
+        # Assert
+        assert first is second
+        assert registered == [second.buffer.close]  # type: ignore[union-attr]
+        assert handlers == []
+
+    def test_create_index_at_startup(
+        self,
+        mongo_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+    ) -> None:
+        # Act
+        CloudMongoDataBase(database=database, bulk_size=0)
+
+        # Assert
+        assert database.users.create_index.call_count == 2
+        database.users.create_index.assert_called_with(
+            [("user_id", ASCENDING)], unique=True, name=USER_ID_INDEX
+        )
+
+    def test_create_index_error(self, database: mock.MagicMock) -> None:
+        # Arrange
+        database.users.create_index.side_effect = OperationFailure(
+            "Index already exists with a different name", code=85
+        )
+
+        # Act
+        repo = CloudMongoDataBase(database=database, bulk_size=0)
+
+        # Assert
+        assert repo.mdb is database
+        database.users.create_index.assert_called_once()
+
+    def test_get_with_projection(
+        self,
+        mongo_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+    ) -> None:
+        # Arrange
+        database.users.find_one.return_value = None
+
+        # Act
+        result = mongo_repo.get("42")
+
+        # Assert
+        assert result == "User does not exist."
+        database.users.find_one.assert_called_once_with(
+            {"user_id": 42}, PROFILE_PROJECTION
+        )
+
+    def test_get_data_with_projection(
+        self,
+        mongo_repo: CloudMongoDataBase,
+        database: mock.MagicMock,
+    ) -> None:
+        # Arrange
+        database.users.find.return_value = [{"user_id": 42, "first_name": "name"}]
+
+        # Act
+        result = mongo_repo.get_data()
+
+        # Assert
+        assert "ID:         42" in result
+        database.users.find.assert_called_once_with({}, PROFILE_PROJECTION)
+
+
+@pytest.mark.mongo_repo()
+class TestCloudMongoDataBaseQueryPlans(object):
+    """
+    A class for testing the query plans of the CloudMongoDataBase class on
+    the local mongod.
+    """
+
+    @pytest.fixture()
+    def local_repo(
+        self,
+        local_database: Database,
+        list_tgm_users_factory: "ListTelegramUsers",
+    ) -> Iterator[CloudMongoDataBase]:
+        repo = CloudMongoDataBase(database=local_database, bulk_size=0)
+        for user in list_tgm_users_factory(20):
+            repo.put(user, Action.START)
+        yield repo
+        repo.close()
+
+    def test_unique_index(self, local_repo: CloudMongoDataBase) -> None:
+        # Act
+        CloudMongoDataBase(database=local_repo.mdb, bulk_size=0)
+        indexes = local_repo.mdb.users.index_information()
+
+        # Assert
+        assert indexes[USER_ID_INDEX]["unique"]
+        assert indexes[USER_ID_INDEX]["key"] == [("user_id", ASCENDING)]
+
+    def test_find_one_plan(self, local_repo: CloudMongoDataBase) -> None:
+        # Act
+        user_id = local_repo.mdb.users.find_one({}, PROFILE_PROJECTION)["user_id"]
+        plan = local_repo.mdb.users.find(
+            {"user_id": user_id}, PROFILE_PROJECTION
+        ).explain()
+        stages = get_stages(plan["queryPlanner"]["winningPlan"])
+
+        # Assert
+        assert ("IXSCAN", USER_ID_INDEX) in stages
+        assert "COLLSCAN" not in {stage for stage, _ in stages}
+        assert local_repo.get(user_id)["user_id"] == user_id
+
+    def test_upsert_plan(self, local_repo: CloudMongoDataBase) -> None:
+        # Act
+        plan = local_repo.mdb.command(
+            "explain",
+            {
+                "update": "users",
+                "updates": [
+                    {
+                        "q": {"user_id": 42},
+                        "u": {"$push": {Action.HELP.value: "2023-05-21 12:00:00"}},
+                        "upsert": True,
+                    }
+                ],
+            },
+        )
+        stages = get_stages(plan["queryPlanner"]["winningPlan"])
+
+        # Assert
+        assert ("IXSCAN", USER_ID_INDEX) in stages
+        assert "COLLSCAN" not in {stage for stage, _ in stages}
+
+    def test_distinct_plan(self, local_repo: CloudMongoDataBase) -> None:
+        # Act
+        plan = local_repo.mdb.command(
+            "explain", {"distinct": "users", "key": "user_id"}
+        )
+        stages = get_stages(plan["queryPlanner"]["winningPlan"])
+
+        # Assert
+        assert ("DISTINCT_SCAN", USER_ID_INDEX) in stages
+        assert len(local_repo.get_ids().splitlines()) == 20
@@ -1,10 +1,21 @@
+from pathlib import Path
+from unittest import mock
 from unittest.mock import create_autospec
 
+import numpy as np
 import pytest
+from geopy import distance
 from mimesis import Field
 
 from dosimeter.constants import Point
-from dosimeter.navigator import Navigator, NearPoint
+from dosimeter.navigator import (
+    DoseField,
+    Navigator,
+    NearestGrid,
+    NearPoint,
+    SpatialIndex,
+)
+from dosimeter.navigator.spatial import EARTH_RADIUS
 
 
 @pytest.fixture()
@@ -23,6 +34,15 @@ def fake_longitude(faker_seed: int, fake_field: Field) -> float:
     return fake_field("address.longitude")
 
 
+@pytest.fixture()
+def belarus_locations(faker_seed: int) -> np.ndarray:
+    """
+    Generating random locations within the bounding box of Belarus.
+    """
+    generator = np.random.default_rng(faker_seed)
+    return generator.uniform((51.2, 23.1), (56.2, 32.8), size=(200, 2))
+
+
 @pytest.mark.navigator()
 class TestNavigator(object):
     """
@@ -102,3 +122,311 @@ class TestNavigator(object):
         assert isinstance(result, NearPoint)
         assert isinstance(result.distance, float)
         assert result.title == Point.OLTUSH.label
+
+    def test_near_point_matches_geodesic_search(
+        self,
+        fake_integer_number: int,
+        belarus_locations: np.ndarray,
+    ) -> None:
+        for latitude, longitude in belarus_locations:
+            # Arrange
+            expected = min(
+                (
+                    round(
+                        distance.distance((latitude, longitude), point.coordinates).m, 3
+                    ),
+                    point.label,
+                )
+                for point in Point
+            )
+
+            # Act
+            result = self.navigator.get_near_point(
+                fake_integer_number, latitude=latitude, longitude=longitude
+            )
+
+            # Assert
+            assert result == NearPoint(*expected)
+
+    def test_near_point_in_haversine_mode(
+        self,
+        fake_integer_number: int,
+        belarus_locations: np.ndarray,
+    ) -> None:
+        # Arrange
+        navigator = Navigator(geodesic=False)
+
+        for latitude, longitude in belarus_locations:
+            # Act
+            result = navigator.get_near_point(
+                fake_integer_number, latitude=latitude, longitude=longitude
+            )
+            exact = self.navigator.get_near_point(
+                fake_integer_number, latitude=latitude, longitude=longitude
+            )
+
+            # Assert
+            assert result.distance == pytest.approx(exact.distance, rel=0.0056)
+
+
+@pytest.mark.navigator()
+class TestSpatialIndex(object):
+    """
+    A class for testing logic encapsulated in the SpatialIndex class.
+    """
+
+    @pytest.fixture()
+    def stations(self, faker_seed: int) -> tuple[list[str], np.ndarray]:
+        """
+        Generating a random catalog of stations around Belarus.
+        """
+        generator = np.random.default_rng(faker_seed)
+        coordinates = generator.uniform((45.0, 15.0), (60.0, 40.0), size=(500, 2))
+        return [f"station-{i}" for i in range(len(coordinates))], coordinates
+
+    @staticmethod
+    def brute_force(
+        coordinates: np.ndarray, latitude: float, longitude: float
+    ) -> np.ndarray:
+        lat, lon = np.radians(coordinates).T
+        a = (
+            np.sin((lat - np.radians(latitude)) / 2) ** 2
+            + np.cos(lat)
+            * np.cos(np.radians(latitude))
+            * np.sin((lon - np.radians(longitude)) / 2) ** 2
+        )
+        return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+    def test_nearest(
+        self,
+        stations: tuple[list[str], np.ndarray],
+        belarus_locations: np.ndarray,
+    ) -> None:
+        # Arrange
+        labels, coordinates = stations
+        index = SpatialIndex(labels, coordinates)
+
+        for latitude, longitude in belarus_locations[:20]:
+            distances = self.brute_force(coordinates, latitude, longitude)
+
+            # Act
+            result = index.nearest(latitude, longitude, k=3)
+
+            # Assert
+            assert [title for _, title in result] == [
+                labels[i] for i in np.argsort(distances)[:3]
+            ]
+            assert [d for d, _ in result] == pytest.approx(np.sort(distances)[:3])
+
+    def test_within_radius(
+        self,
+        stations: tuple[list[str], np.ndarray],
+        belarus_locations: np.ndarray,
+    ) -> None:
+        # Arrange
+        labels, coordinates = stations
+        index = SpatialIndex(labels, coordinates)
+
+        for latitude, longitude in belarus_locations[:20]:
+            distances = self.brute_force(coordinates, latitude, longitude)
+
+            # Act
+            result = index.within(latitude, longitude, 150_000)
+
+            # Assert
+            assert {title for _, title in result} == {
+                labels[i] for i in np.flatnonzero(distances <= 150_000)
+            }
+            assert [d for d, _ in result] == sorted(d for d, _ in result)
+
+    def test_within_bbox(self, stations: tuple[list[str], np.ndarray]) -> None:
+        # Arrange
+        labels, coordinates = stations
+        index = SpatialIndex(labels, coordinates)
+        latitudes, longitudes = coordinates.T
+
+        # Act
+        result = index.within_bbox(51.2, 23.1, 56.2, 32.8)
+
+        # Assert
+        inside = (
+            (51.2 <= latitudes)
+            & (latitudes <= 56.2)
+            & (23.1 <= longitudes)
+            & (longitudes <= 32.8)
+        )
+        assert sorted(result) == sorted(labels[i] for i in np.flatnonzero(inside))
+
+    def test_navigator_queries(self) -> None:
+        # Arrange
+        navigator = Navigator()
+        brest = Point.BREST.coordinates
+
+        # Act
+        near_points = navigator.get_near_points(*brest, k=3)
+        points_within = navigator.get_points_within(*brest, radius=0)
+        points_in_bbox = navigator.get_points_in_bbox(51.2, 23.1, 56.2, 32.8)
+
+        # Assert
+        assert len(near_points) == 3
+        assert near_points[0].title == Point.BREST.label
+        assert points_within[0].title == Point.BREST.label
+        assert sorted(points_in_bbox) == sorted(point.label for point in Point)
+
+
+@pytest.mark.navigator()
+class TestNearestGrid(object):
+    """
+    A class for testing logic encapsulated in the NearestGrid class.
+    """
+
+    coordinates = [point.coordinates for point in Point]
+
+    def test_lookup_contains_nearest_point(self, belarus_locations: np.ndarray) -> None:
+        # Arrange
+        grid = NearestGrid(self.coordinates, resolution=0.1)
+
+        for latitude, longitude in belarus_locations:
+            expected = min(
+                range(len(self.coordinates)),
+                key=lambda i: distance.distance(
+                    (latitude, longitude), self.coordinates[i]  # noqa: B023
+                ).m,
+            )
+
+            # Act
+            result = grid.lookup(latitude, longitude)
+
+            # Assert
+            assert expected in result.tolist()
+
+    def test_lookup_outside_bounding_box(self) -> None:
+        # Arrange
+        grid = NearestGrid(self.coordinates, resolution=0.1)
+
+        # Act
+        result = grid.lookup(0.0, 0.0)
+
+        # Assert
+        assert result is None
+
+    def test_grid_is_loaded_from_cache(self, tmp_path: Path) -> None:
+        # Arrange
+        built = NearestGrid(self.coordinates, resolution=0.1, cache_dir=tmp_path)
+
+        # Act
+        with mock.patch.object(NearestGrid, "_build") as mocked:
+            loaded = NearestGrid(self.coordinates, resolution=0.1, cache_dir=tmp_path)
+
+        # Assert
+        mocked.assert_not_called()
+        assert len(list(tmp_path.iterdir())) == 1
+        assert np.array_equal(built.cells, loaded.cells)
+        assert np.array_equal(built.candidates, loaded.candidates)
+
+    @pytest.mark.parametrize(
+        "constant,value",
+        [("HAVERSINE_TOLERANCE", 0.01), ("GRID_FORMAT_VERSION", 0)],
+        ids=["tolerance", "version"],
+    )
+    def test_grid_cache_is_keyed_on_algorithm(
+        self, constant: str, value: float, tmp_path: Path
+    ) -> None:
+        # Arrange
+        NearestGrid(self.coordinates, resolution=0.1, cache_dir=tmp_path)
+
+        # Act
+        with mock.patch(f"dosimeter.navigator.grid.{constant}", value):
+            NearestGrid(self.coordinates, resolution=0.1, cache_dir=tmp_path)
+
+        # Assert
+        assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.navigator()
+class TestDoseField(object):
+    """
+    A class for testing logic encapsulated in the DoseField class.
+    """
+
+    coordinates = [point.coordinates for point in Point]
+
+    @pytest.fixture()
+    def values(self, faker_seed: int) -> np.ndarray:
+        """
+        Generating random readings of the stations.
+        """
+        return np.random.default_rng(faker_seed).uniform(0.05, 0.5, len(Point))
+
+    def test_estimate_at_station(self, values: np.ndarray) -> None:
+        # Arrange
+        field = DoseField(self.coordinates, values, resolution=0.05)
+
+        for (latitude, longitude), value in zip(self.coordinates, values):
+            # Act
+            result = field.estimate_exact(latitude, longitude)
+
+            # Assert
+            assert result == pytest.approx(value, rel=1e-6)
+
+    def test_estimate_is_bounded_by_readings(
+        self,
+        values: np.ndarray,
+        belarus_locations: np.ndarray,
+    ) -> None:
+        # Arrange
+        field = DoseField(self.coordinates, values, resolution=0.02)
+
+        for latitude, longitude in belarus_locations:
+            # Act
+            result = field.estimate(latitude, longitude)
+            exact = field.estimate_exact(latitude, longitude)
+            if result is None:
+                continue
+
+            # Assert
+            assert values.min() <= result <= values.max()
+            assert result == pytest.approx(exact, abs=0.05)
+
+    def test_estimate_outside_bounding_box(self, values: np.ndarray) -> None:
+        # Arrange
+        field = DoseField(self.coordinates, values, resolution=0.05)
+
+        # Act
+        moscow = field.estimate(55.75, 37.62)
+        warsaw = field.estimate(52.23, 21.01)
+
+        # Assert
+        assert moscow is None
+        assert warsaw is None
+
+    def test_estimate_far_from_stations(self, values: np.ndarray) -> None:
+        # Arrange
+        field = DoseField(self.coordinates, values, resolution=0.05)
+
+        # Act
+        corner = field.estimate(56.15, 32.75)
+        minsk = field.estimate(53.9, 27.56)
+
+        # Assert
+        assert corner is None
+        assert minsk is not None
+
+    def test_dose_field_is_built_once_per_version(self) -> None:
+        # Arrange
+        navigator = Navigator(resolution=0.1)
+        points = {point.label: 0.1 for point in Point}
+
+        # Act
+        with mock.patch(
+            "dosimeter.navigator.navigator.DoseField", wraps=DoseField
+        ) as mocked:
+            first = navigator.estimate_dose(53.9, 27.56, points, "v1")
+            second = navigator.estimate_dose(52.1, 23.7, points, "v1")
+            third = navigator.estimate_dose(52.1, 23.7, {"Брест": 0.2}, "v2")
+
+        # Assert
+        assert mocked.call_count == 2
+        assert first == pytest.approx(0.1)
+        assert second == pytest.approx(0.1)
+        assert third == pytest.approx(0.2)
@@ -1,14 +1,14 @@
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 from unittest import mock
 
 import pytest
-from bs4 import BeautifulSoup
 from plugins.parsing import assign_id
 
 from dosimeter.config import config
-from dosimeter.constants import URL, Point, Region
-from dosimeter.parser import Parser
+from dosimeter.constants import LABELS_BY_REGION, POINTS_BY_LABEL, Point, Region
+from dosimeter.parser import Parser, RadiationSnapshot
 
 if TYPE_CHECKING:
     from plugins.parsing import RegionInfoAssertion
@@ -22,136 +22,287 @@ class TestParser(object):
 
     xml: Path = config.app.tests_dir / "fixtures" / "rad.xml"
     html: Path = config.app.tests_dir / "fixtures" / "rad.html"
-    method = "dosimeter.parser.Parser._get_source"
-
-    @pytest.mark.parametrize(
-        "source,url",
-        [
-            (xml, URL.RADIATION),
-            (html, URL.MONITORING),
-        ],
-        ids=["xml", "html"],
-    )
-    def test_get_source(
+    api = "dosimeter.api.external.Api"
+
+    def test_get_points_with_radiation_level(
         self,
-        source: Path,
-        url: str,
-        get_markup_from_file: Callable[[Path], BeautifulSoup],
+        get_text_from_file: Callable[[Path], str],
     ) -> None:
         # Act
-        with mock.patch("dosimeter.api.external.Api._get_markup") as mocked:
-            mocked.return_value = get_markup_from_file(source)
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+        ) as mocked:
+            mocked["get_xml"].return_value = get_text_from_file(self.xml)
+            mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser._get_source(url)
+            result = parser.get_points_with_radiation_level()
 
         # Assert
-        assert isinstance(result, BeautifulSoup)
-        mocked.assert_called_once()
+        assert isinstance(result, dict)
+        for key in result.keys():
+            assert key in tuple(point.label for point in Point)
+        for value in result.values():
+            assert isinstance(value, float)
+        mocked["get_xml"].assert_called_once()
 
-    def test_get_xml_source(
+    def test_get_mean_radiation_level(
         self,
         get_text_from_file: Callable[[Path], str],
     ) -> None:
         # Act
         with mock.patch.multiple(
-            "dosimeter.api.external.Api",
+            self.api,
             get_xml=mock.DEFAULT,
             get_html=mock.DEFAULT,
         ) as mocked:
             mocked["get_xml"].return_value = get_text_from_file(self.xml)
             mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser._get_source(URL.RADIATION)
+            result = parser.get_mean_radiation_level()
 
         # Assert
-        assert isinstance(result, BeautifulSoup)
+        assert isinstance(result, float)
+        assert 0 < result < 1
+        assert round(result, 2) == 0.11
         mocked["get_xml"].assert_called_once()
-        mocked["get_html"].assert_not_called()
 
-    def test_get_html_source(
+    def test_get_info_about_radiation_monitoring(
         self,
         get_text_from_file: Callable[[Path], str],
     ) -> None:
         # Act
         with mock.patch.multiple(
-            "dosimeter.api.external.Api",
+            self.api,
+            get_xml=mock.DEFAULT,
             get_html=mock.DEFAULT,
+        ) as mocked:
+            mocked["get_xml"].return_value = get_text_from_file(self.xml)
+            mocked["get_html"].return_value = get_text_from_file(self.html)
+            parser = Parser()
+            result = parser.get_info_about_radiation_monitoring()
+            again = parser.get_info_about_radiation_monitoring()
+
+        # Assert
+        assert isinstance(result, str)
+        assert result.startswith("По состоянию")
+        assert result.endswith("АЭС.")
+        assert "на текущую дату радиационная" in result
+        assert again is result
+        mocked["get_html"].assert_called_once()
+
+    def test_extract_status_without_status_line(self) -> None:
+        # Act
+        result = Parser._extract_status("<html><body><p>Нет данных</p></body></html>")
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.parametrize("region", list(Region), ids=assign_id)
+    def test_get_info_about_region(
+        self,
+        region: Region,
+        get_text_from_file: Callable[[Path], str],
+        assert_correct_region_info: "RegionInfoAssertion",
+    ) -> None:
+        # Act
+        with mock.patch.multiple(
+            self.api,
             get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
         ) as mocked:
+            mocked["get_xml"].return_value = get_text_from_file(self.xml)
             mocked["get_html"].return_value = get_text_from_file(self.html)
+            parser = Parser()
+            result = parser.get_region_info(region)
+
+        # Assert
+        assert_correct_region_info(result, region)
+        mocked["get_xml"].assert_called_once()
+
+    def test_get_snapshot(self, get_text_from_file: Callable[[Path], str]) -> None:
+        # Act
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+        ) as mocked:
             mocked["get_xml"].return_value = get_text_from_file(self.xml)
+            mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser._get_source(URL.MONITORING)
+            snapshot = parser.get_snapshot()
 
         # Assert
-        assert isinstance(result, BeautifulSoup)
-        mocked["get_html"].assert_called_once()
-        mocked["get_xml"].assert_not_called()
+        assert isinstance(snapshot, RadiationSnapshot)
+        assert snapshot.version
+        assert snapshot.timestamp == datetime(
+            2023, 4, 30, 20, 2, 56, tzinfo=timezone(timedelta(hours=3))
+        )
+        assert round(snapshot.mean, 2) == 0.11
+        assert set(snapshot.regions.keys()) == set(Region)
+        assert sum(len(info) for info in snapshot.regions.values()) == len(
+            snapshot.points
+        )
+        with pytest.raises(TypeError):
+            snapshot.points["Минск"] = 0.0  # type: ignore[index]
 
-    def test_get_points_with_radiation_level(
+    def test_snapshot_is_built_once_per_document(
         self,
-        get_markup_from_file: Callable[[Path], BeautifulSoup],
+        get_text_from_file: Callable[[Path], str],
     ) -> None:
+        # Arrange
+        markup = get_text_from_file(self.xml)
+
         # Act
-        with mock.patch(self.method) as mocked:
-            mocked.return_value = get_markup_from_file(self.xml)
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+        ) as mocked, mock.patch(
+            "dosimeter.parser.parser.RadiationSnapshot.create",
+            wraps=RadiationSnapshot.create,
+        ) as create:
+            mocked["get_xml"].return_value = markup
+            mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser.get_points_with_radiation_level()
+            first = parser.get_snapshot()
+            second = parser.refresh()
+            third = parser.get_snapshot()
+            mocked["get_xml"].return_value = markup.replace(
+                "<rad>0.47</rad>", "<rad>0.48</rad>"
+            )
+            fourth = parser.refresh()
 
         # Assert
-        assert isinstance(result, dict)
-        for key in result.keys():
-            assert key in tuple(point.label for point in Point)
-        for value in result.values():
-            assert isinstance(value, float)
-        mocked.assert_called_once()
+        assert first is second is third
+        assert fourth is parser.get_snapshot()
+        assert fourth is not first
+        assert fourth.version != first.version
+        assert fourth.status == first.status
+        assert create.call_count == 2
+        assert mocked["get_xml"].call_count == 3
 
-    def test_get_mean_radiation_level(
+    def test_refresh_invalidates_cached_markup(
         self,
-        get_markup_from_file: Callable[[Path], BeautifulSoup],
+        get_text_from_file: Callable[[Path], str],
     ) -> None:
         # Act
-        with mock.patch(self.method) as mocked:
-            mocked.return_value = get_markup_from_file(self.xml)
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+            invalidate=mock.DEFAULT,
+        ) as mocked:
+            mocked["get_xml"].return_value = get_text_from_file(self.xml)
+            mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser.get_mean_radiation_level()
+            parser.refresh()
+            parser.refresh()
 
         # Assert
-        assert isinstance(result, float)
-        assert 0 < result < 1
-        assert round(result, 2) == 0.11
-        mocked.assert_called_once()
+        assert mocked["invalidate"].call_count == 2
 
-    def test_get_info_about_radiation_monitoring(
+    def test_refresh_skips_parsing_of_unmodified_markup(
         self,
-        get_markup_from_file: Callable[[Path], BeautifulSoup],
+        get_text_from_file: Callable[[Path], str],
     ) -> None:
         # Act
-        with mock.patch(self.method) as mocked:
-            mocked.return_value = get_markup_from_file(self.html)
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+        ) as mocked, mock.patch.object(
+            Parser, "_build_snapshot", wraps=Parser._build_snapshot
+        ) as build, mock.patch.object(
+            Parser, "_extract_status", wraps=Parser._extract_status
+        ) as extract:
+            mocked["get_xml"].return_value = get_text_from_file(self.xml)
+            mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser.get_info_about_radiation_monitoring()
+            first = parser.refresh()
+            second = parser.refresh()
 
         # Assert
-        assert isinstance(result, str)
-        assert result.startswith("По состоянию")
-        assert result.endswith("АЭС.")
-        assert "на текущую дату радиационная" in result
-        mocked.assert_called_once()
+        assert first is second
+        assert first.status.startswith("По состоянию")
+        build.assert_called_once()
+        extract.assert_called_once()
 
-    @pytest.mark.parametrize("region", list(Region), ids=assign_id)
-    def test_get_info_about_region(
+    def test_parse_feed_pairs_title_with_own_dose(
         self,
-        region: Region,
-        get_markup_from_file: Callable[[Path], BeautifulSoup],
-        assert_correct_region_info: "RegionInfoAssertion",
+        get_text_from_file: Callable[[Path], str],
+    ) -> None:
+        # Arrange
+        markup = get_text_from_file(self.xml).replace(
+            "<rad>0.11</rad>      </item>", "</item>", 1
+        )
+
+        # Act
+        records, timestamp = Parser._parse_feed(markup)
+
+        # Assert
+        assert ("Гомель", 0.11) not in records
+        assert records[0] == ("Брагин", 0.47)
+        assert len(records) == markup.count("<item>") - 1
+        assert timestamp == datetime(
+            2023, 4, 30, 20, 2, 56, tzinfo=timezone(timedelta(hours=3))
+        )
+
+    def test_snapshot_regions_follow_index(self) -> None:
+        # Arrange
+        records = [(point.label, 0.1) for point in reversed(Point)]
+
+        # Act
+        snapshot = RadiationSnapshot.create(records + [("Unknown", 0.2)])
+
+        # Assert
+        assert set(POINTS_BY_LABEL) == {point.label for point in Point}
+        for region in Region:
+            assert tuple(snapshot.regions[region]) == LABELS_BY_REGION[region]
+            assert all(
+                POINTS_BY_LABEL[label].region == region
+                for label in snapshot.get_region_info(region).info
+            )
+
+    def test_refresh_keeps_previous_snapshot_on_failure(
+        self,
+        get_text_from_file: Callable[[Path], str],
     ) -> None:
         # Act
-        with mock.patch(self.method) as mocked:
-            mocked.return_value = get_markup_from_file(self.xml)
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+        ) as mocked:
+            mocked["get_xml"].return_value = get_text_from_file(self.xml)
+            mocked["get_html"].return_value = get_text_from_file(self.html)
             parser = Parser()
-            result = parser.get_region_info(region)
+            snapshot = parser.refresh()
+            mocked["get_xml"].return_value = None
+            mocked["get_html"].return_value = None
+            result = parser.refresh()
 
         # Assert
-        assert_correct_region_info(result, region)
-        mocked.assert_called_once()
+        assert snapshot
+        assert result is snapshot
+        assert parser.get_snapshot() is snapshot
+        assert snapshot.status and snapshot.status.startswith("По состоянию")
+
+    def test_get_snapshot_without_source(self) -> None:
+        # Act
+        with mock.patch.multiple(
+            self.api,
+            get_xml=mock.DEFAULT,
+            get_html=mock.DEFAULT,
+        ) as mocked:
+            mocked["get_xml"].return_value = None
+            mocked["get_html"].return_value = None
+            parser = Parser()
+            with pytest.raises(AssertionError) as exc_info:
+                parser.get_snapshot()
+            result = parser.refresh()
+
+        # Assert
+        assert exc_info
+        assert result is None
@@ -2,12 +2,13 @@ import enum
 from datetime import date, datetime
 from pathlib import Path
 from typing import Sequence
+from unittest import mock
 from urllib.parse import ParseResult, urlparse
 
 import pytest
-from mtranslate import translate
 
 from dosimeter.config import Settings
+from dosimeter.config.localization import format_date
 
 
 class Service(str, enum.Enum):
@@ -19,6 +20,7 @@ class Service(str, enum.Enum):
     ENC = "enc"
     DB = "db"
     REPO = "repo"
+    SQLITE = "sqlite"
     ANALYTICS = "analytics"
     HEROKU = "heroku"
 
@@ -34,14 +36,18 @@ schema_settings = {
     Service.APP: {
         "admin_tgm_id": None,
         "debug": None,
+        "grid_resolution": None,
         "locale": None,
         "main_admin_tgm_id": None,
         "name": None,
+        "refresh_interval": None,
         "source": None,
         "timezone": None,
         "token": None,
     },
     Service.DB: {
+        "bulk_interval": None,
+        "bulk_size": None,
         "host": None,
         "name": None,
         "password": None,
@@ -51,8 +57,15 @@ schema_settings = {
     Service.REPO: {
         "stem": None,
         "suffix": None,
+        "journal_suffix": None,
+        "compact_every": None,
         "encoding": None,
     },
+    Service.SQLITE: {
+        "stem": None,
+        "suffix": None,
+        "timeout": None,
+    },
     Service.ENC: {
         "isAsymmetric": None,
         "key": {
@@ -89,6 +102,7 @@ class TestSettings(object):
             [Service.ENC, schema_settings.get(Service.ENC).keys()],
             [Service.DB, schema_settings.get(Service.DB).keys()],
             [Service.REPO, schema_settings.get(Service.REPO).keys()],
+            [Service.SQLITE, schema_settings.get(Service.SQLITE).keys()],
             [Service.ANALYTICS, schema_settings.get(Service.ANALYTICS).keys()],
             [Service.HEROKU, schema_settings.get(Service.HEROKU).keys()],
         ),
@@ -99,7 +113,6 @@ class TestSettings(object):
         for key in keys:
             assert key in self.config.dict().get(service).keys()
 
-    @pytest.mark.slow()
     @pytest.mark.freeze_time("2023-05-21")
     def test_freeze_date_today_for_settings(
         self,
@@ -108,15 +121,38 @@ class TestSettings(object):
         assert isinstance(self.config.app.today, str)
         assert self.config.app.today == "21 мая 2023 г."
 
-    @pytest.mark.slow()
+    @pytest.mark.freeze_time("2023-12-31 22:30:00")
+    def test_date_today_in_configured_timezone(self) -> None:
+        # Assert
+        assert self.config.app.timezone == "Europe/Minsk"
+        assert self.config.app.today == "1 января 2024 г."
+
+    @pytest.mark.parametrize(
+        "locale,expected",
+        [
+            ("ru", "1 февраля 2023 г."),
+            ("be", "1 лютага 2023 г."),
+            ("uk", "1 лютого 2023 р."),
+            ("en", "February 1, 2023"),
+            ("fr", "February 1, 2023"),
+        ],
+        ids=["ru", "be", "uk", "en", "fallback"],
+    )
+    def test_format_date(self, locale: str, expected: str) -> None:
+        # Act
+        result = format_date(date(2023, 2, 1), locale)
+
+        # Assert
+        assert result == expected
+
     def test_date_today_for_settings(self) -> None:
         # Act
-        date_string = translate(self.config.app.today, "en")
-        date_object = datetime.strptime(date_string, "%B %d, %Y")
+        with mock.patch("dosimeter.config.datetime") as mocked:
+            mocked.now.return_value = datetime(2023, 3, 8)
+            result = self.config.app.today
 
         # Assert
-        assert isinstance(date_object, datetime)
-        assert date_object.date() == date.today()
+        assert result == format_date(date(2023, 3, 8), self.config.app.locale)
 
     def test_heroku_webhook_uri_settings(self) -> None:
         # Act
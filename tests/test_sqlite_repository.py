@@ -0,0 +1,208 @@
+import random
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+from telegram import User
+
+from dosimeter.config import config
+from dosimeter.constants import Action
+from dosimeter.storage import SQLiteRepository
+
+if TYPE_CHECKING:
+    from plugins.storage import ListTelegramUsers
+
+
+@pytest.fixture()
+def sqlite_repo(tmp_path: Path) -> Iterator[SQLiteRepository]:
+    repo = SQLiteRepository(path_to_file=tmp_path / config.sqlite.name)
+    yield repo
+    repo.close()
+
+
+@pytest.mark.sqlite_repo()
+class TestSQLiteRepository(object):
+    """
+    A class for testing logic encapsulated in the SQLiteRepository class.
+    """
+
+    def test_create_sqlite_repo(self, sqlite_repo: SQLiteRepository) -> None:
+        # Act
+        journal_mode = sqlite_repo.connection.execute("PRAGMA journal_mode").fetchone()
+        tables = {
+            row["name"]
+            for row in sqlite_repo.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+
+        # Assert
+        assert str(sqlite_repo) == f"SQLite repository by path: {sqlite_repo.path}"
+        assert sqlite_repo.path.is_file()
+        assert journal_mode[0] == "wal"
+        assert tables == {"users", "events"}
+
+    @pytest.mark.parametrize("action", list(Action))
+    def test_put_user(
+        self,
+        sqlite_repo: SQLiteRepository,
+        tgm_user: User,
+        action: Action,
+    ) -> None:
+        # Act
+        sqlite_repo.put(tgm_user, action)
+
+        # Assert
+        user_obj = sqlite_repo.get(tgm_user.id)
+        create_at = datetime.strptime(user_obj["create_at"], config.app.date_format)
+
+        assert sqlite_repo.get_count() == 1
+        assert len(user_obj[action]) == 1
+        assert user_obj["user_id"] == tgm_user.id
+        assert user_obj["first_name"] != tgm_user.first_name
+        assert not user_obj["last_name"]
+        assert user_obj["user_name"] != tgm_user.username
+        assert create_at.date() == date.today()
+
+    def test_update_user(
+        self,
+        sqlite_repo: SQLiteRepository,
+        tgm_user: User,
+    ) -> None:
+        # Act
+        sqlite_repo.put(tgm_user, Action.HELP)
+        sqlite_repo.put(tgm_user, Action.DONATE)
+        sqlite_repo.put(tgm_user, Action.HELP)
+
+        # Assert
+        user_obj = sqlite_repo.get(str(tgm_user.id))
+
+        assert sqlite_repo.get_count() == 1
+        assert Action.START not in user_obj.keys()
+        assert len(user_obj[Action.HELP]) == 2
+        assert len(user_obj[Action.DONATE]) == 1
+
+    @pytest.mark.parametrize("count", [2, 5, 9, 11])
+    def test_get_counts(
+        self,
+        sqlite_repo: SQLiteRepository,
+        count: int,
+        list_tgm_users_factory: "ListTelegramUsers",
+    ) -> None:
+        # Arrange
+        list_tgm_users = list_tgm_users_factory(count)
+        for user in list_tgm_users:
+            sqlite_repo.put(user, Action.START)
+        sqlite_repo.put(list_tgm_users[0], Action.START)
+
+        # Act
+        users_count = sqlite_repo.get_count()
+        actions_count = sqlite_repo.get_action_count(Action.START)
+        user_actions_count = sqlite_repo.get_action_count(
+            Action.START, list_tgm_users[0].id
+        )
+
+        # Assert
+        assert users_count == count
+        assert actions_count == count + 1
+        assert user_actions_count == 2
+        assert sqlite_repo.get_action_count(Action.HELP) == 0
+
+    def test_reopen_sqlite_repo(
+        self,
+        sqlite_repo: SQLiteRepository,
+        tgm_user: User,
+    ) -> None:
+        # Arrange
+        sqlite_repo.put(tgm_user, Action.LOCATION)
+
+        # Act
+        db_replica = SQLiteRepository(path_to_file=sqlite_repo.path)
+        result = db_replica.get(tgm_user.id)
+        db_replica.close()
+
+        # Assert
+        assert result == sqlite_repo.get(tgm_user.id)
+
+    @pytest.mark.parametrize(
+        "query,params,index",
+        [
+            ("SELECT 1 FROM users WHERE user_id = ?", (1,), "INTEGER PRIMARY KEY"),
+            (
+                "SELECT action, ts FROM events WHERE user_id = ? ORDER BY action, ts",
+                (1,),
+                "COVERING INDEX events_user_id_action_ts",
+            ),
+            (
+                "SELECT COUNT(*) FROM events WHERE user_id = ? AND action = ?",
+                (1, Action.START.value),
+                "COVERING INDEX events_user_id_action_ts",
+            ),
+            (
+                "SELECT COUNT(*) FROM events WHERE action = ?",
+                (Action.START.value,),
+                "COVERING INDEX events_action_ts",
+            ),
+        ],
+        ids=["user", "events", "user_actions_count", "actions_count"],
+    )
+    def test_indexed_queries(
+        self,
+        sqlite_repo: SQLiteRepository,
+        query: str,
+        params: tuple,
+        index: str,
+    ) -> None:
+        # Act
+        plan = " ".join(
+            row["detail"]
+            for row in sqlite_repo.connection.execute(
+                f"EXPLAIN QUERY PLAN {query}", params
+            )
+        )
+
+        # Assert
+        assert index in plan
+        assert "SCAN" not in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.parametrize("idf", [00000, 10_000_001])
+    def test_get_non_exist_user(
+        self,
+        sqlite_repo: SQLiteRepository,
+        tgm_user: User,
+        idf: int,
+    ) -> None:
+        # Arrange
+        sqlite_repo.put(tgm_user, Action.LOCATION)
+
+        # Act
+        result = sqlite_repo.get(idf)
+
+        # Assert
+        assert result == "User does not exist."
+
+    @pytest.mark.parametrize(
+        "idf,message",
+        [
+            ("87j24", "The string must consist of digits."),
+            (
+                random.randint(-10_000_000, -1),
+                "ID must be an integer, a positive number.",
+            ),
+            (None, "ID must be an integer, a positive number."),
+        ],
+    )
+    def test_get_user_by_wrong_id(
+        self,
+        sqlite_repo: SQLiteRepository,
+        idf: int | str | None,
+        message: str,
+    ) -> None:
+        # Act
+        with pytest.raises(ValueError) as exc_info:
+            sqlite_repo.get(idf)
+
+        # Assert
+        assert str(exc_info.value) == message
@@ -0,0 +1,66 @@
+import statistics
+
+import numpy as np
+import pytest
+
+from dosimeter.constants import Region
+from dosimeter.parser import RadiationStats
+from dosimeter.parser.stats import PERCENTILES
+
+
+@pytest.mark.parsing()
+class TestRadiationStats(object):
+    """
+    A class for testing logic encapsulated in the RadiationStats class.
+    """
+
+    readings = {
+        Region.BREST: {"Брест": 0.11, "Пинск": 0.12, "Ганцевичи": 0.1},
+        Region.GOMEL: {"Гомель": 0.11, "Брагин": 0.47},
+        Region.MINSK: {"Минск": 0.13},
+        Region.VITEBSK: {},
+    }
+
+    def test_compute_region_stats(self) -> None:
+        # Act
+        result = RadiationStats.compute(self.readings)
+
+        # Assert
+        assert Region.VITEBSK not in result.regions
+        for region, info in self.readings.items():
+            if not info:
+                continue
+            values = list(info.values())
+            stats = result.regions[region]
+            assert stats.count == len(values)
+            assert stats.mean == pytest.approx(statistics.mean(values))
+            assert stats.median == pytest.approx(statistics.median(values))
+            assert stats.min == min(values)
+            assert stats.max == max(values)
+            assert stats.std == pytest.approx(statistics.pstdev(values))
+            assert stats.percentiles == pytest.approx(
+                {q: np.percentile(values, q) for q in PERCENTILES}
+            )
+
+    def test_compute_national_total(self) -> None:
+        # Arrange
+        values = [value for info in self.readings.values() for value in info.values()]
+
+        # Act
+        result = RadiationStats.compute(self.readings)
+        with_total = RadiationStats.compute(self.readings, total=[*values, 0.2])
+
+        # Assert
+        assert result.total.count == len(values)
+        assert result.total.mean == pytest.approx(statistics.mean(values))
+        assert result.total.median == pytest.approx(statistics.median(values))
+        assert with_total.total.count == len(values) + 1
+        assert with_total.total.max == 0.47
+
+    def test_compute_without_readings(self) -> None:
+        # Act
+        with pytest.raises(AssertionError) as exc_info:
+            RadiationStats.compute({Region.BREST: {}})
+
+        # Assert
+        assert str(exc_info.value) == "Unable to compute statistics without readings."